@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for graph elements: builds an ASRGoTGraph of evidence-like
+nodes (chained by supportive edges) and reports traced bytes per node for the
+Node/Edge models themselves and for the graph's indexes on top of them.
+
+Usage (from the repository root):
+    python scripts/benchmark_node_memory.py [node_count]   # default 100000
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from loguru import logger
+
+from src.asr_got_reimagined.domain.models.common import (
+    ConfidenceVector,
+    EpistemicStatus,
+)
+from src.asr_got_reimagined.domain.models.graph_elements import (
+    Edge,
+    EdgeMetadata,
+    EdgeType,
+    Node,
+    NodeMetadata,
+    NodeType,
+    StatisticalPower,
+)
+from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
+
+
+def make_evidence_node(i: int) -> Node:
+    """Shaped like the evidence nodes created by EvidenceStage."""
+    return Node(
+        id=f"ev_hypo_{i}",
+        label=f"Evidence {i} for hypothesis",
+        type=NodeType.EVIDENCE,
+        confidence=ConfidenceVector.from_list([0.6, 0.5, 0.7, 0.4]),
+        metadata=NodeMetadata(
+            description=f"Evidence piece {i} supporting the hypothesis (Strength: 0.71)",
+            source_description="Simulated literature_review execution",
+            epistemic_status=EpistemicStatus.EVIDENCE_SUPPORTED,
+            disciplinary_tags={"general_science", "interdisciplinary_studies"},
+            layer_id="evidence_layer",
+            impact_score=0.4,
+            statistical_power=StatisticalPower(
+                value=0.7, method_description="Simulated statistical power."
+            ),
+        ),
+    )
+
+
+def make_edge(i: int, node_count: int) -> Edge:
+    return Edge(
+        id=f"edge_ev_{i}",
+        source_id=f"ev_hypo_{i}",
+        target_id=f"ev_hypo_{(i + 1) % node_count}",
+        type=EdgeType.SUPPORTIVE,
+        confidence=0.7,
+        metadata=EdgeMetadata(description="Evidence supports hypothesis"),
+    )
+
+
+def main() -> None:
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    logger.remove()  # Keep per-node debug logging out of the measurement
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    nodes = [make_evidence_node(i) for i in range(node_count)]
+    node_seconds = time.perf_counter() - start
+    after_nodes, _ = tracemalloc.get_traced_memory()
+
+    edges = [make_edge(i, node_count) for i in range(node_count)]
+    after_edges, _ = tracemalloc.get_traced_memory()
+
+    graph = ASRGoTGraph()
+    start = time.perf_counter()
+    graph.add_nodes_bulk(nodes)
+    graph.add_edges_bulk(edges)
+    insert_seconds = time.perf_counter() - start
+    after_graph, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Nodes: {node_count:,} (+ {node_count:,} edges)")
+    print(f"  Node models:        {after_nodes / node_count:8.0f} B/node")
+    print(f"  Edge models:        {(after_edges - after_nodes) / node_count:8.0f} B/edge")
+    print(f"  Graph + indexes:    {(after_graph - after_edges) / node_count:8.0f} B/node")
+    print(f"  Total:              {after_graph / node_count:8.0f} B/node")
+    print(f"  Peak traced:        {peak / 2**20:8.1f} MiB")
+    print(f"  Node construction:  {node_seconds / node_count * 1e6:8.1f} us/node (traced)")
+    print(f"  Bulk insertion:     {insert_seconds / node_count * 1e6:8.1f} us/node (traced)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Builds the graph parts of asr_got.query and asr_got.get_graph results.
+
+build_graph_state_schema honors max_nodes_in_response_graph (top-k nodes by
+impact, then average confidence, picked with a heap; only edges and hyperedges
+induced among them are kept) and output_detail_level ("summary" drops heavy
+metadata). build_graph_delta_schema returns only what changed after a given
+version of the same graph, read from the graph's change journal. Schema objects are
+constructed directly from the graph's cached element dumps, without a second
+round of validation.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Set
+
+from src.asr_got_reimagined.api.schemas import (
+    GraphDeltaSchema,
+    GraphEdgeSchema,
+    GraphHyperedgeSchema,
+    GraphNodeSchema,
+    GraphStateSchema,
+)
+from src.asr_got_reimagined.domain.models.graph_elements import Edge, Hyperedge, Node
+from src.asr_got_reimagined.domain.models.graph_journal import ElementKind
+from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
+
+SUMMARY_DETAIL_LEVEL = "summary"
+
+# Metadata fields left out at the "summary" detail level
+_SUMMARY_EXCLUDED_METADATA = frozenset(
+    {
+        "revision_history",
+        "attribution",
+        "bias_flags",
+        "falsification_criteria",
+        "plan",
+        "query_context",
+        "information_metrics",
+    }
+)
+
+
+def select_top_node_ids(graph: ASRGoTGraph, max_nodes: Optional[int]) -> List[str]:
+    """
+    IDs of the `max_nodes` highest-ranked nodes (all nodes if None), ranked by
+    impact score, then average confidence; ties keep insertion order.
+    """
+    if max_nodes is None or max_nodes >= len(graph.nodes):
+        return list(graph.nodes)
+    scores = graph.node_scores()
+    impact = scores.impact.tolist()
+    average_confidence = scores.average_confidence.tolist()
+    top_rows = heapq.nlargest(
+        max_nodes, range(len(impact)), key=lambda i: (impact[i], average_confidence[i])
+    )
+    return [scores.node_ids[i] for i in top_rows]
+
+
+def build_graph_state_schema(
+    graph: ASRGoTGraph,
+    max_nodes: Optional[int] = None,
+    detail_level: Optional[str] = SUMMARY_DETAIL_LEVEL,
+) -> GraphStateSchema:
+    summary = detail_level == SUMMARY_DETAIL_LEVEL
+    node_ids = select_top_node_ids(graph, max_nodes)
+    selected: Set[str] = set(node_ids)
+
+    nodes = []
+    edges = []
+    hyperedge_ids: Dict[str, None] = {}
+    for node_id in node_ids:
+        nodes.append(_node_schema(graph.nodes[node_id], summary))
+        for edge in graph.out_edges(node_id):
+            if edge.target_id in selected:
+                edges.append(_edge_schema(edge, summary))
+        for hyperedge in graph.hyperedges_of(node_id):
+            if hyperedge.node_ids <= selected:
+                hyperedge_ids[hyperedge.id] = None
+    hyperedges = [
+        _hyperedge_schema(graph.hyperedges[hyperedge_id], summary)
+        for hyperedge_id in hyperedge_ids
+    ]
+
+    layers = {
+        layer_id: [node_id for node_id in layer_node_ids if node_id in selected]
+        for layer_id, layer_node_ids in graph.layers.items()
+    }
+    stats = graph.get_statistics()
+    metadata: Dict[str, Any] = {
+        **graph.graph_metadata,
+        "graph_id": graph.id,
+        "version": graph.version,
+        "total_node_count": stats.node_count,
+        "total_edge_count": stats.edge_count,
+        "returned_node_count": len(nodes),
+        "truncated": len(nodes) < stats.node_count,
+        "detail_level": SUMMARY_DETAIL_LEVEL if summary else "detailed",
+    }
+    return GraphStateSchema.model_construct(
+        nodes=nodes,
+        edges=edges,
+        hyperedges=hyperedges,
+        layers=layers,
+        metadata=metadata,
+    )
+
+
+def build_graph_delta_schema(
+    graph: ASRGoTGraph,
+    since_version: int,
+    detail_level: Optional[str] = SUMMARY_DETAIL_LEVEL,
+    since_graph_id: Optional[str] = None,
+) -> Optional[GraphDeltaSchema]:
+    """
+    Changes to the full graph after `since_version`, or None when the journal
+    no longer reaches back that far or the version is unknown to this graph
+    (the caller then sends the full state). Versions count per graph, so a
+    `since_graph_id` other than this graph's ID also gets None.
+    Each changed element appears once, in its current state, however often it
+    changed; elements that no longer exist are listed as removed.
+    """
+    if since_graph_id is not None and since_graph_id != graph.id:
+        return None  # A version of some other graph
+    if since_version > graph.version:
+        return None  # Likewise
+    changes = graph.changes_since(since_version)
+    if changes is None:
+        return None
+    summary = detail_level == SUMMARY_DETAIL_LEVEL
+    changed: Dict[ElementKind, Dict[str, None]] = {kind: {} for kind in ElementKind}
+    for change in changes:
+        changed[change.kind][change.element_id] = None
+
+    delta = GraphDeltaSchema.model_construct(
+        graph_id=graph.id,
+        since_version=since_version,
+        version=graph.version,
+        nodes=[],
+        edges=[],
+        hyperedges=[],
+        layers={},
+        removed_node_ids=[],
+        removed_edge_ids=[],
+        removed_hyperedge_ids=[],
+        removed_layer_ids=[],
+    )
+    layer_ids: Dict[str, None] = dict(changed[ElementKind.LAYER])
+    for node_id in changed[ElementKind.NODE]:
+        node = graph.nodes.get(node_id)
+        if node is None:
+            delta.removed_node_ids.append(node_id)
+            continue
+        delta.nodes.append(_node_schema(node, summary))
+        if node.metadata.layer_id:
+            layer_ids[node.metadata.layer_id] = None
+    for edge_id in changed[ElementKind.EDGE]:
+        edge = graph.edges.get(edge_id)
+        if edge is None:
+            delta.removed_edge_ids.append(edge_id)
+        else:
+            delta.edges.append(_edge_schema(edge, summary))
+    for hyperedge_id in changed[ElementKind.HYPEREDGE]:
+        hyperedge = graph.hyperedges.get(hyperedge_id)
+        if hyperedge is None:
+            delta.removed_hyperedge_ids.append(hyperedge_id)
+        else:
+            delta.hyperedges.append(_hyperedge_schema(hyperedge, summary))
+    for layer_id in layer_ids:
+        layer_node_ids = graph.layers.get(layer_id)
+        if layer_node_ids is None:
+            delta.removed_layer_ids.append(layer_id)
+        else:
+            delta.layers[layer_id] = list(layer_node_ids)
+    return delta
+
+
+def _node_schema(node: Node, summary: bool) -> GraphNodeSchema:
+    dumped = node.cached_dump()
+    return GraphNodeSchema.model_construct(
+        node_id=node.id,
+        label=node.label,
+        type=node.type.value,
+        confidence=dumped["confidence"],
+        metadata=_response_metadata(dumped["metadata"], summary),
+    )
+
+
+def _edge_schema(edge: Edge, summary: bool) -> GraphEdgeSchema:
+    return GraphEdgeSchema.model_construct(
+        edge_id=edge.id,
+        source=edge.source_id,
+        target=edge.target_id,
+        edge_type=edge.type.value,
+        confidence=edge.confidence,
+        metadata=_response_metadata(edge.cached_dump().get("metadata", {}), summary),
+    )
+
+
+def _hyperedge_schema(hyperedge: Hyperedge, summary: bool) -> GraphHyperedgeSchema:
+    return GraphHyperedgeSchema.model_construct(
+        edge_id=hyperedge.id,
+        nodes=sorted(hyperedge.node_ids),
+        confidence=hyperedge.confidence_vector.average_confidence,
+        metadata=_response_metadata(hyperedge.cached_dump()["metadata"], summary),
+    )
+
+
+def _response_metadata(metadata: Dict[str, Any], summary: bool) -> Dict[str, Any]:
+    # Always a new dict: the dumped metadata is the element's cached copy
+    if summary:
+        return {
+            key: value
+            for key, value in metadata.items()
+            if key not in _SUMMARY_EXCLUDED_METADATA
+        }
+    return dict(metadata)
@@ -1,23 +1,32 @@
 import time
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, Optional, Union
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import ValidationError
 
+from src.asr_got_reimagined.api.graph_response import (
+    build_graph_delta_schema,
+    build_graph_state_schema,
+)
 from src.asr_got_reimagined.api.schemas import (
+    GraphDeltaSchema,
     GraphStateSchema,
     JSONRPCErrorObject,
     JSONRPCRequest,
     JSONRPCResponse,
     MCPASRGoTQueryParams,
     MCPASRGoTQueryResult,
+    MCPGraphFetchParams,
+    MCPGraphFetchResult,
     MCPInitializeParams,
     MCPInitializeResult,
     ShutdownParams,
 )
 from src.asr_got_reimagined.simple_config import settings
 from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
+from src.asr_got_reimagined.domain.services.admission import QueryRejected
 from src.asr_got_reimagined.domain.services.got_processor import (
     GoTProcessor,
     GoTProcessorSessionData,
@@ -63,7 +72,7 @@ async def handle_asr_got_query(
     request_obj: Request,
     params: MCPASRGoTQueryParams,
     request_id: Optional[Union[str, int]],
-) -> JSONRPCResponse[MCPASRGoTQueryResult, Any]:
+) -> Union[JSONRPCResponse[MCPASRGoTQueryResult, Any], StreamingResponse]:
     logger.info(
         "MCP asr_got.query request received for query: '{}'",
         params.query[:100] + "..." if params.query else "N/A",
@@ -96,22 +105,51 @@ async def handle_asr_got_query(
             initial_context=context_dict,
         )
 
+        stream_graph_state = bool(
+            params.parameters
+            and params.parameters.include_graph_state
+            and params.parameters.stream_graph_state
+            and isinstance(session_data_result.graph_state, ASRGoTGraph)
+        )
+
         response_graph_state: Optional[GraphStateSchema] = None
-        if params.parameters and params.parameters.include_graph_state:
+        response_graph_delta: Optional[GraphDeltaSchema] = None
+        graph_id = graph_version = None
+        if isinstance(session_data_result.graph_state, ASRGoTGraph):
+            graph_id = session_data_result.graph_state.id
+            graph_version = session_data_result.graph_state.version
+        if (
+            params.parameters
+            and params.parameters.include_graph_state
+            and not stream_graph_state
+        ):
             if (
-                hasattr(session_data_result, "graph_state")
+                params.parameters.since_version is not None
+                and isinstance(session_data_result.graph_state, ASRGoTGraph)
+            ):
+                response_graph_delta = build_graph_delta_schema(
+                    session_data_result.graph_state,
+                    params.parameters.since_version,
+                    detail_level=params.parameters.output_detail_level,
+                    since_graph_id=params.parameters.since_graph_id,
+                )
+            # With a delta the client already has the rest of the graph
+            if (
+                response_graph_delta is None
+                and hasattr(session_data_result, "graph_state")
                 and session_data_result.graph_state
             ):
                 if isinstance(session_data_result.graph_state, GraphStateSchema):
                     response_graph_state = session_data_result.graph_state
-                elif isinstance(
-                    session_data_result.graph_state, ASRGoTGraph
-                ) and hasattr(session_data_result.graph_state, "to_serializable_dict"):
+                elif isinstance(session_data_result.graph_state, ASRGoTGraph):
                     try:
-                        serializable_dict = (
-                            session_data_result.graph_state.to_serializable_dict()
+                        # Top-k nodes and their induced edges, built straight
+                        # into schema objects (no intermediate dict validation)
+                        response_graph_state = build_graph_state_schema(
+                            session_data_result.graph_state,
+                            max_nodes=params.parameters.max_nodes_in_response_graph,
+                            detail_level=params.parameters.output_detail_level,
                         )
-                        response_graph_state = GraphStateSchema(**serializable_dict)
                     except Exception as e_conv:
                         logger.error(
                             f"Failed to convert ASRGoTGraph to GraphStateSchema for session {session_data_result.session_id}: {e_conv}"
@@ -130,7 +168,11 @@ async def handle_asr_got_query(
                         f"Graph state in session data for session {session_data_result.session_id} is not of a recognized type for conversion."
                     )
 
-            if not response_graph_state and params.parameters.include_graph_state:
+            if (
+                not response_graph_state
+                and not response_graph_delta
+                and params.parameters.include_graph_state
+            ):
                 logger.warning(
                     f"Graph state was requested but could not be retrieved or converted for session {session_data_result.session_id}."
                 )
@@ -143,6 +185,7 @@ async def handle_asr_got_query(
                 try:
                     trace_lines = [
                         f"Stage {s.get('stage_number', 'N/A')}. {s.get('stage_name', 'Unknown Stage')}: {s.get('summary', 'N/A')} ({s.get('duration_ms', 0)}ms)"
+                        + (f" [degraded: {s['degraded']}]" if s.get("degraded") else "")
                         for s in session_data_result.stage_outputs_trace
                     ]
                     reasoning_trace_text = "\n".join(trace_lines)
@@ -174,16 +217,41 @@ async def handle_asr_got_query(
             or "Processing complete, but no explicit answer generated.",
             reasoning_trace_summary=reasoning_trace_text,
             graph_state_full=response_graph_state,
+            graph_state_delta=response_graph_delta,
+            graph_id=graph_id,
+            graph_version=graph_version,
             confidence_vector=session_data_result.final_confidence_vector,
             execution_time_ms=execution_time_ms,
             session_id=session_data_result.session_id,
+            degraded_stages=session_data_result.degraded_stages,
         )
         logger.info(
             "MCP asr_got.query processed successfully. Answer generated for ID: {}",
             request_id,
         )
+        if stream_graph_state:
+            return StreamingResponse(
+                _iter_streamed_query_result(
+                    JSONRPCResponse(id=request_id, result=query_result),
+                    session_data_result.graph_state,
+                ),
+                media_type="application/x-ndjson",
+            )
         return JSONRPCResponse(id=request_id, result=query_result)
 
+    except QueryRejected as qr:
+        # Saturated: reject fast so the client can retry elsewhere or later
+        return create_jsonrpc_error(
+            request_id=request_id,
+            code=-32005,
+            message="Server overloaded: query not admitted.",
+            data={
+                "reason": qr.reason,
+                "retry_after_ms": qr.retry_after_ms,
+                "admission": qr.stats,
+                "method": "asr_got.query",
+            },
+        )
     except AttributeError as ae:
         logger.exception(
             f"AttributeError during asr_got.query processing for ID {request_id}: {ae}. This might indicate a mismatch in method names (e.g. process_query parameters) or data structures."
@@ -220,6 +288,73 @@ async def handle_asr_got_query(
         )
 
 
+def _iter_streamed_query_result(
+    response: JSONRPCResponse[MCPASRGoTQueryResult, Any], graph: ASRGoTGraph
+) -> Iterator[str]:
+    """
+    NDJSON body for streamed asr_got.query results: the JSON-RPC response first
+    (graph_state_full left empty), then the graph records from iter_ndjson().
+    A sync generator, so StreamingResponse runs it off the event loop.
+    """
+    yield response.model_dump_json() + "\n"
+    yield from graph.iter_ndjson()
+
+
+async def handle_get_graph(
+    request_obj: Request,
+    params: MCPGraphFetchParams,
+    request_id: Optional[Union[str, int]],
+) -> JSONRPCResponse[MCPGraphFetchResult, Any]:
+    """
+    Returns a session's current graph without running a query: the changes
+    since `since_version` when the graph's journal still covers it, otherwise
+    the (top-k truncated) full state.
+    """
+    logger.info("MCP asr_got.get_graph request received for session: {}", params.session_id)
+    processor: GoTProcessor = request_obj.app.state.got_processor
+    if not processor:
+        logger.error("GoTProcessor not found in app state! Cannot fetch graph.")
+        return create_jsonrpc_error(
+            request_id=request_id,
+            code=-32002,
+            message="NexusMind Core Processor is not available.",
+        )
+
+    graph = processor.session_store.get_graph(params.session_id)
+    if graph is None:
+        return create_jsonrpc_error(
+            request_id=request_id,
+            code=-32004,
+            message=f"Session '{params.session_id}' not found.",
+        )
+
+    delta = None
+    if params.since_version is not None:
+        delta = build_graph_delta_schema(
+            graph,
+            params.since_version,
+            detail_level=params.output_detail_level,
+            since_graph_id=params.since_graph_id,
+        )
+    full_state = None
+    if delta is None:
+        full_state = build_graph_state_schema(
+            graph,
+            max_nodes=params.max_nodes_in_response_graph,
+            detail_level=params.output_detail_level,
+        )
+    return JSONRPCResponse(
+        id=request_id,
+        result=MCPGraphFetchResult(
+            session_id=params.session_id,
+            graph_id=graph.id,
+            graph_version=graph.version,
+            graph_state_full=full_state,
+            graph_state_delta=delta,
+        ),
+    )
+
+
 async def handle_shutdown(
     params: Optional[ShutdownParams], request_id: Optional[Union[str, int]]
 ) -> JSONRPCResponse[None, Any]:
@@ -251,6 +386,10 @@ async def mcp_endpoint_handler(
             parsed_params = MCPASRGoTQueryParams(**params_data)
             return await handle_asr_got_query(http_request, parsed_params, req_id)
 
+        elif method == "asr_got.get_graph":
+            parsed_params = MCPGraphFetchParams(**params_data)
+            return await handle_get_graph(http_request, parsed_params, req_id)
+
         elif method == "shutdown":
             parsed_params = ShutdownParams(**params_data)
             return await handle_shutdown(params=parsed_params, request_id=req_id)
@@ -116,6 +116,18 @@ class MCPQueryOperationalParams(BaseModel):
     output_detail_level: Optional[str] = Field(
         default="summary", examples=["summary", "detailed"]
     )
+    # Stream the graph state as NDJSON after the JSON-RPC response line instead
+    # of embedding it in graph_state_full (flat memory for large graphs)
+    stream_graph_state: bool = Field(default=False)
+    # Graph version the client already has; the result then carries only the
+    # changes since (graph_state_delta) instead of graph_state_full
+    since_version: Optional[int] = Field(default=None, ge=0)
+    # graph_id of the result since_version was read from; the full state is
+    # sent when the session's graph is another one (e.g. a new session)
+    since_graph_id: Optional[str] = Field(default=None)
+    # Time budget for processing the query; stages past their share of it cut
+    # their work short (reported in degraded_stages)
+    max_latency_ms: Optional[int] = Field(default=None, gt=0)
 
 
 class MCPASRGoTQueryParams(BaseModel):
@@ -162,15 +174,62 @@ class GraphStateSchema(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class GraphDeltaSchema(BaseModel):
+    """Changes to the full graph between since_version and version."""
+
+    graph_id: str
+    since_version: int
+    version: int
+    # Elements added or changed since since_version, in their current state
+    nodes: List[GraphNodeSchema] = Field(default_factory=list)
+    edges: List[GraphEdgeSchema] = Field(default_factory=list)
+    hyperedges: List[GraphHyperedgeSchema] = Field(default_factory=list)
+    # Current membership of layers that were created or gained changed nodes
+    layers: Dict[str, List[str]] = Field(default_factory=dict)
+    removed_node_ids: List[str] = Field(default_factory=list)
+    removed_edge_ids: List[str] = Field(default_factory=list)
+    removed_hyperedge_ids: List[str] = Field(default_factory=list)
+    removed_layer_ids: List[str] = Field(default_factory=list)
+
+
 class MCPASRGoTQueryResult(BaseModel):
     answer: str
     reasoning_trace_summary: Optional[str] = Field(default=None)
     graph_state_full: Optional[GraphStateSchema] = Field(default=None)
+    # Set instead of graph_state_full when since_version was given and is still
+    # covered by the graph's change journal
+    graph_state_delta: Optional[GraphDeltaSchema] = Field(default=None)
+    # Version line of the session's graph: send both back as since_graph_id and
+    # since_version to get the next result as a delta
+    graph_id: Optional[str] = Field(default=None)
+    graph_version: Optional[int] = Field(default=None)
     confidence_vector: Optional[List[float]] = Field(
         default=None, examples=[0.7, 0.6, 0.8, 0.75]
     )
     execution_time_ms: Optional[int] = Field(default=None)
     session_id: Optional[str] = Field(default=None)
+    # Stage name -> how it cut its work short to meet max_latency_ms
+    degraded_stages: Dict[str, str] = Field(default_factory=dict)
+
+
+# Params for "asr_got.get_graph" method
+class MCPGraphFetchParams(BaseModel):
+    session_id: str
+    since_version: Optional[int] = Field(default=None, ge=0)
+    since_graph_id: Optional[str] = Field(default=None)
+    max_nodes_in_response_graph: Optional[int] = Field(default=None, ge=0)
+    output_detail_level: Optional[str] = Field(
+        default="summary", examples=["summary", "detailed"]
+    )
+
+
+# Result for "asr_got.get_graph" method
+class MCPGraphFetchResult(BaseModel):
+    session_id: str
+    graph_id: str
+    graph_version: int
+    graph_state_full: Optional[GraphStateSchema] = Field(default=None)
+    graph_state_delta: Optional[GraphDeltaSchema] = Field(default=None)
 
 
 # Example for a hypothetical "got/processQuery" method
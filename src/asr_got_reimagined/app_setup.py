@@ -9,6 +9,7 @@ if src_path not in sys.path:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from loguru import logger  # type: ignore
 
 from src.asr_got_reimagined.api.routes.mcp import mcp_router
@@ -87,6 +88,23 @@ def create_app() -> FastAPI:
         logger.debug("Health check endpoint was called.")  # type: ignore
         return {"status": "healthy", "version": settings.app.version}
 
+    # Readiness for load balancers: 503 while new queries would be rejected or
+    # would likely miss the queue-time SLO, with the queue figures either way
+    @app.get("/ready", tags=["Health"])
+    async def readiness_check():
+        processor = getattr(app.state, "got_processor", None)
+        if processor is None:  # Not created yet, or already shut down
+            return JSONResponse(status_code=503, content={"status": "starting"})
+        admission = processor.admission
+        load = admission.stats()
+        if admission.is_saturated():
+            return JSONResponse(
+                status_code=503,
+                content={"status": "saturated", "load": load},
+                headers={"Retry-After": str(max(1, (admission.retry_after_ms() + 999) // 1000))},
+            )
+        return {"status": "ready", "load": load}
+
     # Include routers
     app.include_router(mcp_router, prefix="/mcp", tags=["MCP"])
     logger.info("API routers included. MCP router mounted at /mcp.")
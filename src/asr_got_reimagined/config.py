@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field
@@ -50,8 +50,48 @@ class LayerDefinition(BaseModel):
     description: str
 
 
+class RevisionHistorySettings(BaseModel):
+    # What node revision histories keep inline: "all", "last_n", "none" or "sampled"
+    retention: Literal["all", "last_n", "none", "sampled"] = Field(default="all")
+    max_entries: int = Field(default=10)  # Bound for "last_n" and "sampled"
+    # JSON Lines file that receives every revision; None disables the audit log
+    audit_log_path: Optional[str] = None
+
+
+class StageExecutorSettings(BaseModel):
+    # Where offloaded stages run: "none" (on the event loop), "thread" or "process"
+    kind: Literal["none", "thread", "process"] = Field(default="none")
+    max_workers: Optional[int] = None  # None: the pool's own default
+    # Stages to offload, by stage name (besides those setting run_in_executor)
+    offload_stages: List[str] = Field(default_factory=list)
+    # Directory for the graph files handed to process workers; None: system temp dir
+    handoff_dir: Optional[str] = None
+
+
+class QueryAdmissionSettings(BaseModel):
+    # Queries run at once; None disables admission control
+    max_concurrent_queries: Optional[int] = None
+    # Queries that may wait for a slot; more are rejected at once
+    max_queued_queries: int = Field(default=0)
+    # Queue-time SLO: a query still waiting after this long is rejected
+    queue_timeout_ms: Optional[int] = None
+
+
 class ASRGoTConfig(BaseModel):
     default_parameters: ASRGoTDefaultParams = Field(default_factory=ASRGoTDefaultParams)
+    revision_history: RevisionHistorySettings = Field(
+        default_factory=RevisionHistorySettings
+    )
+    # Stage names (or "module:Class" paths) in execution order; empty means the
+    # standard eight stages (see domain/stages/registry.py)
+    pipeline: List[str] = Field(default_factory=list)
+    # Stamp graph records from the graph's logical clock, with one wall-clock
+    # read per stage, instead of datetime.now() on every change
+    logical_clock: bool = Field(default=False)
+    # Worker pool for CPU-heavy stages (see domain/services/stage_executor.py)
+    executor: StageExecutorSettings = Field(default_factory=StageExecutorSettings)
+    # Concurrency limit and bounded wait queue for queries (see services/admission.py)
+    admission: QueryAdmissionSettings = Field(default_factory=QueryAdmissionSettings)
     layers: Dict[str, LayerDefinition] = Field(default_factory=dict)
 
 
@@ -81,6 +121,13 @@ class KnowledgeDomain(BaseModel):
     description: Optional[str] = None
 
 
+# --- Models for the session store ---
+class SessionStoreSettings(BaseModel):
+    max_in_memory_sessions: int = Field(default=128)
+    # Directory for the SQLite/file-backed tier; None keeps sessions in memory only
+    persistence_dir: Optional[str] = None
+
+
 # --- Main Application Settings Model ---
 class AppSettings(BaseModel):
     name: str = Field(default="NexusMind")
@@ -95,6 +142,7 @@ class Settings(BaseSettings):
     app: AppSettings = Field(default_factory=AppSettings)
     asr_got: ASRGoTConfig = Field(default_factory=ASRGoTConfig)
     mcp_settings: MCPSettings = Field(default_factory=MCPSettings)
+    session_store: SessionStoreSettings = Field(default_factory=SessionStoreSettings)
     claude_api: Optional[ClaudeAPIConfig] = None  # Optional section
     knowledge_domains: List[KnowledgeDomain] = Field(default_factory=list)
     
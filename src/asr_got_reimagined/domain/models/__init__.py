@@ -4,6 +4,7 @@ from .common import (
     CertaintyScore,
     ConfidenceVector,
     ImpactScore,
+    LogicalClock,
     ProbabilityDistribution,
 )
 from .graph_elements import (
@@ -26,12 +27,26 @@ from .graph_elements import (
     StatisticalPower,
     TemporalMetadata,
 )
-from .graph_state import ASRGoTGraph, GraphStatistics
+from .graph_journal import ChangeAction, ElementKind, GraphChange
+from .graph_state import ASRGoTGraph, GraphStatistics, MergePolicy
+from .revision_log import (
+    RevisionAuditLog,
+    RevisionPolicy,
+    RevisionRetention,
+    confidence_delta,
+)
+from .graph_binary import (
+    GraphFormatError,
+    MappedGraphFile,
+    load_graph_binary,
+    save_graph_binary,
+)
 
 # Define what gets imported with 'from .models import *'
 __all__ = [
     # Common
-    "CertaintyScore", "ConfidenceVector", "ImpactScore", "ProbabilityDistribution",
+    "CertaintyScore", "ConfidenceVector", "ImpactScore", "LogicalClock",
+    "ProbabilityDistribution",
 
     # Graph elements
     "Attribution", "BiasFlag", "CausalMetadata", "Edge", "EdgeMetadata", "EdgeType",
@@ -40,7 +55,10 @@ __all__ = [
     "StatisticalPower", "TemporalMetadata",
 
     # Graph state
-    "ASRGoTGraph", "GraphStatistics",
+    "ASRGoTGraph", "GraphStatistics", "MergePolicy",
+    "ChangeAction", "ElementKind", "GraphChange",
+    "GraphFormatError", "MappedGraphFile", "load_graph_binary", "save_graph_binary",
+    "RevisionAuditLog", "RevisionPolicy", "RevisionRetention", "confidence_delta",
 
     # Graph state
     "ASRGoTGraph", "GraphStatistics"
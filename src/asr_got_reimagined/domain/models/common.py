@@ -1,6 +1,8 @@
 import datetime
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import Annotated, List
+from typing import Annotated, Any, Iterator, List, Optional
 
 from pydantic import BaseModel, BeforeValidator, Field, field_validator
 
@@ -63,13 +65,79 @@ CertaintyScore = Annotated[float, Field(ge=0.0, le=1.0)]
 ImpactScore = Annotated[float, Field(ge=0.0, le=1.0)]  # Assuming normalized impact
 
 
+class LogicalClock:
+    """
+    Opt-in replacement for wall-clock stamps on graph records.
+
+    Inside `with clock.batch():` TimestampedModel stops calling
+    datetime.datetime.now(): each new or touched record takes the clock's next
+    tick as its `logical_time`, and its created_at/updated_at become the batch's
+    base time, one datetime read when the batch began and shared by every record
+    stamped in it. Ticks order the changes within a batch.
+    """
+
+    __slots__ = ("ticks", "batch_time")
+
+    def __init__(self, start: int = 0):
+        self.ticks = start
+        self.batch_time = datetime.datetime.now()
+
+    def tick(self) -> int:
+        self.ticks += 1
+        return self.ticks
+
+    @contextmanager
+    def batch(self) -> Iterator["LogicalClock"]:
+        """Makes this the active clock, with a fresh base time, for the block."""
+        self.batch_time = datetime.datetime.now()
+        token = _ACTIVE_CLOCK.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_CLOCK.reset(token)
+
+
+_ACTIVE_CLOCK: ContextVar[Optional[LogicalClock]] = ContextVar(
+    "asr_got_logical_clock", default=None
+)
+
+
+def record_timestamp() -> datetime.datetime:
+    """Current time for a new record: the active batch's base time, if any."""
+    clock = _ACTIVE_CLOCK.get()
+    return datetime.datetime.now() if clock is None else clock.batch_time
+
+
+def _logical_time() -> Optional[int]:
+    clock = _ACTIVE_CLOCK.get()
+    return None if clock is None else clock.tick()
+
+
 class TimestampedModel(BaseModel):
-    created_at: datetime.datetime = Field(default_factory=datetime.datetime.now)
-    updated_at: datetime.datetime = Field(default_factory=datetime.datetime.now)
+    created_at: datetime.datetime = Field(default_factory=record_timestamp)
+    updated_at: datetime.datetime = Field(default_factory=record_timestamp)
+    # Tick of the last change under a LogicalClock (None when stamped by wall clock).
+    # Process-local ordering only, so it is not serialized.
+    logical_time: Optional[int] = Field(default_factory=_logical_time, exclude=True)
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        if "updated_at" not in self.model_fields_set:
+            # A new record was last updated when it was created; datetimes are
+            # immutable, so both fields can share one object
+            self.__dict__["updated_at"] = self.created_at
 
     def touch(self):
-        """Updates the updated_at timestamp."""
-        self.updated_at = datetime.datetime.now()
+        """Updates the updated_at timestamp (and logical_time under a LogicalClock)."""
+        clock = _ACTIVE_CLOCK.get()
+        if clock is None:
+            self.updated_at = datetime.datetime.now()
+            return
+        # Written directly, skipping BaseModel.__setattr__: both values are
+        # already valid, and subclasses caching dumps override touch()
+        fields = self.__dict__
+        fields["logical_time"] = clock.tick()
+        fields["updated_at"] = clock.batch_time
 
 
 # Standardized way to represent a probability distribution for discrete outcomes
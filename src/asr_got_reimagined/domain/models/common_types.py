@@ -13,11 +13,20 @@ class GoTProcessorSessionData(BaseModel):
 
     session_id: str = Field(default_factory=lambda: f"session-{uuid.uuid4()}")
     query: str
+    # Queries run in the session so far, this one included (resumes count up);
+    # stages use it to keep the IDs of elements they create unique per turn
+    turn: int = 1
     graph_state: Optional[Any] = None
     final_answer: Optional[str] = None
     final_confidence_vector: List[float] = Field(default=[0.5, 0.5, 0.5, 0.5])
     accumulated_context: Dict[str, Any] = Field(default_factory=dict)
     stage_outputs_trace: List[Dict[str, Any]] = Field(default_factory=list)
+    # Read-only graph snapshots keyed by stage name, when requested via the
+    # "capture_stage_snapshots" operational parameter (copy-on-write, cheap)
+    graph_snapshots: Dict[str, Any] = Field(default_factory=dict)
+    # Stages that cut their work short to meet the query's time budget
+    # ("max_latency_ms" operational parameter): stage name -> what was cut
+    degraded_stages: Dict[str, str] = Field(default_factory=dict)
 
 
 class ComposedOutput(BaseModel):
@@ -0,0 +1,456 @@
+"""
+Versioned binary file format for ASRGoTGraph.
+
+Layout (little-endian), every section 8-byte aligned:
+
+    header      magic "ASRGOTGB", format version (u16), section count (u16),
+                reserved (u32), then (offset u64, length u64) per section
+    strings     u64 offsets (count + 1) followed by one UTF-8 blob: IDs, labels,
+                type values, tags and layer IDs, each stored once
+    nodes       fixed-width records (NODE_DTYPE): string indexes, confidence
+                vector, impact, statistical power and a metadata blob offset
+    edges       fixed-width records (EDGE_DTYPE): node row indexes, type, confidence
+    hyperedges  fixed-width records with a slice into the members array
+    layers      fixed-width records with a slice into the members array
+    members     u32 node row indexes of hyperedges and layers
+    node_tags   (node row, tag string) pairs, for tag queries without blobs
+    blobs       length-prefixed (u32) JSON of every element's remaining fields
+    graph       one length-prefixed JSON blob: graph ID, version, metadata, timestamps
+
+MappedGraphFile memory-maps a saved file: the fixed-width sections become
+zero-copy NumPy views, and a node's full Node model is only built (from its
+blob) when asked for. nx_graph is derived from nodes/edges and is rebuilt by
+to_graph().
+"""
+
+import json
+import mmap
+import os
+import struct
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .common import ConfidenceVector
+from .graph_elements import Edge, Hyperedge, Node, NodeType
+from .graph_state import ASRGoTGraph
+
+FORMAT_MAGIC = b"ASRGOTGB"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHI")
+_SECTION = struct.Struct("<QQ")
+_BLOB_LENGTH = struct.Struct("<I")
+_SECTIONS = (
+    "string_offsets",
+    "string_data",
+    "nodes",
+    "edges",
+    "hyperedges",
+    "layers",
+    "members",
+    "node_tags",
+    "blobs",
+    "graph",
+)
+_NO_STRING = 0xFFFFFFFF  # e.g. a node without a layer
+
+NODE_DTYPE = np.dtype(
+    [
+        ("id", "<u4"),
+        ("label", "<u4"),
+        ("type", "<u4"),
+        ("layer", "<u4"),
+        ("confidence", "<f8", (4,)),
+        ("impact", "<f8"),
+        ("power", "<f8"),  # NaN when the node has no statistical power
+        ("blob", "<u8"),
+    ]
+)
+EDGE_DTYPE = np.dtype(
+    [
+        ("id", "<u4"),
+        ("source", "<u4"),
+        ("target", "<u4"),
+        ("type", "<u4"),
+        ("confidence", "<f8"),  # NaN when unset
+        ("blob", "<u8"),
+    ]
+)
+HYPEREDGE_DTYPE = np.dtype(
+    [
+        ("id", "<u4"),
+        ("members_count", "<u4"),
+        ("members_start", "<u8"),
+        ("confidence", "<f8", (4,)),
+        ("blob", "<u8"),
+    ]
+)
+LAYER_DTYPE = np.dtype(
+    [("id", "<u4"), ("members_count", "<u4"), ("members_start", "<u8")]
+)
+NODE_TAG_DTYPE = np.dtype([("node", "<u4"), ("tag", "<u4")])
+
+# Fields kept in fixed-width columns rather than in the JSON blobs
+_NODE_COLUMN_FIELDS = {"id", "label", "type", "confidence"}
+_EDGE_COLUMN_FIELDS = {"id", "source_id", "target_id", "type", "confidence"}
+_HYPEREDGE_COLUMN_FIELDS = {"id", "node_ids", "confidence_vector"}
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+class GraphFormatError(ValueError):
+    """Raised when a file is not a (supported) binary graph file."""
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        position = self.index.get(value)
+        if position is None:
+            position = len(self.values)
+            self.index[value] = position
+            self.values.append(value)
+        return position
+
+
+class _BlobWriter:
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, payload: Union[str, bytes]) -> int:
+        data = payload.encode("utf-8") if isinstance(payload, str) else payload
+        offset = self.size
+        self.chunks.append(_BLOB_LENGTH.pack(len(data)))
+        self.chunks.append(data)
+        self.size += _BLOB_LENGTH.size + len(data)
+        return offset
+
+
+def save_graph_binary(graph: ASRGoTGraph, path: PathLike) -> None:
+    """Writes `graph` to `path` in the binary format (atomically, via a temp file)."""
+    strings = _StringTable()
+    blobs = _BlobWriter()
+    node_rows = {node_id: row for row, node_id in enumerate(graph.nodes)}
+
+    # Records are gathered as tuples and converted once; per-field writes into
+    # a structured array cost more than the JSON dumps themselves.
+    intern = strings.intern
+    node_records = []
+    node_tags: List[tuple] = []
+    for row, node in enumerate(graph.nodes.values()):
+        metadata = node.metadata
+        power = metadata.statistical_power
+        node_records.append(
+            (
+                intern(node.id),
+                intern(node.label),
+                intern(node.type.value),
+                intern(metadata.layer_id) if metadata.layer_id else _NO_STRING,
+                node.confidence.to_list(),
+                metadata.impact_score or 0.0,
+                power.value if power is not None else np.nan,
+                blobs.add(node.model_dump_json(exclude=_NODE_COLUMN_FIELDS)),
+            )
+        )
+        node_tags.extend((row, intern(tag)) for tag in sorted(metadata.disciplinary_tags))
+    nodes = np.array(node_records, dtype=NODE_DTYPE)
+
+    edges = np.array(
+        [
+            (
+                intern(edge.id),
+                node_rows[edge.source_id],
+                node_rows[edge.target_id],
+                intern(edge.type.value),
+                np.nan if edge.confidence is None else edge.confidence,
+                blobs.add(edge.model_dump_json(exclude=_EDGE_COLUMN_FIELDS)),
+            )
+            for edge in graph.edges.values()
+        ],
+        dtype=EDGE_DTYPE,
+    )
+
+    members: List[int] = []
+    hyperedges = np.zeros(len(graph.hyperedges), dtype=HYPEREDGE_DTYPE)
+    for row, hyperedge in enumerate(graph.hyperedges.values()):
+        record = hyperedges[row]
+        record["id"] = strings.intern(hyperedge.id)
+        record["members_start"] = len(members)
+        record["members_count"] = len(hyperedge.node_ids)
+        members.extend(node_rows[node_id] for node_id in sorted(hyperedge.node_ids))
+        record["confidence"] = hyperedge.confidence_vector.to_list()
+        record["blob"] = blobs.add(
+            hyperedge.model_dump_json(exclude=_HYPEREDGE_COLUMN_FIELDS)
+        )
+
+    layers = np.zeros(len(graph.layers), dtype=LAYER_DTYPE)
+    for row, (layer_id, node_ids) in enumerate(graph.layers.items()):
+        record = layers[row]
+        record["id"] = strings.intern(layer_id)
+        record["members_start"] = len(members)
+        record["members_count"] = len(node_ids)
+        members.extend(node_rows[node_id] for node_id in node_ids if node_id in node_rows)
+
+    graph_blob = _BlobWriter()
+    graph_blob.add(
+        json.dumps(
+            {
+                "id": graph.id,
+                "version": graph.version,
+                "graph_metadata": graph.graph_metadata,
+                "created_at": graph.created_at.isoformat(),
+                "updated_at": graph.updated_at.isoformat(),
+            },
+            default=str,
+        )
+    )
+
+    encoded = [value.encode("utf-8") for value in strings.values]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(value) for value in encoded], out=string_offsets[1:])
+
+    sections = [
+        string_offsets.tobytes(),
+        b"".join(encoded),
+        nodes.tobytes(),
+        edges.tobytes(),
+        hyperedges.tobytes(),
+        layers.tobytes(),
+        np.asarray(members, dtype="<u4").tobytes(),
+        np.asarray(node_tags, dtype="<u4").reshape(-1, 2).tobytes(),
+        b"".join(blobs.chunks),
+        b"".join(graph_blob.chunks),
+    ]
+
+    header_size = _HEADER.size + _SECTION.size * len(sections)
+    offset = _align(header_size)
+    table = []
+    for data in sections:
+        table.append((offset, len(data)))
+        offset = _align(offset + len(data))
+
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, len(sections), 0))
+        for section_offset, length in table:
+            f.write(_SECTION.pack(section_offset, length))
+        for (section_offset, _), data in zip(table, sections, strict=True):
+            f.write(b"\0" * (section_offset - f.tell()))
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_graph_binary(path: PathLike) -> ASRGoTGraph:
+    """Reads a whole binary graph file back into an ASRGoTGraph (with its nx_graph)."""
+    with MappedGraphFile(path) as mapped:
+        return mapped.to_graph()
+
+
+class MappedGraphFile:
+    """
+    Read-only, memory-mapped view of a binary graph file. Column data (types,
+    confidences, impacts, edge endpoints) is available without parsing; Node,
+    Edge and Hyperedge models are decoded one at a time on request.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        # The mapping holds its own handle to the file, so the file object is
+        # only needed while mapping
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # Empty file
+                raise GraphFormatError(f"{path} is not a binary graph file.") from e
+        try:
+            self._read_sections(path)
+        except Exception:
+            self.close()
+            raise
+        self._row_by_node_id: Optional[Dict[str, int]] = None
+
+    def _read_sections(self, path: PathLike) -> None:
+        buffer = self._mmap
+        if len(buffer) < _HEADER.size:
+            raise GraphFormatError(f"{path} is not a binary graph file.")
+        magic, version, section_count, _ = _HEADER.unpack_from(buffer, 0)
+        if magic != FORMAT_MAGIC:
+            raise GraphFormatError(f"{path} is not a binary graph file.")
+        if version != FORMAT_VERSION or section_count != len(_SECTIONS):
+            raise GraphFormatError(
+                f"Unsupported binary graph format version {version} in {path}."
+            )
+        views: Dict[str, memoryview] = {}
+        for position, name in enumerate(_SECTIONS):
+            offset, length = _SECTION.unpack_from(
+                buffer, _HEADER.size + position * _SECTION.size
+            )
+            views[name] = memoryview(buffer)[offset : offset + length]
+        self._views = views
+        self._string_offsets = np.frombuffer(views["string_offsets"], dtype="<u8")
+        self._string_data = views["string_data"]
+        self.nodes = np.frombuffer(views["nodes"], dtype=NODE_DTYPE)
+        self.edges = np.frombuffer(views["edges"], dtype=EDGE_DTYPE)
+        self.hyperedges = np.frombuffer(views["hyperedges"], dtype=HYPEREDGE_DTYPE)
+        self.layers = np.frombuffer(views["layers"], dtype=LAYER_DTYPE)
+        self._members = np.frombuffer(views["members"], dtype="<u4")
+        self.node_tags = np.frombuffer(views["node_tags"], dtype=NODE_TAG_DTYPE)
+        self._blobs = views["blobs"]
+        self.graph_info: Dict[str, Any] = json.loads(_read_blob(views["graph"], 0))
+
+    def close(self) -> None:
+        # NumPy views and memoryviews must be released before the mmap can close
+        for name in (
+            "nodes",
+            "edges",
+            "hyperedges",
+            "layers",
+            "node_tags",
+            "_members",
+            "_string_offsets",
+            "_string_data",
+            "_blobs",
+        ):
+            self.__dict__.pop(name, None)
+        for view in self.__dict__.pop("_views", {}).values():
+            view.release()
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def __enter__(self) -> "MappedGraphFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # --- Column access (no per-element decoding) ---
+
+    @property
+    def node_count(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edges)
+
+    def string(self, position: int) -> str:
+        start, end = self._string_offsets[position], self._string_offsets[position + 1]
+        return bytes(self._string_data[start:end]).decode("utf-8")
+
+    def _string_position(self, value: str) -> Optional[int]:
+        data = value.encode("utf-8")
+        offsets = self._string_offsets
+        # Only strings of the right length are compared, so no table-wide decode
+        candidates = np.flatnonzero(np.diff(offsets) == len(data))
+        for position in candidates:
+            start = int(offsets[position])
+            if self._string_data[start : start + len(data)] == data:
+                return int(position)
+        return None
+
+    def node_id(self, row: int) -> str:
+        return self.string(int(self.nodes["id"][row]))
+
+    def node_row(self, node_id: str) -> Optional[int]:
+        if self._row_by_node_id is None:
+            self._row_by_node_id = {
+                self.string(int(position)): row
+                for row, position in enumerate(self.nodes["id"])
+            }
+        return self._row_by_node_id.get(node_id)
+
+    def node_rows_of_type(self, *node_types: NodeType) -> np.ndarray:
+        positions = [self._string_position(t.value) for t in node_types]
+        positions = [p for p in positions if p is not None]
+        return np.flatnonzero(np.isin(self.nodes["type"], positions))
+
+    def node_ids_of_type(self, *node_types: NodeType) -> List[str]:
+        return [self.node_id(int(row)) for row in self.node_rows_of_type(*node_types)]
+
+    # --- Element decoding ---
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        row = self.node_row(node_id)
+        return None if row is None else self.node_at(row)
+
+    def node_at(self, row: int) -> Node:
+        record = self.nodes[row]
+        fields = json.loads(_read_blob(self._blobs, int(record["blob"])))
+        fields.update(
+            id=self.string(int(record["id"])),
+            label=self.string(int(record["label"])),
+            type=self.string(int(record["type"])),
+            confidence=ConfidenceVector.from_list(record["confidence"].tolist()),
+        )
+        return Node.model_validate(fields)
+
+    def edge_at(self, row: int) -> Edge:
+        record = self.edges[row]
+        fields = json.loads(_read_blob(self._blobs, int(record["blob"])))
+        confidence = float(record["confidence"])
+        fields.update(
+            id=self.string(int(record["id"])),
+            source_id=self.node_id(int(record["source"])),
+            target_id=self.node_id(int(record["target"])),
+            type=self.string(int(record["type"])),
+            confidence=None if np.isnan(confidence) else confidence,
+        )
+        return Edge.model_validate(fields)
+
+    def hyperedge_at(self, row: int) -> Hyperedge:
+        record = self.hyperedges[row]
+        fields = json.loads(_read_blob(self._blobs, int(record["blob"])))
+        fields.update(
+            id=self.string(int(record["id"])),
+            node_ids={self.node_id(int(r)) for r in self._member_rows(record)},
+            confidence_vector=ConfidenceVector.from_list(record["confidence"].tolist()),
+        )
+        return Hyperedge.model_validate(fields)
+
+    def _member_rows(self, record: np.void) -> np.ndarray:
+        start = int(record["members_start"])
+        return self._members[start : start + int(record["members_count"])]
+
+    def iter_nodes(self) -> Iterator[Node]:
+        for row in range(self.node_count):
+            yield self.node_at(row)
+
+    def iter_edges(self) -> Iterator[Edge]:
+        for row in range(self.edge_count):
+            yield self.edge_at(row)
+
+    def to_graph(self) -> ASRGoTGraph:
+        """Materializes the full ASRGoTGraph, rebuilding indexes and nx_graph."""
+        info = self.graph_info
+        graph = ASRGoTGraph(
+            id=info["id"],
+            graph_metadata=info.get("graph_metadata", {}),
+            created_at=info["created_at"],
+        )
+        for record in self.layers:  # Keeps empty layers too
+            graph.ensure_layer(self.string(int(record["id"])))
+        graph.add_nodes_bulk(self.iter_nodes())
+        graph.add_edges_bulk(self.iter_edges())
+        for row in range(len(self.hyperedges)):
+            graph.add_hyperedge(self.hyperedge_at(row))
+        graph.updated_at = datetime.fromisoformat(info["updated_at"])
+        if "version" in info:
+            # Keep the saved version line; the journal entries themselves are
+            # not saved, so changes_since() older versions returns None
+            graph._restart_journal(info["version"])
+        return graph
+
+
+def _read_blob(view: memoryview, offset: int) -> bytes:
+    (length,) = _BLOB_LENGTH.unpack_from(view, offset)
+    start = offset + _BLOB_LENGTH.size
+    return bytes(view[start : start + length])
+
+
+def _align(offset: int, alignment: int = 8) -> int:
+    return (offset + alignment - 1) // alignment * alignment
@@ -1,9 +1,9 @@
 import datetime
 import uuid  # For generating default IDs
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
-from pydantic import BaseModel, Field, field_validator, field_serializer
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, field_serializer
 
 from .common import (
     CertaintyScore,
@@ -11,8 +11,12 @@ from .common import (
     EpistemicStatus,
     ImpactScore,
     TimestampedModel,
+    record_timestamp,
 )
 
+if TYPE_CHECKING:
+    from .revision_log import RevisionPolicy
+
 
 # --- Enums for Node and Edge Types ---
 class NodeType(str, Enum):
@@ -96,12 +100,12 @@ class BiasFlag(BaseModel):  # P1.17
 
 
 class RevisionRecord(BaseModel):
-    timestamp: datetime.datetime = Field(default_factory=datetime.datetime.now)
+    timestamp: datetime.datetime = Field(default_factory=record_timestamp)
     user_or_process: str  # Who/what made the change
     action: str  # e.g., "created", "updated_confidence", "merged", "pruned"
     changes_made: Dict[
         str, Any
-    ]  # e.g., {"confidence.empirical_support": {"old": 0.5, "new": 0.7}}
+    ]  # e.g., {"confidence": {"0": [0.5, 0.7]}} (component index -> [old, new])
     reason: Optional[str] = None
 
 
@@ -160,7 +164,7 @@ class StatisticalPower(BaseModel):  # P1.26 (for evidence nodes)
 class Attribution(BaseModel):  # P1.29
     source_id: Optional[str] = None  # ID of the original source, if any
     contributor: Optional[str] = None  # User or process ID
-    timestamp: datetime.datetime = Field(default_factory=datetime.datetime.now)
+    timestamp: datetime.datetime = Field(default_factory=record_timestamp)
     role: Optional[str] = Field(
         default="author", examples=["author", "curator", "validator"]
     )
@@ -169,6 +173,79 @@ class Attribution(BaseModel):  # P1.29
 # --- Core Graph Element Models ---
 
 
+class _SerializedForms:
+    """
+    Immutable set of cached serializations of one element. Never changed in
+    place (with_form returns a new instance), so copies of an element can share it.
+    """
+
+    __slots__ = ("forms",)
+
+    def __init__(self, forms: Dict[str, Any]):
+        self.forms = forms
+
+    def with_form(self, key: str, value: Any) -> "_SerializedForms":
+        return _SerializedForms({**self.forms, key: value})
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_SerializedForms":
+        return self  # A deep copy has equal content, so the cache stays valid
+
+
+class SerializationCachedModel(TimestampedModel):
+    """
+    Caches the API serializations of a graph element until it changes.
+
+    Assigning any field (including touch(), which sets updated_at) drops the
+    cache. In-place changes to nested values (metadata fields, lists, sets) must
+    be followed by touch(), as everywhere else in the graph code. The returned
+    dicts and strings are shared between calls and must not be modified.
+    """
+
+    _serialized: Optional[_SerializedForms] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            # Private storage is used directly: attribute access to private
+            # attributes goes through BaseModel.__getattr__ and is slow
+            self.__pydantic_private__["_serialized"] = None
+
+    def touch(self):
+        super().touch()
+        self.__pydantic_private__["_serialized"] = None
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:  # Fields were written without going through __setattr__
+            copied.__pydantic_private__["_serialized"] = None
+        return copied
+
+    def cached_dump(self) -> Dict[str, Any]:
+        """model_dump(exclude_none=True), computed once per change."""
+        return self._cached_form("dict", lambda: self.model_dump(exclude_none=True))
+
+    def cached_dump_json(self) -> str:
+        """model_dump_json(exclude_none=True), computed once per change."""
+        return self._cached_form(
+            "json", lambda: self.model_dump_json(exclude_none=True)
+        )
+
+    def _cached_form(self, key: str, compute: Any) -> Any:
+        private = self.__pydantic_private__
+        serialized = private["_serialized"]
+        if serialized is not None:
+            value = serialized.forms.get(key)
+            if value is not None:
+                return value
+        value = compute()
+        private["_serialized"] = (
+            _SerializedForms({key: value})
+            if serialized is None
+            else serialized.with_form(key, value)
+        )
+        return value
+
+
 class NodeMetadata(TimestampedModel):  # Aligns with P1.12 for nodes
     description: Optional[str] = None
     query_context: Optional[str] = None  # Verbatim query or context for this node, P1.6
@@ -199,7 +276,7 @@ class NodeMetadata(TimestampedModel):  # Aligns with P1.12 for nodes
     research_questions_generated: List[str] = Field(default_factory=list)
 
 
-class Node(TimestampedModel):
+class Node(SerializationCachedModel):
     id: str = Field(default_factory=lambda: f"node-{uuid.uuid4()}")
     label: str = Field(..., min_length=1)
     type: NodeType
@@ -224,22 +301,30 @@ class Node(TimestampedModel):
         new_confidence: ConfidenceVector,
         updated_by: str,
         reason: Optional[str] = None,
+        revision_policy: Optional["RevisionPolicy"] = None,
+        graph_id: Optional[str] = None,
     ):
-        old_confidence_dict = self.confidence.model_dump()
+        """
+        Replaces the confidence vector and records the change in the revision
+        history as {"confidence": {component index: [old, new]}}, for changed
+        components only. `revision_policy` decides what the inline history keeps
+        (everything if None); `graph_id` labels the record in its audit log.
+        """
+        from .revision_log import confidence_delta
+
+        record = RevisionRecord(
+            user_or_process=updated_by,
+            action="update_confidence",
+            changes_made={"confidence": confidence_delta(self.confidence, new_confidence)},
+            reason=reason,
+        )
         self.confidence = new_confidence
-        self.metadata.revision_history.append(
-            RevisionRecord(
-                user_or_process=updated_by,
-                action="update_confidence",
-                changes_made={
-                    "confidence": {
-                        "old": old_confidence_dict,
-                        "new": new_confidence.model_dump(),
-                    }
-                },
-                reason=reason,
+        if revision_policy is None:
+            self.metadata.revision_history.append(record)
+        else:
+            revision_policy.record(
+                self.metadata.revision_history, record, self.id, graph_id
             )
-        )
         self.touch()
 
 
@@ -254,7 +339,7 @@ class EdgeMetadata(TimestampedModel):  # Aligns with P1.12 for edges
     # additional_properties: Dict[str, Any] = Field(default_factory=dict)
 
 
-class Edge(TimestampedModel):
+class Edge(SerializationCachedModel):
     id: str = Field(default_factory=lambda: f"edge-{uuid.uuid4()}")
     source_id: str
     target_id: str
@@ -286,7 +371,7 @@ class HyperedgeMetadata(TimestampedModel):  # Aligns with P1.9 & P1.12
     # additional_properties: Dict[str, Any] = Field(default_factory=dict)
 
 
-class Hyperedge(TimestampedModel):  # P1.9
+class Hyperedge(SerializationCachedModel):  # P1.9
     id: str = Field(default_factory=lambda: f"hyperedge-{uuid.uuid4()}")
     # A hyperedge connects a set of nodes. |E_h| > 2 is typical but can be 2 for typed N-ary.
     node_ids: Set[str] = Field(..., min_length=2)
@@ -0,0 +1,285 @@
+"""
+Secondary indexes for ASRGoTGraph.
+
+Kept in a plain (non-Pydantic) object so the graph reaches all of them through a
+single private attribute; Pydantic private-attribute access is comparatively slow
+and the indexes are touched on every mutation.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+
+from .graph_elements import Edge, EdgeType, Hyperedge, Node, NodeType
+from .id_table import IdTable
+from .node_scores import NodeScoreColumns, NodeScores
+from .vocabulary import Vocabulary
+
+# Insertion-ordered ID set: dict keys give O(1) membership and removal while
+# keeping iteration order deterministic, like ASRGoTGraph.nodes itself.
+IdSet = Dict[str, None]
+# The same over integer handles (see id_table.py)
+HandleSet = Dict[int, None]
+
+
+class GraphIndexes:
+    __slots__ = (
+        "degree_histogram",
+        "edge_handles",
+        "edges_by_key",
+        "edges_by_type",
+        "in_edges",
+        "layer_vocabulary",
+        "node_handles",
+        "node_hyperedges",
+        "node_layer",
+        "node_tag_masks",
+        "nodes_by_tag",
+        "nodes_by_type",
+        "out_edges",
+        "scores",
+        "star_expansion",
+        "tag_vocabulary",
+    )
+
+    def __init__(self) -> None:
+        # Dense integer handles for node and edge IDs (see id_table.py); the
+        # per-node lists and score arrays below are indexed by node handle
+        self.node_handles = IdTable()
+        self.edge_handles = IdTable()
+        self.nodes_by_type: Dict[NodeType, IdSet] = {}
+        self.edges_by_type: Dict[EdgeType, IdSet] = {}
+        self.nodes_by_tag: Dict[str, IdSet] = {}
+        # Node handle -> bitmask of its disciplinary tags, over tag_vocabulary.
+        # The vocabularies only ever grow, so copies of the indexes share them.
+        self.node_tag_masks: List[int] = []
+        self.tag_vocabulary = Vocabulary()
+        self.layer_vocabulary = Vocabulary()
+        # Adjacency/incidence: node handle -> outgoing/incoming edge handles
+        # (None while there are none), and (source, target, type) -> edge IDs
+        # for O(1) duplicate checks.
+        self.out_edges: List[Optional[HandleSet]] = []
+        self.in_edges: List[Optional[HandleSet]] = []
+        self.edges_by_key: Dict[Tuple[str, str, EdgeType], IdSet] = {}
+        # Reverse maps so node removal is proportional to the node's degree:
+        # node ID -> hyperedge IDs containing it, and node ID -> its layer.
+        self.node_hyperedges: Dict[str, IdSet] = {}
+        self.node_layer: Dict[str, str] = {}
+        # Lazily built star expansion of the hyperedges (see ASRGoTGraph.star_expansion)
+        self.star_expansion: Optional[nx.Graph] = None
+        # Confidence/impact/power columns for vectorized node filtering
+        self.scores = NodeScoreColumns()
+        # Total (in + out) degree -> number of nodes with that degree
+        self.degree_histogram: Dict[int, int] = {}
+
+    def copy(self) -> "GraphIndexes":
+        """Independent copy; the frozen star expansion is shared, being immutable."""
+        copied = GraphIndexes()
+        copied.node_handles = self.node_handles.copy()
+        copied.edge_handles = self.edge_handles.copy()
+        for name in (
+            "nodes_by_type",
+            "edges_by_type",
+            "nodes_by_tag",
+            "edges_by_key",
+            "node_hyperedges",
+        ):
+            setattr(copied, name, _copy_index(getattr(self, name)))
+        copied.out_edges = _copy_handle_sets(self.out_edges)
+        copied.in_edges = _copy_handle_sets(self.in_edges)
+        copied.node_tag_masks = list(self.node_tag_masks)
+        copied.tag_vocabulary = self.tag_vocabulary
+        copied.layer_vocabulary = self.layer_vocabulary
+        copied.node_layer = dict(self.node_layer)
+        copied.star_expansion = self.star_expansion
+        copied.scores = self.scores.copy()
+        copied.degree_histogram = dict(self.degree_histogram)
+        return copied
+
+    # --- Nodes ---
+
+    def index_node(self, node: Node) -> None:
+        handle = self.node_handles.acquire(node.id)
+        if handle == len(self.out_edges):  # New handles are always the next one
+            self.out_edges.append(None)
+            self.in_edges.append(None)
+            self.node_tag_masks.append(0)
+        self.nodes_by_type.setdefault(node.type, {})[node.id] = None
+        tags = node.metadata.disciplinary_tags
+        for tag in tags:
+            self.nodes_by_tag.setdefault(tag, {})[node.id] = None
+        self.node_tag_masks[handle] = self.tag_vocabulary.mask(tags)
+        self.scores.upsert(handle, node)
+        degree = self._degree_at(handle)
+        self.degree_histogram[degree] = self.degree_histogram.get(degree, 0) + 1
+
+    def replace_node(self, existing: Node, node: Node) -> None:
+        """Re-indexes a node overwritten under the same ID; its edges stay indexed."""
+        self._unindex_node_fields(existing)
+        self.index_node(node)
+
+    def unindex_node(self, node: Node) -> None:
+        """Call after unindexing the node's edges, so its degree is final."""
+        handle = self._unindex_node_fields(node)
+        if handle is not None:
+            self.out_edges[handle] = None
+            self.in_edges[handle] = None
+            self.node_tag_masks[handle] = 0
+            self.node_handles.release(node.id)
+
+    def _unindex_node_fields(self, node: Node) -> Optional[int]:
+        discard_from_index(self.nodes_by_type, node.type, node.id)
+        for tag in node.metadata.disciplinary_tags:
+            discard_from_index(self.nodes_by_tag, tag, node.id)
+        handle = self.node_handles.get(node.id)
+        if handle is not None:
+            self.scores.remove(handle)
+            self._shift_degree(self._degree_at(handle), None)
+        return handle
+
+    def update_scores(self, node: Node) -> None:
+        self.scores.upsert(self.node_handles.acquire(node.id), node)
+
+    def select_scores(self, node_ids: Optional[Iterable[str]] = None) -> NodeScores:
+        """Scores of `node_ids` (all nodes, in insertion order, if None); unknown IDs are skipped."""
+        handle_of = self.node_handles.handle_of
+        if node_ids is None:
+            ids = list(handle_of)
+            rows = np.fromiter(handle_of.values(), dtype=np.intp, count=len(ids))
+        else:
+            ids = [node_id for node_id in node_ids if node_id in handle_of]
+            rows = np.fromiter(
+                (handle_of[node_id] for node_id in ids), dtype=np.intp, count=len(ids)
+            )
+        return self.scores.select(ids, rows)
+
+    def tag_mask(self, node_id: str) -> int:
+        handle = self.node_handles.get(node_id)
+        return 0 if handle is None else self.node_tag_masks[handle]
+
+    def add_tag_mask(self, node_id: str, mask: int) -> None:
+        handle = self.node_handles.acquire(node_id)
+        self.node_tag_masks[handle] |= mask
+
+    # --- Edges ---
+
+    def index_edge(self, edge: Edge) -> None:
+        edge_id = edge.id
+        handle = self.edge_handles.acquire(edge_id)
+        self.edges_by_type.setdefault(edge.type, {})[edge_id] = None
+        node_handles = self.node_handles.handle_of
+        source = node_handles[edge.source_id]
+        target = node_handles[edge.target_id]
+        _add_handle(self.out_edges, source, handle)
+        _add_handle(self.in_edges, target, handle)
+        key = (edge.source_id, edge.target_id, edge.type)
+        self.edges_by_key.setdefault(key, {})[edge_id] = None
+        self._update_endpoint_degrees(source, target, +1)
+
+    def unindex_edge(self, edge: Edge) -> None:
+        discard_from_index(self.edges_by_type, edge.type, edge.id)
+        key = (edge.source_id, edge.target_id, edge.type)
+        discard_from_index(self.edges_by_key, key, edge.id)
+        handle = self.edge_handles.release(edge.id)
+        if handle is None:
+            return
+        node_handles = self.node_handles.handle_of
+        source = node_handles[edge.source_id]
+        target = node_handles[edge.target_id]
+        _discard_handle(self.out_edges, source, handle)
+        _discard_handle(self.in_edges, target, handle)
+        self._update_endpoint_degrees(source, target, -1)
+
+    def out_edge_ids(self, node_id: str) -> List[str]:
+        return self._edge_ids(self.out_edges, node_id)
+
+    def in_edge_ids(self, node_id: str) -> List[str]:
+        return self._edge_ids(self.in_edges, node_id)
+
+    def _edge_ids(self, adjacency: List[Optional[HandleSet]], node_id: str) -> List[str]:
+        node_handle = self.node_handles.get(node_id)
+        if node_handle is None:
+            return []
+        edge_handles = adjacency[node_handle]
+        if not edge_handles:
+            return []
+        strings = self.edge_handles.strings
+        return [strings[handle] for handle in edge_handles]  # type: ignore[misc]
+
+    def degree(self, node_id: str) -> int:
+        handle = self.node_handles.get(node_id)
+        return 0 if handle is None else self._degree_at(handle)
+
+    def _degree_at(self, handle: int) -> int:
+        out_handles = self.out_edges[handle]
+        in_handles = self.in_edges[handle]
+        return (len(out_handles) if out_handles else 0) + (
+            len(in_handles) if in_handles else 0
+        )
+
+    def _update_endpoint_degrees(self, source: int, target: int, delta: int) -> None:
+        """Moves the endpoints of an edge just (un)indexed to their new histogram bucket."""
+        if source == target:  # Self-loop counts twice
+            degree = self._degree_at(source)
+            self._shift_degree(degree - 2 * delta, degree)
+            return
+        for handle in (source, target):
+            degree = self._degree_at(handle)
+            self._shift_degree(degree - delta, degree)
+
+    def _shift_degree(self, old: int, new: Optional[int]) -> None:
+        histogram = self.degree_histogram
+        remaining = histogram.get(old, 0) - 1
+        if remaining > 0:
+            histogram[old] = remaining
+        else:
+            histogram.pop(old, None)
+        if new is not None:
+            histogram[new] = histogram.get(new, 0) + 1
+
+    # --- Hyperedges ---
+
+    def index_hyperedge(self, hyperedge: Hyperedge) -> None:
+        for node_id in hyperedge.node_ids:
+            self.node_hyperedges.setdefault(node_id, {})[hyperedge.id] = None
+        self.star_expansion = None
+
+    def unindex_hyperedge(self, hyperedge: Hyperedge) -> None:
+        for node_id in hyperedge.node_ids:
+            discard_from_index(self.node_hyperedges, node_id, hyperedge.id)
+        self.star_expansion = None
+
+
+def _add_handle(adjacency: List[Optional[HandleSet]], node_handle: int, handle: int) -> None:
+    handles = adjacency[node_handle]
+    if handles is None:
+        adjacency[node_handle] = {handle: None}
+    else:
+        handles[handle] = None
+
+
+def _discard_handle(adjacency: List[Optional[HandleSet]], node_handle: int, handle: int) -> None:
+    handles = adjacency[node_handle]
+    if handles is not None:
+        handles.pop(handle, None)
+        if not handles:
+            adjacency[node_handle] = None
+
+
+def _copy_handle_sets(adjacency: List[Optional[HandleSet]]) -> List[Optional[HandleSet]]:
+    return [handles.copy() if handles else None for handles in adjacency]
+
+
+def _copy_index(index: Dict[Any, IdSet]) -> Dict[Any, IdSet]:
+    return {key: bucket.copy() for key, bucket in index.items()}
+
+
+def discard_from_index(index: Dict[Any, IdSet], key: Any, item_id: str) -> None:
+    """Removes `item_id` from the ID set under `key`, dropping the key once empty."""
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(item_id, None)
+    if not bucket:
+        del index[key]
@@ -0,0 +1,93 @@
+"""
+Append-only mutation journal for ASRGoTGraph.
+
+Every mutation of the graph records one GraphChange and bumps the graph
+version by one, so `entries[i].version == start_version + i + 1`. Consumers
+remember the version they last processed and replay only the changes since.
+"""
+
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# Entries kept before the oldest ones are dropped; consumers that fall further
+# behind get None from changes_since() and must recompute from scratch.
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class ElementKind(str, Enum):
+    NODE = "node"
+    EDGE = "edge"
+    HYPEREDGE = "hyperedge"
+    LAYER = "layer"
+
+
+class ChangeAction(str, Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    UPDATED = "updated"  # Changed in place, or overwritten by an add with the same ID
+
+
+class GraphChange(NamedTuple):
+    version: int
+    kind: ElementKind
+    action: ChangeAction
+    element_id: str
+
+
+class GraphJournal:
+    __slots__ = ("cached_statistics", "entries", "max_entries", "start_version", "version")
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.entries: List[GraphChange] = []
+        self.start_version = 0  # Version just before entries[0]
+        self.version = 0
+        self.max_entries = max_entries
+        # (version, GraphStatistics) memo of ASRGoTGraph.get_statistics; kept here
+        # so a cache hit costs a single private-attribute lookup on the graph
+        self.cached_statistics: Optional[Tuple[int, Any]] = None
+
+    def record(self, kind: ElementKind, action: ChangeAction, element_id: str) -> None:
+        self.version += 1
+        self.entries.append(GraphChange(self.version, kind, action, element_id))
+        if len(self.entries) > 2 * self.max_entries:
+            # Amortized trim; rebinds rather than mutates, so frozen views that
+            # share the old list (see frozen_view) stay intact.
+            dropped = len(self.entries) - self.max_entries
+            self.entries = self.entries[dropped:]
+            self.start_version += dropped
+
+    def changes_since(self, version: int) -> Optional[List[GraphChange]]:
+        """
+        Changes with a version greater than `version`, oldest first, or None
+        if some of them have already been trimmed from the journal.
+        """
+        if version < self.start_version:
+            return None
+        if version >= self.version:
+            return []
+        return self.entries[version - self.start_version : self.version - self.start_version]
+
+    def restart_at(self, version: int) -> None:
+        """Drops all entries and continues counting from `version`."""
+        self.entries = []
+        self.start_version = version
+        self.version = version
+        self.cached_statistics = None
+
+    def frozen_view(self) -> "GraphJournal":
+        """A journal fixed at the current version, sharing the entries recorded so far."""
+        view = GraphJournal(self.max_entries)
+        view.entries = self.entries
+        view.start_version = self.start_version
+        view.version = self.version
+        return view
+
+    def copy(self) -> "GraphJournal":
+        """An independent journal with the same history, for a forked graph."""
+        copied = self.frozen_view()
+        # A frozen view's shared list may hold entries recorded after its version
+        copied.entries = self.entries[: self.version - self.start_version]
+        return copied
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "GraphJournal":
+        return self.copy()  # Entries are immutable tuples
@@ -0,0 +1,42 @@
+"""
+Copy-on-write bookkeeping for ASRGoTGraph snapshots.
+
+ASRGoTGraph.snapshot() hands out a read-only graph that shares every container
+(node/edge/hyperedge dicts, layers, indexes, nx_graph) and every element with
+the live graph. The live graph copies a container the first time it writes to
+it after a snapshot, and copies an element the first time it mutates it in
+place, so a snapshot costs O(1) and later writes pay only for what they change.
+"""
+
+from typing import FrozenSet, Set
+
+# Containers of ASRGoTGraph that may be shared with a snapshot
+NODES = "nodes"
+EDGES = "edges"
+HYPEREDGES = "hyperedges"
+LAYERS = "layers"
+INDEX = "index"
+NX_GRAPH = "nx_graph"
+
+ALL_CONTAINERS: FrozenSet[str] = frozenset(
+    {NODES, EDGES, HYPEREDGES, LAYERS, INDEX, NX_GRAPH}
+)
+
+
+class CopyOnWriteState:
+    __slots__ = (
+        "owned_hyperedge_ids",
+        "owned_node_ids",
+        "read_only",
+        "shared_containers",
+    )
+
+    def __init__(self, read_only: bool = False) -> None:
+        # Snapshots never write, so they have nothing to copy
+        self.read_only = read_only
+        self.shared_containers: Set[str] = set() if read_only else set(ALL_CONTAINERS)
+        # Elements created or already copied since the last snapshot; any other
+        # element is shared and must be copied before an in-place change.
+        # (Edges are never changed in place, so they need no tracking.)
+        self.owned_node_ids: Set[str] = set()
+        self.owned_hyperedge_ids: Set[str] = set()
@@ -1,24 +1,72 @@
+import json
 import uuid
-from typing import Any, Dict, List, Optional, Set, TypeVar
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
 
 import networkx as nx
 from loguru import logger
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
-from .common import TimestampedModel
-from .graph_elements import Edge, Hyperedge, Node  # Import your domain models
+from .common import ConfidenceVector, LogicalClock, TimestampedModel
+from .graph_elements import (  # Import your domain models
+    Edge,
+    EdgeType,
+    Hyperedge,
+    Node,
+    NodeType,
+    RevisionRecord,
+)
+from .graph_indexes import GraphIndexes
+from .graph_journal import ChangeAction, ElementKind, GraphChange, GraphJournal
+from .graph_snapshot import (
+    ALL_CONTAINERS,
+    EDGES,
+    HYPEREDGES,
+    INDEX,
+    LAYERS,
+    NODES,
+    NX_GRAPH,
+    CopyOnWriteState,
+)
+from .node_scores import NodeScores
+from .revision_log import RevisionPolicy, merge_histories
 
 TNode = TypeVar("TNode", bound=Node)
 TEdge = TypeVar("TEdge", bound=Edge)
 THyperedge = TypeVar("THyperedge", bound=Hyperedge)
 
 
+class MergePolicy(str, Enum):
+    """How ASRGoTGraph.merge_nodes combines the confidence vectors of two nodes (P1.5)."""
+
+    MAX = "max"  # Component-wise maximum
+    MEAN = "mean"  # Component-wise mean
+    KEEP = "keep"  # Keep the surviving node's confidence unchanged
+
+
 class GraphStatistics(BaseModel):
     node_count: int = 0
     edge_count: int = 0
     hyperedge_count: int = 0
     layer_count: int = 0
-    # Add more specific stats as needed, e.g., counts by node_type
+    nodes_by_type: Dict[str, int] = Field(default_factory=dict)  # NodeType value -> count
+    edges_by_type: Dict[str, int] = Field(default_factory=dict)  # EdgeType value -> count
+    nodes_by_layer: Dict[str, int] = Field(default_factory=dict)  # P1.23
+    # Total (in + out) degree -> number of nodes with that degree
+    degree_histogram: Dict[int, int] = Field(default_factory=dict)
+    # Per-component mean of node confidence vectors (P1.5), and its average
+    mean_confidence: List[float] = Field(default_factory=lambda: [0.0] * 4)
+    mean_average_confidence: float = 0.0
 
 
 class ASRGoTGraph(TimestampedModel):
@@ -47,15 +95,240 @@ class ASRGoTGraph(TimestampedModel):
     # Metadata about the graph itself, e.g., current stage, overall query
     graph_metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    # Secondary indexes (type, tag, adjacency, hyperedge incidence, layer
+    # reverse map), kept in sync by the mutation methods below.
+    _index: GraphIndexes = PrivateAttr(default_factory=GraphIndexes)
+    # Set once snapshot() has been called (see graph_snapshot.py)
+    _cow: Optional[CopyOnWriteState] = PrivateAttr(default=None)
+    # Append-only change log; its version is the graph version
+    _journal: GraphJournal = PrivateAttr(default_factory=GraphJournal)
+    # Retention of node revision histories; None keeps every record inline.
+    # Shared by snapshots and forks.
+    _revision_policy: Optional[RevisionPolicy] = PrivateAttr(default=None)
+    # Created on first use; shared by snapshots and forks so stamps stay monotonic
+    _clock: Optional[LogicalClock] = PrivateAttr(default=None)
+
     @field_validator("nx_graph", mode="before")
     @classmethod
     def init_nx_graph(cls, v):
         return v or nx.MultiDiGraph()
 
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        # Graphs built with pre-populated `nodes`/`edges` need their indexes too.
+        self._rebuild_indexes()
+
+    # --- Index maintenance ---
+
+    def _rebuild_indexes(self) -> None:
+        index = GraphIndexes()
+        for node in self.nodes.values():
+            index.index_node(node)
+        for edge in self.edges.values():
+            index.index_edge(edge)
+        for hyperedge in self.hyperedges.values():
+            index.index_hyperedge(hyperedge)
+        for layer_id, node_ids_in_layer in self.layers.items():
+            index.layer_vocabulary.intern(layer_id)
+            for node_id in node_ids_in_layer:
+                index.node_layer[node_id] = layer_id
+        self._index = index
+
+    # --- Versioning ---
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter, bumped by one for every recorded change."""
+        return self._journal.version
+
+    def changes_since(self, version: int) -> Optional[List[GraphChange]]:
+        """
+        Node, edge, hyperedge and layer changes made after `version`, oldest
+        first. Returns None when `version` is older than the retained journal,
+        in which case the caller has to recompute from the full graph.
+        """
+        return self._journal.changes_since(version)
+
+    def _restart_journal(self, version: int) -> None:
+        """Continues the version count from `version` with no history (e.g. after a load)."""
+        self._journal.restart_at(version)
+
+    def adopt_journal(self, base: "ASRGoTGraph", changes: Sequence[GraphChange]) -> None:
+        """
+        Takes over the journal of `base`, followed by `changes`, for a graph that
+        was rebuilt from `base` elsewhere (e.g. loaded in a worker process) and
+        changed there by exactly `changes`. changes_since() then reaches back as
+        far as it does on `base`.
+        """
+        journal = base._journal.copy()
+        for change in changes:
+            journal.record(change.kind, change.action, change.element_id)
+        if journal.version != self.version:
+            raise ValueError(
+                f"Journal of graph {base.id} plus {len(changes)} changes ends at "
+                f"version {journal.version}, not at this graph's version {self.version}."
+            )
+        self._journal = journal
+
+    @property
+    def logical_clock(self) -> LogicalClock:
+        """
+        The graph's logical clock. Run mutations inside
+        `with graph.logical_clock.batch():` to stamp them with ticks instead of
+        reading the wall clock per change (see common.LogicalClock).
+        """
+        clock = self._clock
+        if clock is None:
+            clock = self._clock = LogicalClock()
+        return clock
+
+    # --- Revision history ---
+
+    @property
+    def revision_policy(self) -> Optional[RevisionPolicy]:
+        return self._revision_policy
+
+    def set_revision_policy(self, policy: Optional[RevisionPolicy]) -> None:
+        """Applies to revisions recorded from now on; existing histories are kept as they are."""
+        self._revision_policy = policy
+
+    def revision_history(self, node_id: str) -> List[RevisionRecord]:
+        """
+        The full revision history of a node: the inline metadata.revision_history,
+        merged with the policy's audit log if there is one (the inline history
+        may have been trimmed; records from before the log was attached are
+        only inline).
+        """
+        if node_id not in self.nodes:
+            raise ValueError(f"Node {node_id} not found.")
+        inline = self.nodes[node_id].metadata.revision_history
+        policy = self._revision_policy
+        if policy is not None and policy.audit_log is not None:
+            return merge_histories(
+                inline, policy.audit_log.records_for(node_id, graph_id=self.id)
+            )
+        return list(inline)
+
+    def _record_revision(self, node: Node, record: RevisionRecord) -> None:
+        policy = self._revision_policy
+        if policy is None:
+            node.metadata.revision_history.append(record)
+        else:
+            policy.record(node.metadata.revision_history, record, node.id, self.id)
+
+    # --- Snapshots (copy-on-write) ---
+
+    def snapshot(self) -> "ASRGoTGraph":
+        """
+        Returns a read-only view of the graph as it is now, in O(1).
+
+        The snapshot shares all nodes, edges, hyperedges, layers, indexes and the
+        nx_graph with this graph. Afterwards this graph copies each container on
+        its first write and each element before changing it in place, so the
+        snapshot never observes later mutations. Mutating a snapshot raises.
+        """
+        if self.is_snapshot:
+            return self  # Already immutable
+        snap = self.model_copy()
+        snap.graph_metadata = dict(self.graph_metadata)
+        snap._cow = CopyOnWriteState(read_only=True)
+        snap._journal = self._journal.frozen_view()
+        self._cow = CopyOnWriteState()
+        return snap
+
+    def fork(self) -> "ASRGoTGraph":
+        """
+        Returns a writable, independent copy of the graph in O(1). Works like
+        snapshot(), except that both graphs may keep changing: each copies shared
+        containers and elements on its own first write. Forking a snapshot yields
+        a writable graph and leaves the snapshot untouched.
+        """
+        forked = self.model_copy()
+        forked.graph_metadata = dict(self.graph_metadata)
+        forked._cow = CopyOnWriteState()
+        forked._journal = self._journal.copy()
+        if not self.is_snapshot:
+            self._cow = CopyOnWriteState()
+        return forked
+
+    @property
+    def is_snapshot(self) -> bool:
+        cow = self._cow
+        return cow is not None and cow.read_only
+
+    def _prepare_write(self, *containers: str) -> None:
+        """Un-shares `containers` (all if none given) before they are mutated."""
+        cow = self._cow
+        if cow is None:
+            return
+        if cow.read_only:
+            raise RuntimeError(f"Graph snapshot {self.id} is read-only.")
+        for name in containers or ALL_CONTAINERS:
+            if name not in cow.shared_containers:
+                continue
+            if name == NODES:
+                self.nodes = dict(self.nodes)
+            elif name == EDGES:
+                self.edges = dict(self.edges)
+            elif name == HYPEREDGES:
+                self.hyperedges = dict(self.hyperedges)
+            elif name == LAYERS:
+                self.layers = {
+                    layer_id: set(node_ids) for layer_id, node_ids in self.layers.items()
+                }
+            elif name == INDEX:
+                self._index = self._index.copy()
+            elif name == NX_GRAPH:
+                self.nx_graph = self.nx_graph.copy()
+            cow.shared_containers.discard(name)
+
+    def _owned_node(self, node_id: str) -> Node:
+        """The node to mutate in place: copied first if a snapshot still shares it."""
+        node = self.nodes[node_id]
+        cow = self._cow
+        if cow is None or node_id in cow.owned_node_ids:
+            return node
+        self._prepare_write(NODES)
+        node = node.model_copy(deep=True)
+        self.nodes[node_id] = node
+        cow.owned_node_ids.add(node_id)
+        return node
+
+    def _owned_hyperedge(self, hyperedge_id: str) -> Hyperedge:
+        hyperedge = self.hyperedges[hyperedge_id]
+        cow = self._cow
+        if cow is None or hyperedge_id in cow.owned_hyperedge_ids:
+            return hyperedge
+        self._prepare_write(HYPEREDGES)
+        hyperedge = hyperedge.model_copy(deep=True)
+        self.hyperedges[hyperedge_id] = hyperedge
+        cow.owned_hyperedge_ids.add(hyperedge_id)
+        return hyperedge
+
+    def _unshared_removed_node(self, node: Node) -> Node:
+        """A removed node may still live in a snapshot; callers get their own copy."""
+        cow = self._cow
+        if cow is None or node.id in cow.owned_node_ids:
+            return node
+        return node.model_copy(deep=True)
+
+    # --- Mutation ---
+
     def add_node(self, node: Node) -> None:
-        if node.id in self.nodes:
+        self._prepare_write(NODES, INDEX, LAYERS, NX_GRAPH)
+        existing = self.nodes.get(node.id)
+        if existing is not None:
             logger.warning(f"Node with ID {node.id} already exists. Overwriting.")
+            self._index.replace_node(existing, node)
+            if not node.metadata.layer_id:  # A new layer is placed below
+                self._remove_from_layer(node.id)
+            self._journal.record(ElementKind.NODE, ChangeAction.UPDATED, node.id)
+        else:
+            self._index.index_node(node)
+            self._journal.record(ElementKind.NODE, ChangeAction.ADDED, node.id)
         self.nodes[node.id] = node
+        if self._cow is not None:
+            self._cow.owned_node_ids.add(node.id)
         # Add to NetworkX graph. Store essential data for quick access, or just the ID.
         # For simplicity, we can store the full Pydantic model dict, but be mindful of memory
         # if graphs are huge. Or, just store key attributes.
@@ -70,35 +343,219 @@ class ASRGoTGraph(TimestampedModel):
             self.assign_node_to_layer(node.id, node.metadata.layer_id)
         self.touch()
 
+    def add_nodes_bulk(self, nodes: Iterable[Node]) -> None:
+        """
+        Adds many nodes in one pass: a single nx_graph.add_nodes_from call,
+        direct layer placement, one log line and one touch() for the batch.
+        Indexes are kept consistent exactly as with add_node.
+        """
+        batch = list(nodes)
+        if not batch:
+            return
+        self._prepare_write(NODES, INDEX, LAYERS, NX_GRAPH)
+        index = self._index
+        journal = self._journal
+        nodes_by_id = self.nodes
+        overwritten = 0
+        for node in batch:
+            existing = nodes_by_id.get(node.id)
+            if existing is not None:
+                overwritten += 1
+                index.replace_node(existing, node)
+                if not node.metadata.layer_id:
+                    self._remove_from_layer(node.id, index)
+                journal.record(ElementKind.NODE, ChangeAction.UPDATED, node.id)
+            else:
+                index.index_node(node)
+                journal.record(ElementKind.NODE, ChangeAction.ADDED, node.id)
+            nodes_by_id[node.id] = node
+            if node.metadata.layer_id:
+                self._place_in_layer(node.id, node.metadata.layer_id, index)
+        if self._cow is not None:
+            self._cow.owned_node_ids.update(node.id for node in batch)
+        self.nx_graph.add_nodes_from(
+            (
+                node.id,
+                {
+                    "type": node.type.value,
+                    "label": node.label,
+                    "confidence": node.confidence.model_dump(),
+                },
+            )
+            for node in batch
+        )
+        if overwritten:
+            logger.warning(f"{overwritten} nodes in bulk insert already existed. Overwritten.")
+        logger.debug("Bulk-added {} nodes to graph.", len(batch))
+        self.touch()
+
     def get_node(self, node_id: str) -> Optional[Node]:
         return self.nodes.get(node_id)
 
+    def update_node_confidence(
+        self,
+        node_id: str,
+        new_confidence: ConfidenceVector,
+        updated_by: str,
+        reason: Optional[str] = None,
+    ) -> Node:
+        """
+        Node.update_confidence that also keeps the score columns in sync.
+        Returns the updated node, which is a fresh copy if a snapshot shared it.
+        """
+        if node_id not in self.nodes:
+            raise ValueError(f"Node {node_id} not found.")
+        self._prepare_write(NODES, INDEX)
+        node = self._owned_node(node_id)
+        node.update_confidence(
+            new_confidence,
+            updated_by=updated_by,
+            reason=reason,
+            revision_policy=self._revision_policy,
+            graph_id=self.id,
+        )
+        self._index.update_scores(node)
+        self._journal.record(ElementKind.NODE, ChangeAction.UPDATED, node_id)
+        self.touch()
+        return node
+
+    def update_node_metadata(
+        self,
+        node_id: str,
+        updated_by: str,
+        reason: Optional[str] = None,
+        **changes: Any,
+    ) -> Node:
+        """
+        Sets NodeMetadata fields of a node and records them in its revision
+        history as {field: [old, new]}. Tags and layers are indexed, so they
+        change through add_node_tags and assign_node_to_layer instead.
+        Returns the updated node, which is a fresh copy if a snapshot shared it.
+        """
+        if node_id not in self.nodes:
+            raise ValueError(f"Node {node_id} not found.")
+        indexed = {"disciplinary_tags", "layer_id"}.intersection(changes)
+        if indexed:
+            raise ValueError(
+                f"Cannot set indexed metadata fields {sorted(indexed)} directly."
+            )
+        self._prepare_write(NODES, INDEX)
+        node = self._owned_node(node_id)
+        changes_made = {}
+        for name, value in changes.items():
+            changes_made[name] = [getattr(node.metadata, name), value]
+            setattr(node.metadata, name, value)
+        self._record_revision(
+            node,
+            RevisionRecord(
+                user_or_process=updated_by,
+                action="update_metadata",
+                changes_made=changes_made,
+                reason=reason,
+            ),
+        )
+        self._index.update_scores(node)  # impact_score and statistical_power
+        node.touch()
+        self._journal.record(ElementKind.NODE, ChangeAction.UPDATED, node_id)
+        self.touch()
+        return node
+
+    def refresh_node_scores(self, node_id: str) -> None:
+        """
+        Re-reads a node's confidence, impact score and statistical power into the
+        score columns. Needed only after changing those fields on the Node directly.
+        """
+        node = self.get_node(node_id)
+        if node:
+            self._prepare_write(INDEX)
+            self._index.update_scores(node)
+            self._journal.record(ElementKind.NODE, ChangeAction.UPDATED, node_id)
+
     def remove_node(self, node_id: str) -> Optional[Node]:
-        node = self.nodes.pop(node_id, None)
+        """
+        Removes a node together with its incident edges, its hyperedge
+        memberships and its layer assignment. Cost is O(degree).
+        """
+        if node_id not in self.nodes:
+            return None
+        self._prepare_write()
+        node = self._detach_node(node_id)
         if node:
             if self.nx_graph.has_node(node_id):
-                self.nx_graph.remove_node(node_id)
-            # Also remove from any layers
-            for layer_name, node_ids_in_layer in list(self.layers.items()):
-                if node_id in node_ids_in_layer:
-                    node_ids_in_layer.remove(node_id)
-                    if not node_ids_in_layer:  # Remove layer if empty
-                        del self.layers[layer_name]
-            # TODO: Also handle removal of incident edges & hyperedges
-            logger.info(
-                f"Removed node ID: {node_id}. Further cleanup of edges/hyperedges might be needed."
-            )
+                self.nx_graph.remove_node(node_id)  # Also drops incident nx edges
+            logger.info(f"Removed node ID: {node_id} and its incident edges.")
             self.touch()
         return node
 
+    def remove_nodes(self, node_ids: Iterable[str]) -> List[Node]:
+        """Bulk, cascading version of remove_node. Returns the nodes actually removed."""
+        removed: List[Node] = []
+        self._prepare_write()
+        for node_id in node_ids:
+            node = self._detach_node(node_id)
+            if node:
+                removed.append(node)
+        if removed:
+            self.nx_graph.remove_nodes_from(node.id for node in removed)
+            logger.info(f"Removed {len(removed)} nodes and their incident edges.")
+            self.touch()
+        return removed
+
+    def _detach_node(self, node_id: str) -> Optional[Node]:
+        """
+        Drops a node and everything that references it from the domain dicts and
+        indexes. The caller is responsible for nx_graph, logging and touch().
+        """
+        node = self.nodes.pop(node_id, None)
+        if not node:
+            return None
+        index = self._index
+        journal = self._journal
+
+        # Incident edges (nx_graph drops its copies when the node is removed there)
+        incident_edge_ids = [*index.in_edge_ids(node_id), *index.out_edge_ids(node_id)]
+        for edge_id in incident_edge_ids:
+            edge = self.edges.pop(edge_id, None)
+            if edge:
+                index.unindex_edge(edge)
+                journal.record(ElementKind.EDGE, ChangeAction.REMOVED, edge_id)
+
+        # Hyperedges: shrink them, or drop those left with fewer than 2 nodes (P1.9)
+        for hyperedge_id in list(index.node_hyperedges.pop(node_id, ())):
+            hyperedge = self.hyperedges.get(hyperedge_id)
+            if not hyperedge:
+                continue
+            if len(hyperedge.node_ids) <= 2:
+                index.unindex_hyperedge(self.hyperedges.pop(hyperedge_id))
+                journal.record(ElementKind.HYPEREDGE, ChangeAction.REMOVED, hyperedge_id)
+            else:
+                hyperedge = self._owned_hyperedge(hyperedge_id)
+                hyperedge.node_ids.discard(node_id)
+                hyperedge.touch()
+                index.star_expansion = None
+                journal.record(ElementKind.HYPEREDGE, ChangeAction.UPDATED, hyperedge_id)
+
+        # Unindexed after its edges so the degree histogram sees its final degree
+        index.unindex_node(node)
+
+        self._remove_from_layer(node_id, index)
+        journal.record(ElementKind.NODE, ChangeAction.REMOVED, node_id)
+        return self._unshared_removed_node(node)
+
     def add_edge(self, edge: Edge) -> None:
-        if edge.id in self.edges:
-            logger.warning(f"Edge with ID {edge.id} already exists. Overwriting.")
         if edge.source_id not in self.nodes or edge.target_id not in self.nodes:
             raise ValueError(
                 f"Cannot add edge '{edge.id}': Source or target node does not exist."
             )
+        self._prepare_write(EDGES, INDEX, NX_GRAPH)
+        action = ChangeAction.ADDED
+        if edge.id in self.edges:
+            logger.warning(f"Edge with ID {edge.id} already exists. Overwriting.")
+            self._index.unindex_edge(self.edges[edge.id])
+            action = ChangeAction.UPDATED
+        self._journal.record(ElementKind.EDGE, action, edge.id)
         self.edges[edge.id] = edge
+        self._index.index_edge(edge)
         # Use edge.id as the key in MultiDiGraph for potentially multiple edges between nodes
         self.nx_graph.add_edge(
             edge.source_id,
@@ -113,12 +570,67 @@ class ASRGoTGraph(TimestampedModel):
         )
         self.touch()
 
+    def add_edges_bulk(self, edges: Iterable[Edge]) -> None:
+        """
+        Adds many edges in one pass. Endpoints are validated once for the whole
+        batch before anything is inserted, so a bad batch leaves the graph unchanged.
+        """
+        batch = list(edges)
+        if not batch:
+            return
+        missing = {
+            node_id
+            for edge in batch
+            for node_id in (edge.source_id, edge.target_id)
+            if node_id not in self.nodes
+        }
+        if missing:
+            raise ValueError(
+                f"Cannot bulk-add edges: source or target nodes do not exist: {sorted(missing)}"
+            )
+        self._prepare_write(EDGES, INDEX, NX_GRAPH)
+        index = self._index
+        journal = self._journal
+        edges_by_id = self.edges
+        overwritten = 0
+        for edge in batch:
+            existing = edges_by_id.get(edge.id)
+            if existing is not None:
+                overwritten += 1
+                index.unindex_edge(existing)
+                self.nx_graph.remove_edges_from(
+                    [(existing.source_id, existing.target_id, existing.id)]
+                )
+                journal.record(ElementKind.EDGE, ChangeAction.UPDATED, edge.id)
+            else:
+                journal.record(ElementKind.EDGE, ChangeAction.ADDED, edge.id)
+            edges_by_id[edge.id] = edge
+            index.index_edge(edge)
+        self.nx_graph.add_edges_from(
+            (
+                edge.source_id,
+                edge.target_id,
+                edge.id,
+                {"type": edge.type.value, "id": edge.id, "confidence": edge.confidence},
+            )
+            for edge in batch
+        )
+        if overwritten:
+            logger.warning(f"{overwritten} edges in bulk insert already existed. Overwritten.")
+        logger.debug("Bulk-added {} edges to graph.", len(batch))
+        self.touch()
+
     def get_edge(self, edge_id: str) -> Optional[Edge]:
         return self.edges.get(edge_id)
 
     def remove_edge(self, edge_id: str) -> Optional[Edge]:
+        if edge_id not in self.edges:
+            return None
+        self._prepare_write(EDGES, INDEX, NX_GRAPH)
         edge = self.edges.pop(edge_id, None)
         if edge:
+            self._index.unindex_edge(edge)
+            self._journal.record(ElementKind.EDGE, ChangeAction.REMOVED, edge_id)
             if self.nx_graph.has_edge(edge.source_id, edge.target_id, key=edge_id):
                 self.nx_graph.remove_edge(edge.source_id, edge.target_id, key=edge_id)
             logger.info(f"Removed edge ID: {edge_id}.")
@@ -135,7 +647,16 @@ class ASRGoTGraph(TimestampedModel):
                 raise ValueError(
                     f"Cannot add hyperedge '{hyperedge.id}': Node {node_id} does not exist."
                 )
+        self._prepare_write(HYPEREDGES, INDEX)
+        action = ChangeAction.ADDED
+        if hyperedge.id in self.hyperedges:
+            self._index.unindex_hyperedge(self.hyperedges[hyperedge.id])
+            action = ChangeAction.UPDATED
+        self._journal.record(ElementKind.HYPEREDGE, action, hyperedge.id)
         self.hyperedges[hyperedge.id] = hyperedge
+        self._index.index_hyperedge(hyperedge)
+        if self._cow is not None:
+            self._cow.owned_hyperedge_ids.add(hyperedge.id)
         # Representation in nx_graph for hyperedges can be tricky.
         # Common approaches:
         # 1. Star graph: Create a central "hyperedge node" and connect all involved nodes to it.
@@ -150,38 +671,389 @@ class ASRGoTGraph(TimestampedModel):
         return self.hyperedges.get(hyperedge_id)
 
     def remove_hyperedge(self, hyperedge_id: str) -> Optional[Hyperedge]:
+        if hyperedge_id not in self.hyperedges:
+            return None
+        self._prepare_write(HYPEREDGES, INDEX)
         hyperedge = self.hyperedges.pop(hyperedge_id, None)
         if hyperedge:
+            self._index.unindex_hyperedge(hyperedge)
+            self._journal.record(ElementKind.HYPEREDGE, ChangeAction.REMOVED, hyperedge_id)
             logger.info(f"Removed hyperedge ID: {hyperedge_id}.")
             self.touch()
         return hyperedge
 
-    def assign_node_to_layer(self, node_id: str, layer_id: str):
-        if node_id not in self.nodes:
-            raise ValueError(f"Node {node_id} not found.")
+    def hyperedges_of(self, node_id: str) -> List[Hyperedge]:
+        """Hyperedges that include `node_id` (P1.9). O(k) in the number returned."""
+        hyperedge_ids = self._index.node_hyperedges.get(node_id, ())
+        return [self.hyperedges[hid] for hid in hyperedge_ids]
+
+    def hyperedge_neighbors(self, node_id: str) -> Set[str]:
+        """IDs of nodes sharing at least one hyperedge with `node_id`."""
+        neighbor_ids: Set[str] = set()
+        for hyperedge in self.hyperedges_of(node_id):
+            neighbor_ids.update(hyperedge.node_ids)
+        neighbor_ids.discard(node_id)
+        return neighbor_ids
+
+    def star_expansion(self) -> nx.Graph:
+        """
+        Star expansion of the hyperedges as a bipartite nx.Graph: every hyperedge
+        becomes a vertex (attribute kind="hyperedge") joined to each member node
+        (kind="node"). Only nodes that belong to some hyperedge appear.
+
+        Built on first use and cached until a hyperedge changes. The returned
+        graph is frozen; copy it before modifying.
+        """
+        if self._index.star_expansion is None:
+            star = nx.Graph()
+            for hyperedge in self.hyperedges.values():
+                star.add_node(hyperedge.id, kind="hyperedge")
+                for node_id in hyperedge.node_ids:
+                    star.add_node(node_id, kind="node")
+                    star.add_edge(hyperedge.id, node_id)
+            self._index.star_expansion = nx.freeze(star)
+        return self._index.star_expansion
+
+    def ensure_layer(self, layer_id: str) -> Set[str]:
+        """Returns the node ID set of `layer_id`, creating an empty layer if needed."""
         if layer_id not in self.layers:
+            self._prepare_write(LAYERS)
             self.layers[layer_id] = set()
+            self._journal.record(ElementKind.LAYER, ChangeAction.ADDED, layer_id)
             logger.info(f"Created new layer: {layer_id}")
-        self.layers[layer_id].add(node_id)
+        return self.layers[layer_id]
+
+    def assign_node_to_layer(self, node_id: str, layer_id: str):
+        if node_id not in self.nodes:
+            raise ValueError(f"Node {node_id} not found.")
+        self._prepare_write(NODES, LAYERS, INDEX)
+        self._place_in_layer(node_id, layer_id)
         # Update node's metadata as well
+        node = self._owned_node(node_id)
+        node.metadata.layer_id = layer_id
+        node.touch()
+        self._journal.record(ElementKind.NODE, ChangeAction.UPDATED, node_id)
+        self.touch()
+
+    def _place_in_layer(
+        self, node_id: str, layer_id: str, index: Optional[GraphIndexes] = None
+    ) -> None:
+        """Moves a node into `layer_id` in the layer index only (no touch)."""
+        index = index or self._index
+        node_layer = index.node_layer
+        previous_layer_id = node_layer.get(node_id)
+        if previous_layer_id is not None and previous_layer_id != layer_id:
+            # A node belongs to a single layer (NodeMetadata.layer_id)
+            self._remove_from_layer(node_id, index)
+        node_ids_in_layer = self.layers.get(layer_id)
+        if node_ids_in_layer is None:
+            node_ids_in_layer = self.ensure_layer(layer_id)
+        node_ids_in_layer.add(node_id)
+        node_layer[node_id] = layer_id
+        index.layer_vocabulary.intern(layer_id)
+
+    def _remove_from_layer(self, node_id: str, index: Optional[GraphIndexes] = None) -> None:
+        """Takes a node out of its layer in the layer index, dropping the layer if it empties."""
+        index = index or self._index
+        layer_id = index.node_layer.pop(node_id, None)
+        if layer_id is not None and layer_id in self.layers:
+            node_ids_in_layer = self.layers[layer_id]
+            node_ids_in_layer.discard(node_id)
+            if not node_ids_in_layer:  # Remove layer if empty
+                del self.layers[layer_id]
+                self._journal.record(ElementKind.LAYER, ChangeAction.REMOVED, layer_id)
+
+    def add_node_tags(self, node_id: str, tags: Iterable[str]) -> None:
+        """Adds disciplinary tags to a node, keeping the tag index in sync."""
         node = self.get_node(node_id)
-        if node:
-            node.metadata.layer_id = layer_id
-            node.touch()
+        if not node:
+            raise ValueError(f"Node {node_id} not found.")
+        new_tags = set(tags) - node.metadata.disciplinary_tags
+        if not new_tags:
+            return
+        self._prepare_write(NODES, INDEX)
+        node = self._owned_node(node_id)
+        node.metadata.disciplinary_tags.update(new_tags)
+        index = self._index
+        for tag in new_tags:
+            index.nodes_by_tag.setdefault(tag, {})[node_id] = None
+        index.add_tag_mask(node_id, index.tag_vocabulary.mask(new_tags))
+        node.touch()
+        self._journal.record(ElementKind.NODE, ChangeAction.UPDATED, node_id)
         self.touch()
 
+    # --- Index queries ---
+
+    def node_ids_of_type(self, *node_types: NodeType) -> Set[str]:
+        """IDs of all nodes whose type is any of `node_types`."""
+        return {
+            node_id
+            for node_type in node_types
+            for node_id in self._index.nodes_by_type.get(node_type, ())
+        }
+
+    def nodes_of_type(self, *node_types: NodeType) -> List[Node]:
+        """Nodes whose type is any of `node_types`, in insertion order per type."""
+        return [
+            self.nodes[node_id]
+            for node_type in node_types
+            for node_id in self._index.nodes_by_type.get(node_type, ())
+        ]
+
+    def count_nodes_of_type(self, *node_types: NodeType) -> int:
+        return sum(len(self._index.nodes_by_type.get(t, ())) for t in node_types)
+
+    def edge_ids_of_type(self, *edge_types: EdgeType) -> Set[str]:
+        """IDs of all edges whose type is any of `edge_types`."""
+        return {
+            edge_id
+            for edge_type in edge_types
+            for edge_id in self._index.edges_by_type.get(edge_type, ())
+        }
+
+    def edges_of_type(self, *edge_types: EdgeType) -> List[Edge]:
+        """Edges whose type is any of `edge_types`, in insertion order per type."""
+        return [
+            self.edges[edge_id]
+            for edge_type in edge_types
+            for edge_id in self._index.edges_by_type.get(edge_type, ())
+        ]
+
+    def node_ids_in_layers(self, *layer_ids: str) -> Set[str]:
+        """IDs of all nodes assigned to any of `layer_ids` (P1.23)."""
+        return {
+            node_id
+            for layer_id in layer_ids
+            for node_id in self.layers.get(layer_id, ())
+        }
+
+    def node_ids_with_any_tag(self, tags: Iterable[str]) -> Set[str]:
+        """IDs of all nodes carrying at least one of `tags` (P1.8)."""
+        nodes_by_tag = self._index.nodes_by_tag
+        return {node_id for tag in tags for node_id in nodes_by_tag.get(tag, ())}
+
+    # --- Integer handles (see id_table.py) ---
+
+    def node_handle(self, node_id: str) -> Optional[int]:
+        """
+        Dense integer ID of a node (None if absent), as used by the indexes and
+        score arrays. Valid only while the node is in the graph: handles of
+        removed nodes are reused.
+        """
+        return self._index.node_handles.get(node_id)
+
+    def node_id_of_handle(self, handle: int) -> str:
+        return self._index.node_handles.string(handle)
+
+    def edge_handle(self, edge_id: str) -> Optional[int]:
+        """Dense integer ID of an edge (None if absent); see node_handle()."""
+        return self._index.edge_handles.get(edge_id)
+
+    def edge_id_of_handle(self, handle: int) -> str:
+        return self._index.edge_handles.string(handle)
+
+    # --- Interned tags and layers (bitmasks, see vocabulary.py) ---
+
+    def tag_mask(self, tags: Iterable[str]) -> int:
+        """Bitmask of `tags`; tags no node ever carried contribute no bits."""
+        return self._index.tag_vocabulary.query_mask(tags)
+
+    def node_tag_mask(self, node_id: str) -> int:
+        """Bitmask of the node's disciplinary tags (0 if none or unknown)."""
+        return self._index.tag_mask(node_id)
+
+    def tags_from_mask(self, mask: int) -> Set[str]:
+        """The tag strings of a tag bitmask, e.g. for storing on a node or responding."""
+        return self._index.tag_vocabulary.strings(mask)
+
+    def nodes_share_tag(self, node_id_a: str, node_id_b: str) -> bool:
+        index = self._index
+        return bool(index.tag_mask(node_id_a) & index.tag_mask(node_id_b))
+
+    def layer_mask(self, layer_ids: Iterable[str]) -> int:
+        """Bitmask of `layer_ids`; layers never created contribute no bits."""
+        return self._index.layer_vocabulary.query_mask(layer_ids)
+
+    def node_layer_mask(self, node_id: str) -> int:
+        """Single-bit mask of the node's layer (0 if it has none)."""
+        index = self._index
+        layer_id = index.node_layer.get(node_id)
+        if layer_id is None:
+            return 0
+        return 1 << index.layer_vocabulary.intern(layer_id)
+
+    def node_scores(self, node_ids: Optional[Iterable[str]] = None) -> NodeScores:
+        """
+        Confidence (n x 4), impact and statistical-power arrays for `node_ids`
+        (all nodes if None), for vectorized filtering. Unknown IDs are skipped.
+        """
+        return self._index.select_scores(node_ids)
+
+    def out_edges(self, node_id: str) -> List[Edge]:
+        """Edges whose source is `node_id`. O(out-degree)."""
+        return [self.edges[eid] for eid in self._index.out_edge_ids(node_id)]
+
+    def in_edges(self, node_id: str) -> List[Edge]:
+        """Edges whose target is `node_id`. O(in-degree)."""
+        return [self.edges[eid] for eid in self._index.in_edge_ids(node_id)]
+
+    def find_edges(
+        self, source_id: str, target_id: str, edge_type: Optional[EdgeType] = None
+    ) -> List[Edge]:
+        """Edges from `source_id` to `target_id`, optionally restricted to one type."""
+        if edge_type is not None:
+            key = (source_id, target_id, edge_type)
+            edge_ids = self._index.edges_by_key.get(key, ())
+            return [self.edges[eid] for eid in edge_ids]
+        return [e for e in self.out_edges(source_id) if e.target_id == target_id]
+
+    def has_edge_of_type(
+        self, source_id: str, target_id: str, edge_type: EdgeType
+    ) -> bool:
+        return (source_id, target_id, edge_type) in self._index.edges_by_key
+
+    def merge_nodes(
+        self,
+        keep_id: str,
+        drop_id: str,
+        policy: MergePolicy = MergePolicy.MAX,
+        merged_by: str = "ASRGoTGraph",
+        reason: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> Node:
+        """
+        Merges node `drop_id` into node `keep_id` (P1.5) and removes `drop_id`.
+
+        Only the dropped node's incident edges and hyperedges are visited, so the
+        cost is O(degree(drop_id)). Each edge is re-pointed at `keep_id` unless an edge
+        of the same type already links the same endpoints; edges between the two
+        merged nodes are dropped rather than turned into self-loops. Tags and
+        descriptions are combined, and confidence is combined per `policy`.
+        """
+        if keep_id == drop_id:
+            raise ValueError(f"Cannot merge node {keep_id} into itself.")
+        keep_node = self.get_node(keep_id)
+        drop_node = self.get_node(drop_id)
+        if not keep_node or not drop_node:
+            raise ValueError(
+                f"Cannot merge '{drop_id}' into '{keep_id}': node does not exist."
+            )
+        self._prepare_write()
+        keep_node = self._owned_node(keep_id)
+
+        index = self._index
+        incident_edge_ids = dict.fromkeys(
+            [*index.in_edge_ids(drop_id), *index.out_edge_ids(drop_id)]
+        )
+        edges_rewired = 0
+        for edge_id in incident_edge_ids:
+            edge = self.remove_edge(edge_id)
+            if not edge:
+                continue
+            source_id = keep_id if edge.source_id == drop_id else edge.source_id
+            target_id = keep_id if edge.target_id == drop_id else edge.target_id
+            if source_id == target_id or self.has_edge_of_type(
+                source_id, target_id, edge.type
+            ):
+                continue
+            # Same ID, own copy of the metadata
+            rewired = edge.model_copy(
+                update={"source_id": source_id, "target_id": target_id}, deep=True
+            )
+            rewired.touch()
+            self.add_edge(rewired)
+            edges_rewired += 1
+
+        # Hyperedges containing the dropped node now contain the kept node
+        for hyperedge_id in list(index.node_hyperedges.get(drop_id, ())):
+            hyperedge = self._owned_hyperedge(hyperedge_id)
+            index.unindex_hyperedge(hyperedge)
+            hyperedge.node_ids.discard(drop_id)
+            hyperedge.node_ids.add(keep_id)
+            if len(hyperedge.node_ids) < 2:
+                del self.hyperedges[hyperedge_id]
+                self._journal.record(
+                    ElementKind.HYPEREDGE, ChangeAction.REMOVED, hyperedge_id
+                )
+                continue
+            hyperedge.touch()
+            index.index_hyperedge(hyperedge)
+            self._journal.record(ElementKind.HYPEREDGE, ChangeAction.UPDATED, hyperedge_id)
+
+        self.add_node_tags(keep_id, drop_node.metadata.disciplinary_tags)
+        if drop_node.metadata.description:
+            keep_node.metadata.description = (
+                (keep_node.metadata.description or "")
+                + f"\nMerged content from {drop_id}: {drop_node.metadata.description}"
+            )
+        keep_node.confidence = _combine_confidence(
+            keep_node.confidence, drop_node.confidence, policy
+        )
+        self._index.update_scores(keep_node)
+        self._record_revision(
+            keep_node,
+            RevisionRecord(
+                user_or_process=merged_by,
+                action="merged_node_into_this",
+                changes_made={
+                    "merged_from_id": drop_id,
+                    "policy": policy.value,
+                    "edges_rewired": edges_rewired,
+                    **(details or {}),
+                },
+                reason=reason,
+            ),
+        )
+        keep_node.touch()
+        self._journal.record(ElementKind.NODE, ChangeAction.UPDATED, keep_id)
+        self.remove_node(drop_id)
+        return keep_node
+
     def get_statistics(self) -> GraphStatistics:
-        return GraphStatistics(
-            node_count=len(self.nodes),
+        """
+        Graph-wide counts, degree histogram and mean confidence. The underlying
+        counters are maintained by every mutation and the result is cached per
+        graph version, so repeated calls are O(1). Treat the result as read-only.
+        """
+        journal = self._journal
+        cached = journal.cached_statistics
+        if cached is not None and cached[0] == journal.version:
+            return cached[1]
+        index = self._index
+        node_count = len(self.nodes)
+        mean_confidence = (
+            (index.scores.confidence_sum / node_count).tolist()
+            if node_count
+            else [0.0] * 4
+        )
+        statistics = GraphStatistics(
+            node_count=node_count,
             edge_count=len(self.edges),
             hyperedge_count=len(self.hyperedges),
             layer_count=len(self.layers),
+            nodes_by_type={t.value: len(ids) for t, ids in index.nodes_by_type.items()},
+            edges_by_type={t.value: len(ids) for t, ids in index.edges_by_type.items()},
+            nodes_by_layer={
+                layer_id: len(node_ids) for layer_id, node_ids in self.layers.items()
+            },
+            degree_histogram=dict(sorted(index.degree_histogram.items())),
+            mean_confidence=mean_confidence,
+            mean_average_confidence=sum(mean_confidence) / 4.0,
         )
+        journal.cached_statistics = (journal.version, statistics)
+        return statistics
 
-    def get_neighbors(self, node_id: str) -> List[str]:
+    def get_neighbors(self, node_id: str, include_hyperedges: bool = False) -> List[str]:
+        """Successors of `node_id`; with include_hyperedges, also its hyperedge co-members."""
         if node_id not in self.nx_graph:
             return []
-        return list(self.nx_graph.neighbors(node_id))
+        neighbors = list(self.nx_graph.neighbors(node_id))
+        if include_hyperedges:
+            seen = set(neighbors)
+            neighbors.extend(
+                n for n in sorted(self.hyperedge_neighbors(node_id)) if n not in seen
+            )
+        return neighbors
 
     def get_predecessors(self, node_id: str) -> List[str]:
         if node_id not in self.nx_graph:
@@ -197,15 +1069,10 @@ class ASRGoTGraph(TimestampedModel):
         """Converts graph to a dict suitable for API responses (like GraphStateSchema)"""
         return {
             "id": self.id,
-            "nodes": [
-                node.model_dump(exclude_none=True) for node in self.nodes.values()
-            ],
-            "edges": [
-                edge.model_dump(exclude_none=True) for edge in self.edges.values()
-            ],
-            "hyperedges": [
-                h.model_dump(exclude_none=True) for h in self.hyperedges.values()
-            ],
+            # Cached per element until it changes; see SerializationCachedModel
+            "nodes": [node.cached_dump() for node in self.nodes.values()],
+            "edges": [edge.cached_dump() for edge in self.edges.values()],
+            "hyperedges": [h.cached_dump() for h in self.hyperedges.values()],
             "layers": {name: list(node_ids) for name, node_ids in self.layers.items()},
             "graph_metadata": self.graph_metadata,
             "statistics": self.get_statistics().model_dump(),
@@ -213,6 +1080,37 @@ class ASRGoTGraph(TimestampedModel):
             "updated_at": self.updated_at.isoformat(),
         }
 
+    def iter_ndjson(self, batch_size: int = 256) -> Iterator[str]:
+        """
+        Streams the graph as NDJSON, `batch_size` records per yielded chunk:
+        one "graph" header record, then one record per node, edge, hyperedge
+        and layer, each serialized straight to JSON (no intermediate dicts).
+
+        Iterates over a snapshot taken now, so the graph may keep changing while
+        the stream is consumed. Suitable for a FastAPI StreamingResponse. Once
+        the stream is exhausted or closed the snapshot is released: the graph
+        stops copying on write again, unless another snapshot or fork of it
+        was taken meanwhile.
+        """
+        previous_cow = self._cow
+        snapshot = self.snapshot()
+        return self._iter_released_ndjson(snapshot, previous_cow, self._cow, batch_size)
+
+    def _iter_released_ndjson(
+        self,
+        snapshot: "ASRGoTGraph",
+        previous_cow: Optional[CopyOnWriteState],
+        snapshot_cow: Optional[CopyOnWriteState],
+        batch_size: int,
+    ) -> Iterator[str]:
+        try:
+            yield from _iter_ndjson_chunks(snapshot, batch_size)
+        finally:
+            # snapshot() and fork() replace _cow; if it is still the state our
+            # snapshot installed, nothing else shares containers taken since
+            if self._cow is snapshot_cow:
+                self._cow = previous_cow
+
     # In Pydantic v2, model_rebuild is used if you dynamically add fields to models,
     # but for managing the graph structure, manual updates to nx_graph are fine.
     # We need to ensure nx_graph is not directly part of serialization if it becomes too complex.
@@ -220,3 +1118,52 @@ class ASRGoTGraph(TimestampedModel):
 
     class Config:
         arbitrary_types_allowed = True  # For NetworkX graph object
+
+
+def _combine_confidence(
+    keep: ConfidenceVector, drop: ConfidenceVector, policy: MergePolicy
+) -> ConfidenceVector:
+    if policy == MergePolicy.KEEP:
+        return keep
+    pairs = zip(keep.to_list(), drop.to_list(), strict=True)
+    if policy == MergePolicy.MEAN:
+        combined = [(a + b) / 2.0 for a, b in pairs]
+    else:
+        combined = [max(a, b) for a, b in pairs]
+    return ConfidenceVector.from_list(combined)
+
+
+def _iter_ndjson_chunks(graph: ASRGoTGraph, batch_size: int) -> Iterator[str]:
+    lines: List[str] = []
+    for line in _iter_ndjson_lines(graph):
+        lines.append(line)
+        if len(lines) >= batch_size:
+            yield "".join(lines)
+            lines.clear()
+    if lines:
+        yield "".join(lines)
+
+
+def _iter_ndjson_lines(graph: ASRGoTGraph) -> Iterator[str]:
+    header = {
+        "record": "graph",
+        "id": graph.id,
+        "version": graph.version,
+        "graph_metadata": graph.graph_metadata,
+        "statistics": graph.get_statistics().model_dump(),
+        "created_at": graph.created_at.isoformat(),
+        "updated_at": graph.updated_at.isoformat(),
+    }
+    yield json.dumps(header, default=str) + "\n"
+    for node in graph.nodes.values():
+        yield '{"record":"node","data":' + node.cached_dump_json() + "}\n"
+    for edge in graph.edges.values():
+        yield '{"record":"edge","data":' + edge.cached_dump_json() + "}\n"
+    for hyperedge in graph.hyperedges.values():
+        yield (
+            '{"record":"hyperedge","data":'
+            + hyperedge.cached_dump_json()
+            + "}\n"
+        )
+    for layer_id, node_ids in graph.layers.items():
+        yield json.dumps({"record": "layer", "id": layer_id, "node_ids": list(node_ids)}) + "\n"
@@ -0,0 +1,77 @@
+"""
+Dense integer handles for the string IDs of graph elements.
+
+ASRGoTGraph keys its public containers by string ID (`node-<uuid4>`,
+`ev_<hypothesis id>_<i>_<j>`, ...), which grow long and are slow to hash.
+Internally the indexes key nodes and edges by small integers instead, so
+adjacency, tag masks and score columns are plain lists/arrays indexed by handle.
+Strings are looked up only when results leave the index.
+
+Handles of released IDs are reused, so a handle is only meaningful while its
+element is in the graph.
+"""
+
+from typing import Dict, Iterator, List, Optional
+
+
+class IdTable:
+    __slots__ = ("_free", "handle_of", "strings")
+
+    def __init__(self) -> None:
+        # String ID -> handle, in acquisition order (like the graph's own dicts)
+        self.handle_of: Dict[str, int] = {}
+        # Handle -> string ID; None for free handles
+        self.strings: List[Optional[str]] = []
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.handle_of)
+
+    def __contains__(self, string_id: str) -> bool:
+        return string_id in self.handle_of
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.handle_of)
+
+    @property
+    def capacity(self) -> int:
+        """One more than the highest handle ever assigned."""
+        return len(self.strings)
+
+    def get(self, string_id: str) -> Optional[int]:
+        return self.handle_of.get(string_id)
+
+    def acquire(self, string_id: str) -> int:
+        """The handle of `string_id`, assigning a free one if it has none."""
+        handle = self.handle_of.get(string_id)
+        if handle is not None:
+            return handle
+        if self._free:
+            handle = self._free.pop()
+            self.strings[handle] = string_id
+        else:
+            handle = len(self.strings)
+            self.strings.append(string_id)
+        self.handle_of[string_id] = handle
+        return handle
+
+    def release(self, string_id: str) -> Optional[int]:
+        """Frees the handle of `string_id` for reuse; returns it, or None if unknown."""
+        handle = self.handle_of.pop(string_id, None)
+        if handle is not None:
+            self.strings[handle] = None
+            self._free.append(handle)
+        return handle
+
+    def string(self, handle: int) -> str:
+        string_id = self.strings[handle]
+        if string_id is None:
+            raise KeyError(f"Handle {handle} is not assigned.")
+        return string_id
+
+    def copy(self) -> "IdTable":
+        copied = IdTable()
+        copied.handle_of = dict(self.handle_of)
+        copied.strings = list(self.strings)
+        copied._free = list(self._free)
+        return copied
@@ -0,0 +1,120 @@
+"""
+Columnar store for the numeric node scores of ASRGoTGraph.
+
+Confidence vectors (P1.5), impact scores (P1.28) and statistical power (P1.26)
+are mirrored into NumPy arrays, one row per node handle, so graph-wide filters
+such as "min confidence component < X and impact < Y" run as vectorized masks
+instead of attribute lookups on every Node model.
+"""
+
+import math
+from typing import List, NamedTuple
+
+import numpy as np
+
+from .graph_elements import Node
+
+_INITIAL_CAPACITY = 64
+
+
+class NodeScores(NamedTuple):
+    """
+    Scores of a selection of nodes; row i of every array belongs to node_ids[i].
+    Missing impact scores read as 0.0 and missing statistical power as NaN.
+    """
+
+    node_ids: List[str]
+    confidence: np.ndarray  # shape (n, 4), ConfidenceVector.to_list() order
+    impact: np.ndarray  # shape (n,)
+    power: np.ndarray  # shape (n,)
+
+    @property
+    def average_confidence(self) -> np.ndarray:
+        return self.confidence.sum(axis=1) / 4.0
+
+    @property
+    def min_confidence(self) -> np.ndarray:
+        return self.confidence.min(axis=1)
+
+    def ids_where(self, mask: np.ndarray) -> List[str]:
+        """Node IDs for which `mask` is true, in selection order."""
+        return [self.node_ids[i] for i in np.flatnonzero(mask)]
+
+
+class NodeScoreColumns:
+    """
+    Score arrays indexed by node handle (see id_table.py). Handles of removed
+    nodes are reused, so the arrays only ever grow to the peak node count.
+    """
+
+    __slots__ = (
+        "confidence",
+        "confidence_sum",
+        "impact",
+        "live",
+        "power",
+    )
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY) -> None:
+        self.confidence = np.zeros((capacity, 4), dtype=np.float64)
+        self.impact = np.zeros(capacity, dtype=np.float64)
+        self.power = np.full(capacity, np.nan, dtype=np.float64)
+        # Rows currently holding a node's scores
+        self.live = np.zeros(capacity, dtype=bool)
+        # Running per-component sum over live rows, for O(1) mean confidence
+        self.confidence_sum = np.zeros(4, dtype=np.float64)
+
+    def upsert(self, row: int, node: Node) -> None:
+        """Writes the current scores of `node` into `row`, its handle."""
+        if row >= len(self.impact):
+            self._grow(max(2 * len(self.impact), row + 1, _INITIAL_CAPACITY))
+        if self.live[row]:
+            self.confidence_sum -= self.confidence[row]
+        else:
+            self.live[row] = True
+        confidence = node.confidence
+        self.confidence[row] = (
+            confidence.empirical_support,
+            confidence.theoretical_basis,
+            confidence.methodological_rigor,
+            confidence.consensus_alignment,
+        )
+        self.confidence_sum += self.confidence[row]
+        metadata = node.metadata
+        self.impact[row] = metadata.impact_score or 0.0
+        power = metadata.statistical_power
+        self.power[row] = power.value if power is not None else math.nan
+
+    def remove(self, row: int) -> None:
+        if row < len(self.live) and self.live[row]:
+            self.confidence_sum -= self.confidence[row]
+            self.live[row] = False
+
+    def select(self, node_ids: List[str], rows: np.ndarray) -> NodeScores:
+        """Gathers the scores of `rows`, the handles of `node_ids`."""
+        return NodeScores(
+            node_ids=node_ids,
+            confidence=self.confidence[rows],
+            impact=self.impact[rows],
+            power=self.power[rows],
+        )
+
+    def copy(self) -> "NodeScoreColumns":
+        copied = NodeScoreColumns(capacity=0)
+        copied.confidence = self.confidence.copy()
+        copied.impact = self.impact.copy()
+        copied.power = self.power.copy()
+        copied.live = self.live.copy()
+        copied.confidence_sum = self.confidence_sum.copy()
+        return copied
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - len(self.impact)
+        self.confidence = np.vstack(
+            [self.confidence, np.zeros((extra, 4), dtype=np.float64)]
+        )
+        self.impact = np.concatenate([self.impact, np.zeros(extra, dtype=np.float64)])
+        self.power = np.concatenate(
+            [self.power, np.full(extra, np.nan, dtype=np.float64)]
+        )
+        self.live = np.concatenate([self.live, np.zeros(extra, dtype=bool)])
@@ -0,0 +1,155 @@
+"""
+Retention of element revision histories (P1.12).
+
+Every confidence update appends a RevisionRecord to the node's
+metadata.revision_history, which is serialized with the node. A RevisionPolicy
+bounds that inline history; it applies to records added from then on:
+
+- "all": keep every record (the behavior without a policy)
+- "last_n": keep the newest `max_entries` records
+- "none": add no further records inline (records already there stay)
+- "sampled": once more than `max_entries` records accumulate, drop every other
+  one (keeping the oldest and the newest), so the kept records stay spread
+  over the whole life of the element
+
+With an audit log, every record is also appended to a JSON Lines file, so the
+full history survives whatever the inline history drops and is only read back
+when asked for (RevisionAuditLog.records_for). Records written before the log
+was attached exist only inline; merge_histories combines the two.
+"""
+
+import json
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .common import ConfidenceVector
+from .graph_elements import RevisionRecord
+
+
+class RevisionRetention(str, Enum):
+    ALL = "all"
+    LAST_N = "last_n"
+    NONE = "none"
+    SAMPLED = "sampled"
+
+
+def confidence_delta(
+    old: ConfidenceVector, new: ConfidenceVector
+) -> Dict[str, List[float]]:
+    """
+    Compact encoding of a confidence change: component index (as in
+    ConfidenceVector.to_list()) -> [old, new], for changed components only.
+    """
+    return {
+        str(i): [old_value, new_value]
+        for i, (old_value, new_value) in enumerate(zip(old.to_list(), new.to_list(), strict=True))
+        if old_value != new_value
+    }
+
+
+def _record_key(record: RevisionRecord) -> str:
+    return json.dumps(record.model_dump(mode="json", exclude_none=True), sort_keys=True)
+
+
+def merge_histories(
+    inline: List[RevisionRecord], logged: List[RevisionRecord]
+) -> List[RevisionRecord]:
+    """
+    An element's inline records plus its audit-log records, oldest first, with
+    records found in both returned once.
+    """
+    logged_keys = {_record_key(record) for record in logged}
+    merged = [record for record in inline if _record_key(record) not in logged_keys]
+    if not merged:
+        return logged
+    merged.extend(logged)
+    merged.sort(key=lambda record: record.timestamp)  # Stable: ties keep inline first
+    return merged
+
+
+class RevisionAuditLog:
+    """Append-only JSON Lines file holding the complete revision history."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def append(self, graph_id: Optional[str], element_id: str, record: RevisionRecord) -> None:
+        line = json.dumps(
+            {
+                "graph_id": graph_id,
+                "element_id": element_id,
+                "record": record.model_dump(mode="json", exclude_none=True),
+            }
+        )
+        with self._lock, self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def records_for(
+        self, element_id: str, graph_id: Optional[str] = None
+    ) -> List[RevisionRecord]:
+        """All logged records of an element (optionally of one graph), oldest first."""
+        if not self.path.exists():
+            return []
+        records = []
+        with self._lock, self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if element_id not in line:  # Cheap pre-filter before parsing
+                    continue
+                entry: Dict[str, Any] = json.loads(line)
+                if entry["element_id"] != element_id:
+                    continue
+                if graph_id is not None and entry["graph_id"] != graph_id:
+                    continue
+                records.append(RevisionRecord(**entry["record"]))
+        return records
+
+
+class RevisionPolicy:
+    __slots__ = ("audit_log", "max_entries", "retention")
+
+    def __init__(
+        self,
+        retention: RevisionRetention = RevisionRetention.ALL,
+        max_entries: int = 10,
+        audit_log: Optional[RevisionAuditLog] = None,
+    ):
+        self.retention = RevisionRetention(retention)
+        self.max_entries = max(1, max_entries)
+        self.audit_log = audit_log
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "RevisionPolicy":
+        return self  # Configuration plus an external log: shared by graph copies
+
+    @classmethod
+    def from_settings(cls, history_settings) -> "RevisionPolicy":
+        audit_log_path = history_settings.audit_log_path
+        return cls(
+            retention=history_settings.retention,
+            max_entries=history_settings.max_entries,
+            audit_log=RevisionAuditLog(audit_log_path) if audit_log_path else None,
+        )
+
+    def record(
+        self,
+        history: List[RevisionRecord],
+        record: RevisionRecord,
+        element_id: str,
+        graph_id: Optional[str] = None,
+    ) -> None:
+        """Adds `record` to the inline `history` (in place) as the policy allows."""
+        if self.audit_log is not None:
+            self.audit_log.append(graph_id, element_id, record)
+        retention = self.retention
+        if retention is RevisionRetention.NONE:
+            return
+        history.append(record)
+        if retention is RevisionRetention.ALL or len(history) <= self.max_entries:
+            return
+        if retention is RevisionRetention.LAST_N:
+            del history[: len(history) - self.max_entries]
+        else:  # SAMPLED
+            history[:] = [*history[:-1:2], history[-1]]
@@ -0,0 +1,82 @@
+"""
+Interned string vocabularies for ASRGoTGraph (disciplinary tags, layer IDs).
+
+Each distinct string gets a small integer ID on first use, and a set of
+strings is stored as an int bitmask with bit `ID` set per member, so tag
+intersection tests are a single AND. IDs are never reassigned or removed, so a
+vocabulary can be shared by a graph and all of its snapshots and forks.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class Vocabulary:
+    __slots__ = ("_ids", "_lock", "_strings")
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Vocabulary":
+        copied = Vocabulary()
+        copied._ids = dict(self._ids)
+        copied._strings = list(self._strings)
+        return copied
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._ids
+
+    def intern(self, value: str) -> int:
+        """The ID of `value`, assigning the next free one if it is new."""
+        value_id = self._ids.get(value)
+        if value_id is not None:
+            return value_id
+        with self._lock:  # Shared between graphs that may be written concurrently
+            value_id = self._ids.get(value)
+            if value_id is None:
+                value_id = len(self._strings)
+                self._strings.append(value)
+                self._ids[value] = value_id
+        return value_id
+
+    def id_of(self, value: str) -> Optional[int]:
+        """The ID of `value`, or None if it was never interned."""
+        return self._ids.get(value)
+
+    def string(self, value_id: int) -> str:
+        return self._strings[value_id]
+
+    def mask(self, values: Iterable[str]) -> int:
+        """Bitmask of `values`, interning new ones (for values being stored)."""
+        mask = 0
+        for value in values:
+            mask |= 1 << self.intern(value)
+        return mask
+
+    def query_mask(self, values: Iterable[str]) -> int:
+        """
+        Bitmask of `values` without interning: values never stored cannot
+        match anything, so they contribute no bits.
+        """
+        ids = self._ids
+        mask = 0
+        for value in values:
+            value_id = ids.get(value)
+            if value_id is not None:
+                mask |= 1 << value_id
+        return mask
+
+    def strings(self, mask: int) -> Set[str]:
+        """The set of strings whose bits are set in `mask`."""
+        strings = self._strings
+        result = set()
+        while mask:
+            low_bit = mask & -mask
+            result.add(strings[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return result
@@ -1,6 +1,18 @@
 # Makes 'services' a sub-package, housing higher-level business logic orchestrators.
 
+from .admission import AdmissionController, QueryRejected
 from .got_processor import GoTProcessor, GoTProcessorSessionData
+from .session_store import SessionStore
+from .stage_executor import StageExecutor
+from .stage_scheduler import StageScheduler
 
 # Control what gets imported with 'from .services import *'
-__all__ = ["GoTProcessor", "GoTProcessorSessionData"]
+__all__ = [
+    "AdmissionController",
+    "GoTProcessor",
+    "GoTProcessorSessionData",
+    "QueryRejected",
+    "SessionStore",
+    "StageExecutor",
+    "StageScheduler",
+]
@@ -0,0 +1,165 @@
+"""
+Admission control for GoTProcessor queries.
+
+Queries interleave on one event loop, so running more of them at once only
+makes every one of them slower. AdmissionController runs at most
+`max_concurrent` queries; further queries wait in a bounded FIFO queue and are
+rejected with QueryRejected:
+
+- at once, when the queue is full ("queue_full"), and
+- when they have waited longer than the queue-time SLO ("queue_timeout").
+
+stats() reports queue depth, the age of the oldest waiter and recent wait
+times, for load balancers to shed load before requests are rejected.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from loguru import logger
+
+# Recent admissions kept for the wait-time percentiles in stats()
+_WAIT_WINDOW = 256
+
+
+class QueryRejected(Exception):
+    """A query was not admitted; `reason` is "queue_full" or "queue_timeout"."""
+
+    def __init__(self, reason: str, retry_after_ms: int, stats: Dict[str, Any]):
+        super().__init__(f"Query rejected ({reason}); retry after {retry_after_ms}ms")
+        self.reason = reason
+        self.retry_after_ms = retry_after_ms
+        self.stats = stats
+
+
+class _Waiter:
+    __slots__ = ("enqueued_at", "future")
+
+    def __init__(self, enqueued_at: float, future: "asyncio.Future[None]"):
+        self.enqueued_at = enqueued_at
+        self.future = future
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_queued: int = 0,
+        queue_timeout_ms: Optional[int] = None,
+    ):
+        self.max_concurrent = max_concurrent  # None: no limit
+        self.max_queued = max_queued
+        self.queue_timeout_ms = queue_timeout_ms  # None: wait indefinitely
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._recent_waits_ms: Deque[float] = deque(maxlen=_WAIT_WINDOW)
+        self._mean_run_ms = 0.0  # Moving average of admitted queries' run time
+        self.admitted_total = 0
+        self.rejected_total = 0
+
+    @classmethod
+    def from_settings(cls, admission_settings) -> "AdmissionController":
+        return cls(
+            max_concurrent=admission_settings.max_concurrent_queries,
+            max_queued=admission_settings.max_queued_queries,
+            queue_timeout_ms=admission_settings.queue_timeout_ms,
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Holds a query slot for the body; raises QueryRejected if none is had."""
+        await self._acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            run_ms = (time.perf_counter() - started) * 1000
+            self._mean_run_ms += (run_ms - self._mean_run_ms) * 0.2
+            self._release()
+
+    async def _acquire(self) -> None:
+        if self.max_concurrent is None or (
+            self._in_flight < self.max_concurrent and not self._waiters
+        ):
+            self._admitted(0.0)
+            self._in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queued:
+            self._reject("queue_full")
+
+        waiter = _Waiter(time.perf_counter(), asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        timeout = None if self.queue_timeout_ms is None else self.queue_timeout_ms / 1000
+        try:
+            # asyncio.wait (unlike wait_for) leaves the future alone on timeout,
+            # so a slot handed over at the last moment is not lost
+            await asyncio.wait((waiter.future,), timeout=timeout)
+        except asyncio.CancelledError:
+            if waiter.future.done():
+                self._release()  # Handed a slot, but the caller is gone
+            else:
+                self._waiters.remove(waiter)
+            raise
+        if not waiter.future.done():
+            self._waiters.remove(waiter)
+            waiter.future.cancel()
+            self._reject("queue_timeout")
+        # _release() handed over its slot: _in_flight already counts this query
+        self._admitted((time.perf_counter() - waiter.enqueued_at) * 1000)
+
+    def _release(self) -> None:
+        if self._waiters:
+            self._waiters.popleft().future.set_result(None)
+        else:
+            self._in_flight -= 1
+
+    def _admitted(self, wait_ms: float) -> None:
+        self.admitted_total += 1
+        self._recent_waits_ms.append(wait_ms)
+
+    def _reject(self, reason: str) -> None:
+        self.rejected_total += 1
+        stats = self.stats()
+        logger.warning(
+            f"Rejecting query ({reason}): {stats['in_flight']} running, {stats['queued']} queued"
+        )
+        raise QueryRejected(reason, self.retry_after_ms(), stats)
+
+    def retry_after_ms(self) -> int:
+        """Rough time until a new query could start: the queue ahead, drained at the recent run rate."""
+        slots = self.max_concurrent or 1
+        return int(self._mean_run_ms * (len(self._waiters) + 1) / slots)
+
+    def is_saturated(self) -> bool:
+        """True when a new query would be rejected or would probably miss the queue-time SLO."""
+        if self.max_concurrent is None:
+            return False
+        if len(self._waiters) >= self.max_queued and self._in_flight >= self.max_concurrent:
+            return True
+        return (
+            self.queue_timeout_ms is not None
+            and self._oldest_wait_ms() >= self.queue_timeout_ms
+        )
+
+    def _oldest_wait_ms(self) -> float:
+        if not self._waiters:
+            return 0.0
+        return (time.perf_counter() - self._waiters[0].enqueued_at) * 1000
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._recent_waits_ms)
+        return {
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+            "queue_timeout_ms": self.queue_timeout_ms,
+            "oldest_wait_ms": int(self._oldest_wait_ms()),
+            "wait_ms_p50": int(waits[len(waits) // 2]) if waits else 0,
+            "wait_ms_p95": int(waits[int(len(waits) * 0.95)]) if waits else 0,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+        }
@@ -1,53 +1,82 @@
+import asyncio
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Type
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
+from src.asr_got_reimagined.domain.models.revision_log import RevisionPolicy
 from src.asr_got_reimagined.domain.stages.base_stage import BaseStage, StageOutput
+from src.asr_got_reimagined.domain.stages.registry import build_pipeline
+from src.asr_got_reimagined.domain.utils.deadline import (
+    Deadline,
+    QueryBudget,
+    active_deadline,
+)
 from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData, ComposedOutput
+from src.asr_got_reimagined.domain.services.admission import AdmissionController
+from src.asr_got_reimagined.domain.services.session_store import SessionStore
+from src.asr_got_reimagined.domain.services.stage_executor import StageExecutor
+from src.asr_got_reimagined.domain.services.stage_scheduler import (
+    StageScheduler,
+    StageTiming,
+)
 
 
 class GoTProcessor:
-    def __init__(self, settings):
+    def __init__(self, settings, session_store: Optional[SessionStore] = None):
         self.settings = settings
-        logger.info("Initializing GoTProcessor")
-
-    def _initialize_stages(self) -> List[BaseStage]:
-        """Dynamically loads and initializes all stage classes."""
-        from src.asr_got_reimagined.domain.stages import (
-            CompositionStage,
-            DecompositionStage,
-            EvidenceStage,
-            HypothesisStage,
-            InitializationStage,
-            PruningMergingStage,
-            ReflectionStage,
-            SubgraphExtractionStage,
+        self.session_store = session_store or SessionStore.from_settings(settings)
+        self.revision_policy = RevisionPolicy.from_settings(
+            settings.asr_got.revision_history
         )
-
-        # All stages are now real implementations
-        stages_to_load: List[Type[BaseStage]] = [
-            InitializationStage,
-            DecompositionStage,
-            HypothesisStage,
-            EvidenceStage,
-            PruningMergingStage,
-            SubgraphExtractionStage,
-            CompositionStage,
-            ReflectionStage,
-        ]
-
-        initialized_stages = [stage_cls(self.settings) for stage_cls in stages_to_load]
-
-        if len(initialized_stages) != 8:
-            logger.warning(
-                f"Expected 8 stages, but only {len(initialized_stages)} were initialized. Check _initialize_stages."
+        logger.info("Initializing GoTProcessor")
+        # Built once: stage objects are stateless and shared by all queries
+        self.stages: Tuple[BaseStage, ...] = build_pipeline(settings)
+        self.scheduler = StageScheduler(self.stages)
+        self.executor = StageExecutor(settings)
+        self.admission = AdmissionController.from_settings(settings.asr_got.admission)
+
+    def _stage_clock(self, graph: ASRGoTGraph) -> ContextManager[Any]:
+        """One logical-clock batch per stage, if asr_got.logical_clock is on."""
+        if self.settings.asr_got.logical_clock:
+            return graph.logical_clock.batch()
+        return nullcontext()
+
+    def _annotate_trace(
+        self,
+        trace: List[Dict[str, Any]],
+        trace_start: int,
+        timings: Dict[int, StageTiming],
+    ) -> None:
+        """
+        Orders the trace entries of this run by stage and adds when each stage
+        ran, what it waited for, and whether it is on the critical path.
+        """
+        stages = self.scheduler.stages
+        critical_path = self.scheduler.critical_path(timings)
+        on_path = set(critical_path)
+        trace[trace_start:] = sorted(trace[trace_start:], key=lambda e: e["stage_number"])
+        for entry in trace[trace_start:]:
+            index = entry["stage_number"] - 1
+            timing = timings.get(index)
+            if timing is None:
+                continue
+            entry["started_ms"] = int(timing.started * 1000)
+            entry["finished_ms"] = int(timing.finished * 1000)
+            entry["depends_on"] = [
+                stages[d].__class__.__name__ for d in self.scheduler.dependencies[index]
+            ]
+            entry["on_critical_path"] = index in on_path
+        if critical_path:
+            logger.info(
+                "Critical path: "
+                + " -> ".join(stages[i].__class__.__name__ for i in critical_path)
+                + f" ({int(timings[critical_path[-1]].finished * 1000)}ms)"
             )
 
-        return initialized_stages
-
     async def process_query(
         self,
         query: str,
@@ -66,7 +95,22 @@ class GoTProcessor:
 
         Returns:
             GoTProcessorSessionData: The result of processing the query
+
+        Raises:
+            QueryRejected: The processor is saturated (see asr_got.admission)
         """
+        async with self.admission.admit():
+            return await self._process_admitted_query(
+                query, session_id, operational_params, initial_context
+            )
+
+    async def _process_admitted_query(
+        self,
+        query: str,
+        session_id: Optional[str],
+        operational_params: Optional[Dict[str, Any]],
+        initial_context: Optional[Dict[str, Any]],
+    ) -> GoTProcessorSessionData:
         from src.asr_got_reimagined.domain.stages import (
             CompositionStage, 
             ReflectionStage, 
@@ -80,12 +124,28 @@ class GoTProcessor:
         logger.info(f"Starting NexusMind query processing for: '{query[:100]}...'")
 
         # Initialize or retrieve session data
-        current_session_data = GoTProcessorSessionData(
-            session_id=session_id or f"session-{uuid.uuid4()}", query=query
+        previous_session_data = (
+            self.session_store.get(session_id) if session_id else None
         )
-
-        # Create a new graph state for this session
-        current_session_data.graph_state = ASRGoTGraph()
+        is_resumed_session = previous_session_data is not None
+        if is_resumed_session:
+            # Continue the stored graph and context (the graph is a private fork)
+            logger.info(f"Resuming session {session_id} with its existing graph")
+            current_session_data = previous_session_data.model_copy(
+                update={
+                    "query": query,
+                    "turn": previous_session_data.turn + 1,
+                    "final_answer": None,
+                    "degraded_stages": {},
+                }
+            )
+        else:
+            current_session_data = GoTProcessorSessionData(
+                session_id=session_id or f"session-{uuid.uuid4()}", query=query
+            )
+            # Create a new graph state for this session
+            current_session_data.graph_state = ASRGoTGraph()
+        current_session_data.graph_state.set_revision_policy(self.revision_policy)
         current_session_data.graph_state.graph_metadata["query"] = query
         current_session_data.graph_state.graph_metadata["session_id"] = (
             current_session_data.session_id
@@ -100,16 +160,38 @@ class GoTProcessor:
         # Process operational parameters
         op_params = operational_params or {}
         current_session_data.accumulated_context["operational_params"] = op_params
+        capture_stage_snapshots = bool(op_params.get("capture_stage_snapshots", False))
+        # Optional time budget for processing, split across the stages as they start
+        max_latency_ms = op_params.get("max_latency_ms")
+        budget = (
+            QueryBudget(max_latency_ms, [stage.budget_weight for stage in self.stages])
+            if max_latency_ms
+            else None
+        )
 
-        # Execute stages in sequence
-        stages = self._initialize_stages()
-        logger.info(f"Initialized {len(stages)} processing stages")
+        # Execute stages as their dependencies allow (see stage_scheduler.py)
+        stages = self.stages
+        trace_start = len(current_session_data.stage_outputs_trace)
 
-        for i, stage in enumerate(stages):
+        async def run_stage(i: int, stage: BaseStage) -> bool:
+            """Runs one stage; returns False to halt the pipeline."""
             stage_start_time = time.time()
             stage_name = stage.__class__.__name__
+            deadline = budget.stage_deadline(stage.budget_weight) if budget else Deadline()
             logger.info(f"Executing stage {i + 1}/{len(stages)}: {stage_name}")
 
+            if is_resumed_session and stage.reuse_output_on_resume:
+                previous_output = current_session_data.accumulated_context.get(stage.stage_name)
+                if isinstance(previous_output, dict) and not previous_output.get("error"):
+                    logger.info(f"Reusing {stage_name} output from session {current_session_data.session_id}")
+                    current_session_data.stage_outputs_trace.append({
+                        "stage_number": i + 1,
+                        "stage_name": stage_name,
+                        "duration_ms": 0,
+                        "summary": f"Reused {stage_name} output from the existing session",
+                    })
+                    return True
+
             # --- BEGIN ADDED LOGGING (Before Stage Execution) ---
             logger.debug(f"--- Preparing for Stage: {stage_name} ---")
             if isinstance(stage, InitializationStage):
@@ -133,10 +215,9 @@ class GoTProcessor:
             # --- END ADDED LOGGING ---
 
             try:  # Execute the stage
-                stage_result = await stage.execute(
-                    graph=current_session_data.graph_state,
-                    current_session_data=current_session_data,
-                )
+                with self._stage_clock(current_session_data.graph_state), active_deadline(deadline):
+                    # On the event loop, or in the worker pool for heavy stages
+                    stage_result = await self.executor.execute(stage, current_session_data)
 
                 # --- BEGIN ADDED LOGGING (After Stage Execution) ---
                 logger.debug(f"--- Output from Stage: {stage_name} ---")
@@ -179,8 +260,20 @@ class GoTProcessor:
                     "duration_ms": stage_duration_ms,
                     "summary": f"Completed {stage_name}",
                 }
+                if deadline.degradations:
+                    # The stage cut its work short to stay within the time budget
+                    degradation = " ".join(deadline.degradations)
+                    trace_entry["degraded"] = degradation
+                    current_session_data.degraded_stages[stage_name] = degradation
+                    logger.warning(f"Stage {stage_name} degraded to meet the time budget: {degradation}")
                 current_session_data.stage_outputs_trace.append(trace_entry)
 
+                if capture_stage_snapshots:
+                    # O(1): the live graph copies only what later stages change
+                    current_session_data.graph_snapshots[stage_name] = (
+                        current_session_data.graph_state.snapshot()
+                    )
+
                 logger.info(
                     f"Completed stage {i + 1}: {stage_name} in {stage_duration_ms}ms"
                 )
@@ -220,7 +313,7 @@ class GoTProcessor:
                             "error": "Halting due to critical error in InitializationStage.", # Standardized error type
                             "summary": error_reason_summary # Specific reason for halting from P1, P2, or P3
                         })
-                        break # Exit the loop of stages
+                        return False # Halt the pipeline
             except Exception as e:
                 logger.error(f"Error in stage {i + 1} ({stage_name}): {e!s}")
                 trace_entry = {
@@ -230,7 +323,13 @@ class GoTProcessor:
                     "summary": f"Error in {stage_name}: {e!s}",
                 }
                 current_session_data.stage_outputs_trace.append(trace_entry)
-                # Continue to next stage despite errors
+                # Continue with the other stages despite errors
+            return True
+
+        timings = await self.scheduler.run(run_stage)
+        self._annotate_trace(
+            current_session_data.stage_outputs_trace, trace_start, timings
+        )
 
         # Extract final answer from composition stage
         composition_stage_output_key = CompositionStage.stage_name
@@ -273,6 +372,8 @@ class GoTProcessor:
                 [0.1, 0.1, 0.1, 0.1],  # Low default if not found
             )
 
+        await self.session_store.put(current_session_data)
+
         total_execution_time_ms = int((time.time() - start_total_time) * 1000)
         logger.info(
             f"NexusMind query processing completed for session {current_session_data.session_id} in {total_execution_time_ms}ms."
@@ -284,4 +385,4 @@ class GoTProcessor:
         """Clean up any resources when shutting down."""
         logger.info("Shutting down GoTProcessor resources")
         # Close any connections, release resources, etc.
-        return
+        await asyncio.to_thread(self.executor.shutdown)
@@ -0,0 +1,207 @@
+"""
+Two-tier store for GoTProcessor sessions, so a query with a known session_id
+continues the session's graph and accumulated context instead of starting over.
+
+- Memory tier: LRU of the most recent sessions, holding read-only graph snapshots.
+- Disk tier (optional): one SQLite table for session fields plus one binary graph
+  file per session (see graph_binary.py), written through on every put() on a
+  worker thread, so the event loop is not blocked on disk I/O.
+
+get() always returns a fresh GoTProcessorSessionData whose graph is a writable
+fork of the stored one, so a running query never changes what is stored until
+it is put() back.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from loguru import logger
+
+from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
+from src.asr_got_reimagined.domain.models.graph_binary import (
+    load_graph_binary,
+    save_graph_binary,
+)
+from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
+
+_DB_FILENAME = "sessions.sqlite3"
+_GRAPH_DIRNAME = "graphs"
+_GRAPH_SUFFIX = ".asrgot"
+
+
+class SessionStore:
+    def __init__(
+        self, max_in_memory_sessions: int = 128, persistence_dir: Optional[str] = None
+    ):
+        self.max_in_memory_sessions = max(1, max_in_memory_sessions)
+        self._sessions: "OrderedDict[str, GoTProcessorSessionData]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes disk writes: saves of one session share a temporary file
+        self._disk_lock = threading.Lock()
+        self._dir: Optional[Path] = None
+        if persistence_dir:
+            self._dir = Path(persistence_dir)
+            (self._dir / _GRAPH_DIRNAME).mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS sessions ("
+                    "session_id TEXT PRIMARY KEY, updated_at REAL NOT NULL, data TEXT NOT NULL)"
+                )
+            logger.info(f"Session store persisting to {self._dir}")
+
+    @classmethod
+    def from_settings(cls, settings) -> "SessionStore":
+        store_settings = settings.session_store
+        return cls(
+            max_in_memory_sessions=store_settings.max_in_memory_sessions,
+            persistence_dir=store_settings.persistence_dir,
+        )
+
+    def get(self, session_id: str) -> Optional[GoTProcessorSessionData]:
+        """The stored session with a writable (forked) graph, or None if unknown."""
+        stored = self._lookup(session_id)
+        return self._checkout(stored) if stored is not None else None
+
+    def get_graph(self, session_id: str) -> Optional[ASRGoTGraph]:
+        """The stored graph of a session as a read-only snapshot, or None."""
+        stored = self._lookup(session_id)
+        return stored.graph_state if stored is not None else None
+
+    async def put(self, session: GoTProcessorSessionData) -> None:
+        """
+        Stores `session` (its graph as a snapshot), replacing any earlier version.
+        The memory tier is updated before the first await; the disk tier is
+        written on a worker thread.
+        """
+        graph = session.graph_state
+        stored = session.model_copy(
+            update={
+                "graph_state": graph.snapshot() if graph is not None else None,
+                "accumulated_context": copy.deepcopy(session.accumulated_context),
+                "stage_outputs_trace": [],
+                "graph_snapshots": {},
+            }
+        )
+        self._remember(stored)
+        if self._dir is not None:
+            try:
+                await asyncio.to_thread(self._save, stored)
+            except Exception as e:  # The memory tier still has the session
+                logger.error(f"Failed to persist session {session.session_id}: {e}")
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            found = self._sessions.pop(session_id, None) is not None
+        if self._dir is not None:
+            with self._connect() as conn:
+                found = (
+                    conn.execute(
+                        "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+                    ).rowcount
+                    > 0
+                    or found
+                )
+            self._graph_path(session_id).unlink(missing_ok=True)
+        return found
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            if session_id in self._sessions:
+                return True
+        if self._dir is None:
+            return False
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row is not None
+
+    def _lookup(self, session_id: str) -> Optional[GoTProcessorSessionData]:
+        with self._lock:
+            stored = self._sessions.get(session_id)
+            if stored is not None:
+                self._sessions.move_to_end(session_id)
+        if stored is None:
+            stored = self._load(session_id)
+            if stored is not None:
+                self._remember(stored)
+        return stored
+
+    # --- Memory tier ---
+
+    def _remember(self, stored: GoTProcessorSessionData) -> None:
+        with self._lock:
+            self._sessions[stored.session_id] = stored
+            self._sessions.move_to_end(stored.session_id)
+            while len(self._sessions) > self.max_in_memory_sessions:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                logger.debug(f"Evicted session {evicted_id} from the memory tier")
+
+    @staticmethod
+    def _checkout(stored: GoTProcessorSessionData) -> GoTProcessorSessionData:
+        graph = stored.graph_state
+        return stored.model_copy(
+            update={
+                "graph_state": graph.fork() if graph is not None else ASRGoTGraph(),
+                "accumulated_context": copy.deepcopy(stored.accumulated_context),
+                "stage_outputs_trace": [],
+                "graph_snapshots": {},
+            }
+        )
+
+    # --- Disk tier ---
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A connection that commits on success, rolls back on error and is always closed."""
+        assert self._dir is not None
+        with closing(sqlite3.connect(self._dir / _DB_FILENAME)) as conn, conn:
+            yield conn
+
+    def _graph_path(self, session_id: str) -> Path:
+        assert self._dir is not None
+        # Session IDs come from clients, so they are never used as file names
+        digest = hashlib.sha256(session_id.encode("utf-8")).hexdigest()
+        return self._dir / _GRAPH_DIRNAME / f"{digest}{_GRAPH_SUFFIX}"
+
+    def _save(self, stored: GoTProcessorSessionData) -> None:
+        data = stored.model_dump(
+            mode="json", exclude={"graph_state", "stage_outputs_trace", "graph_snapshots"}
+        )
+        data["has_graph"] = stored.graph_state is not None
+        with self._disk_lock, self._connect() as conn:
+            if stored.graph_state is not None:
+                save_graph_binary(stored.graph_state, self._graph_path(stored.session_id))
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, updated_at, data) VALUES (?, ?, ?)",
+                (stored.session_id, time.time(), json.dumps(data, default=str)),
+            )
+
+    def _load(self, session_id: str) -> Optional[GoTProcessorSessionData]:
+        if self._dir is None:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        data: Dict[str, Any] = json.loads(row[0])
+        graph = None
+        if data.pop("has_graph", False):
+            try:
+                graph = load_graph_binary(self._graph_path(session_id)).snapshot()
+            except Exception as e:
+                logger.error(f"Failed to load graph of session {session_id}: {e}")
+                return None
+        logger.debug(f"Loaded session {session_id} from the disk tier")
+        return GoTProcessorSessionData(**data, graph_state=graph)
@@ -0,0 +1,198 @@
+"""
+Runs CPU-heavy stages off the asyncio event loop.
+
+Stage `execute` methods are coroutines but do pure CPU work, so a large query
+run on the event loop stalls every other request (and /health) until its stage
+returns. StageExecutor runs selected stages (asr_got.executor.offload_stages,
+plus any stage with run_in_executor set) in a worker pool instead:
+
+- "thread": the stage runs on a worker thread, on its own event loop, against
+  the live graph. The GIL is released every few milliseconds, which bounds
+  event-loop latency; the work itself is not parallelized.
+- "process": the stage runs in a worker process, in parallel with the server.
+  The graph is handed over as a binary graph file (graph_binary.py) that the
+  worker memory-maps and loads; a stage that writes the graph sends the
+  result back the same way, together with the mutation-journal entries it
+  recorded, and the session continues with that graph and the original
+  journal extended by those entries (see ASRGoTGraph.adopt_journal). The
+  worker's random number generator is not the server's, so seeded runs differ
+  from in-process ones.
+
+With kind "none" every stage runs on the event loop, as before.
+"""
+
+import asyncio
+import contextvars
+import os
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple, Type
+
+from loguru import logger
+
+from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
+from src.asr_got_reimagined.domain.models.graph_binary import (
+    load_graph_binary,
+    save_graph_binary,
+)
+from src.asr_got_reimagined.domain.models.graph_journal import GraphChange
+from src.asr_got_reimagined.domain.models.revision_log import RevisionPolicy
+from src.asr_got_reimagined.domain.stages.base_stage import (
+    BaseStage,
+    GraphAccess,
+    StageOutput,
+)
+from src.asr_got_reimagined.domain.utils.deadline import (
+    Deadline,
+    active_deadline,
+    current_deadline,
+)
+
+
+class StageExecutor:
+    def __init__(self, settings):
+        self.settings = settings
+        executor_settings = settings.asr_got.executor
+        self.kind = executor_settings.kind
+        self.max_workers = executor_settings.max_workers
+        self.offload_stages = frozenset(executor_settings.offload_stages)
+        self.handoff_dir = executor_settings.handoff_dir
+        self._pool: Optional[Executor] = None  # Started on first use
+
+    def offloads(self, stage: BaseStage) -> bool:
+        return self.kind != "none" and (
+            stage.run_in_executor or stage.stage_name in self.offload_stages
+        )
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.settings,),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="stage-worker"
+                )
+            logger.info(f"Started {self.kind} pool for offloaded stages")
+        return self._pool
+
+    async def execute(
+        self, stage: BaseStage, session_data: GoTProcessorSessionData
+    ) -> StageOutput:
+        """Runs `stage` on the session, in the worker pool if it is offloaded."""
+        if not self.offloads(stage):
+            return await stage.execute(
+                graph=session_data.graph_state, current_session_data=session_data
+            )
+        if self.kind == "process":
+            return await self._execute_in_process(stage, session_data)
+        # The copied context carries the active logical-clock batch, if any
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_pool(),
+            context.run,
+            asyncio.run,
+            stage.execute(
+                graph=session_data.graph_state, current_session_data=session_data
+            ),
+        )
+
+    async def _execute_in_process(
+        self, stage: BaseStage, session_data: GoTProcessorSessionData
+    ) -> StageOutput:
+        graph = session_data.graph_state
+        fd, graph_path = tempfile.mkstemp(
+            prefix="stage-graph-", suffix=".bin", dir=self.handoff_dir
+        )
+        os.close(fd)
+        result_path: Optional[str] = None
+        try:
+            # Encoding is CPU work too, so it also stays off the event loop
+            await asyncio.to_thread(save_graph_binary, graph, graph_path)
+            # The worker gets the graph through the file, not with the session
+            worker_session = session_data.model_copy(
+                update={"graph_state": None, "graph_snapshots": {}}
+            )
+            # The worker gets a copy of the deadline and returns its degradations
+            deadline = current_deadline()
+            loop = asyncio.get_running_loop()
+            output, result_path, changes, degradations = await loop.run_in_executor(
+                self._get_pool(),
+                _execute_in_worker,
+                type(stage),
+                graph_path,
+                worker_session,
+                deadline,
+            )
+            deadline.degradations[:] = degradations
+            if result_path is not None:
+                new_graph = await asyncio.to_thread(load_graph_binary, result_path)
+                new_graph.set_revision_policy(graph.revision_policy)
+                if changes is not None:
+                    new_graph.adopt_journal(graph, changes)
+                else:  # The worker's journal was trimmed; deltas need a full reload
+                    logger.warning(
+                        f"{stage.stage_name} changed too much to keep the graph journal"
+                    )
+                session_data.graph_state = new_graph
+            return output
+        finally:
+            for path in (graph_path, result_path):
+                if path is not None and os.path.exists(path):
+                    os.remove(path)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+# --- Worker-process side ---
+
+_worker_settings = None
+_worker_stages: Dict[Type[BaseStage], BaseStage] = {}
+
+
+def _init_worker(settings) -> None:
+    global _worker_settings
+    _worker_settings = settings
+
+
+def _execute_in_worker(
+    stage_cls: Type[BaseStage],
+    graph_path: str,
+    session_data: GoTProcessorSessionData,
+    deadline: Deadline,
+) -> Tuple[StageOutput, Optional[str], Optional[List[GraphChange]], List[str]]:
+    """
+    Runs a stage on the graph saved at `graph_path`, within `deadline`.
+    Returns its output, the path of the changed graph and the journal entries
+    of its changes (None if trimmed) if the stage writes the graph, and the
+    stage's degradations.
+    """
+    settings = _worker_settings
+    stage = _worker_stages.get(stage_cls)
+    if stage is None:
+        stage = _worker_stages[stage_cls] = stage_cls(settings)
+
+    graph = load_graph_binary(graph_path)
+    loaded_version = graph.version
+    graph.set_revision_policy(
+        RevisionPolicy.from_settings(settings.asr_got.revision_history)
+    )
+    session_data.graph_state = graph
+    clock = graph.logical_clock.batch() if settings.asr_got.logical_clock else nullcontext()
+    with clock, active_deadline(deadline):
+        output = asyncio.run(
+            stage.execute(graph=graph, current_session_data=session_data)
+        )
+
+    if GraphAccess(stage.graph_access) is not GraphAccess.WRITE:
+        return output, None, None, deadline.degradations
+    result_path = f"{graph_path}.out"
+    save_graph_binary(graph, result_path)
+    return output, result_path, graph.changes_since(loaded_version), deadline.degradations
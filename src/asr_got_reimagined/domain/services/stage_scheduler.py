@@ -0,0 +1,178 @@
+"""
+Dependency-aware execution of the stage pipeline.
+
+Stages declare what they read and write (BaseStage.requires, provides,
+graph_access), and StageScheduler turns the pipeline order into a DAG:
+
+- context: a stage waits for the last earlier stage providing each key it
+  requires, and a stage providing a key waits for the earlier stages that
+  read or provide it. Keys no stage provides (such as "operational_params")
+  are set by GoTProcessor before the run.
+- graph: a writer waits for the previous writer and every reader since; a
+  reader waits for the previous writer only, so readers overlap each other.
+- a stage with undeclared inputs (requires is None), or one requiring
+  STAGE_TRACE_KEY, waits for every stage before it.
+
+Stages whose dependencies have finished run concurrently as tasks on the
+event loop (heavy ones then hand their work to GoTProcessor's worker pool, see
+stage_executor.py). The timings of a run give its critical path: the
+dependency chain that finished last.
+
+The default eight-stage pipeline is sequential by data dependency: stages 1-5
+write the graph, SubgraphExtractionStage reads what they wrote, and
+CompositionStage and ReflectionStage need the outputs before them, so for it
+the scheduler only reports the critical path (the whole chain); the work inside
+each stage is CPU-bound and runs as before. Stages run side by side only in
+custom pipelines, e.g. several graph readers after the last writer, and CPU-heavy
+stages only overlap the event loop when offloaded to the worker pool.
+"""
+
+import asyncio
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from loguru import logger
+
+from src.asr_got_reimagined.domain.stages.base_stage import (
+    STAGE_TRACE_KEY,
+    BaseStage,
+    GraphAccess,
+)
+
+# run_stage(index, stage) -> False to halt the pipeline
+StageRunner = Callable[[int, BaseStage], Awaitable[bool]]
+
+
+class StageTiming(NamedTuple):
+    # Seconds since the start of the run
+    started: float
+    finished: float
+
+
+def plan_dependencies(stages: Sequence[BaseStage]) -> List[Tuple[int, ...]]:
+    """For each stage, the indexes of the earlier stages it must wait for."""
+    dependencies: List[Tuple[int, ...]] = []
+    providers: Dict[str, int] = {}
+    readers: Dict[str, List[int]] = {}  # Key -> readers since its last provider
+    last_writer: Optional[int] = None
+    graph_readers: List[int] = []  # Since last_writer
+    for index, stage in enumerate(stages):
+        depends_on: Set[int] = set()
+        if stage.requires is None or STAGE_TRACE_KEY in stage.requires:
+            depends_on.update(range(index))
+        else:
+            for key in stage.requires:
+                if key in providers:
+                    depends_on.add(providers[key])
+                readers.setdefault(key, []).append(index)
+        for key in (stage.stage_name, *stage.provides):
+            if key in providers:
+                depends_on.add(providers[key])
+            depends_on.update(readers.pop(key, ()))
+            providers[key] = index
+
+        access = GraphAccess(stage.graph_access)
+        if access is not GraphAccess.NONE and last_writer is not None:
+            depends_on.add(last_writer)
+        if access is GraphAccess.WRITE:
+            depends_on.update(graph_readers)
+            last_writer = index
+            graph_readers = []
+        elif access is GraphAccess.READ:
+            graph_readers.append(index)
+
+        depends_on.discard(index)
+        dependencies.append(tuple(sorted(depends_on)))
+    return _transitive_reduction(dependencies)
+
+
+def _transitive_reduction(dependencies: List[Tuple[int, ...]]) -> List[Tuple[int, ...]]:
+    """Drops each dependency already implied by another one (e.g. 3 -> 2 -> 1 makes 3 -> 1 redundant)."""
+    ancestors: List[Set[int]] = []
+    reduced: List[Tuple[int, ...]] = []
+    for depends_on in dependencies:
+        implied = set().union(*(ancestors[d] for d in depends_on))
+        reduced.append(tuple(d for d in depends_on if d not in implied))
+        ancestors.append(implied.union(depends_on))
+    return reduced
+
+
+class StageScheduler:
+    def __init__(self, stages: Sequence[BaseStage]):
+        self.stages = tuple(stages)
+        self.dependencies = plan_dependencies(self.stages)
+        logger.debug(
+            "Stage dependencies: "
+            + "; ".join(
+                f"{stage.stage_name} <- {[self.stages[d].stage_name for d in deps]}"
+                for stage, deps in zip(self.stages, self.dependencies, strict=True)
+            )
+        )
+
+    async def run(self, run_stage: StageRunner) -> Dict[int, StageTiming]:
+        """
+        Calls run_stage(index, stage) for each stage as soon as its dependencies
+        have finished, and returns the timings of the stages that ran. Once a
+        call returns False no further stages are started (running ones finish).
+        """
+        run_start = time.perf_counter()
+        timings: Dict[int, StageTiming] = {}
+        pending = list(range(len(self.stages)))
+        running: Dict["asyncio.Future[bool]", Tuple[int, float]] = {}
+        halted = False
+        try:
+            while True:
+                if not halted:
+                    # Started in pipeline order, so same-tick work stays deterministic
+                    for index in [
+                        i for i in pending
+                        if all(d in timings for d in self.dependencies[i])
+                    ]:
+                        pending.remove(index)
+                        task = asyncio.ensure_future(run_stage(index, self.stages[index]))
+                        running[task] = (index, time.perf_counter() - run_start)
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, started = running.pop(task)
+                    timings[index] = StageTiming(started, time.perf_counter() - run_start)
+                    if task.result() is False:
+                        halted = True
+        finally:
+            for task in running:
+                task.cancel()
+        if pending:
+            logger.info(
+                f"Pipeline halted; skipped {[self.stages[i].stage_name for i in pending]}"
+            )
+        return timings
+
+    def critical_path(self, timings: Dict[int, StageTiming]) -> List[int]:
+        """
+        Indexes of the stages on the critical path of a run, in order: from
+        the stage that finished last, back through the dependency that
+        finished last at each step.
+        """
+        if not timings:
+            return []
+        index = max(timings, key=lambda i: timings[i].finished)
+        path = [index]
+        while True:
+            ran = [d for d in self.dependencies[index] if d in timings]
+            if not ran:
+                break
+            index = max(ran, key=lambda d: timings[d].finished)
+            path.append(index)
+        path.reverse()
+        return path
@@ -1,5 +1,5 @@
 # Makes 'stages' a sub-package.
-from .base_stage import BaseStage, StageOutput
+from .base_stage import STAGE_TRACE_KEY, BaseStage, GraphAccess, StageOutput
 from .stage_1_initialization import InitializationStage
 from .stage_2_decomposition import DecompositionStage
 from .stage_3_hypothesis import HypothesisStage
@@ -8,16 +8,23 @@ from .stage_5_pruning_merging import PruningMergingStage
 from .stage_6_subgraph_extraction import SubgraphExtractionStage
 from .stage_7_composition import CompositionStage
 from .stage_8_reflection import ReflectionStage
+from .registry import DEFAULT_PIPELINE, build_pipeline, get_stage_class, register_stage
 
 __all__ = [
     "BaseStage",
     "CompositionStage",
+    "DEFAULT_PIPELINE",
     "DecompositionStage",
     "EvidenceStage",
+    "GraphAccess",
     "HypothesisStage",
     "InitializationStage",
     "PruningMergingStage",
     "ReflectionStage",
+    "STAGE_TRACE_KEY",
     "StageOutput",
     "SubgraphExtractionStage",
+    "build_pipeline",
+    "get_stage_class",
+    "register_stage",
 ]
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
 
 from loguru import logger  # type: ignore
 from pydantic import BaseModel, Field
@@ -19,12 +20,49 @@ class StageOutput(BaseModel):
     # Optional: Data to be passed to the next stage or stored in the session context
     # This can be more specific in subclasses if needed.
     next_stage_context_update: Dict[str, Any] = Field(default_factory=dict)
+    # Set when the stage failed in a way later stages should know about
+    error_message: Optional[str] = None
+
+
+# Pseudo context key for BaseStage.requires: the stage reads
+# session_data.stage_outputs_trace, so it waits for every stage before it
+STAGE_TRACE_KEY = "stage_outputs_trace"
+
+
+class GraphAccess(str, Enum):
+    """How a stage uses the session graph, for the stage scheduler."""
+
+    NONE = "none"
+    READ = "read"
+    WRITE = "write"
 
 
 class BaseStage(ABC):
-    """Abstract Base Class for all stages in the ASR-GoT pipeline."""
+    """
+    Abstract Base Class for all stages in the ASR-GoT pipeline.
+
+    One instance serves every query (see registry.py), concurrently: set
+    configuration in __init__ only and keep per-query state out of `self`.
+    """
 
     stage_name: str = "UnknownStage"  # Override in subclasses
+    # When a query continues an existing session, a stage with this flag is
+    # skipped if the session already holds its (error-free) output.
+    reuse_output_on_resume: bool = False
+
+    # Inputs and outputs, from which the stage scheduler derives what may run
+    # concurrently (see services/stage_scheduler.py).
+    # accumulated_context keys the stage reads; None means undeclared, and the
+    # stage then waits for every stage before it.
+    requires: Optional[Tuple[str, ...]] = None
+    # accumulated_context keys the stage writes besides its own stage_name
+    provides: Tuple[str, ...] = ()
+    graph_access: GraphAccess = GraphAccess.WRITE
+    # Share of a query's time budget (max_latency_ms), relative to other stages
+    budget_weight: float = 1.0
+    # Run the stage in GoTProcessor's worker pool (asr_got.executor) instead of
+    # on the event loop, like the stages listed in executor.offload_stages
+    run_in_executor: bool = False
 
     def __init__(self, settings: Settings):
         self.settings = settings
@@ -0,0 +1,96 @@
+"""
+Registry of pipeline stages, and the pipeline built from it.
+
+The pipeline is declared in settings (asr_got.pipeline) as a list of stage
+names, in execution order. A name is either a registered stage name (the
+stage_name of a built-in stage, or anything passed to register_stage) or an
+import path "package.module:ClassName" for stages living outside this package.
+
+GoTProcessor builds the pipeline once and reuses the stage objects for every
+query, including concurrent ones, so stages must not keep per-query state on
+`self`: everything a query produces goes into locals, the graph, or the
+session data.
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple, Type
+
+from loguru import logger
+
+from .base_stage import BaseStage
+from .stage_1_initialization import InitializationStage
+from .stage_2_decomposition import DecompositionStage
+from .stage_3_hypothesis import HypothesisStage
+from .stage_4_evidence import EvidenceStage
+from .stage_5_pruning_merging import PruningMergingStage
+from .stage_6_subgraph_extraction import SubgraphExtractionStage
+from .stage_7_composition import CompositionStage
+from .stage_8_reflection import ReflectionStage
+
+# The standard ASR-GoT sequence (P1.0), used when settings declare no pipeline
+DEFAULT_PIPELINE: Tuple[str, ...] = (
+    InitializationStage.stage_name,
+    DecompositionStage.stage_name,
+    HypothesisStage.stage_name,
+    EvidenceStage.stage_name,
+    PruningMergingStage.stage_name,
+    SubgraphExtractionStage.stage_name,
+    CompositionStage.stage_name,
+    ReflectionStage.stage_name,
+)
+
+_REGISTRY: Dict[str, Type[BaseStage]] = {}
+
+
+def register_stage(
+    stage_cls: Type[BaseStage], name: Optional[str] = None
+) -> Type[BaseStage]:
+    """
+    Makes `stage_cls` available to pipelines under `name` (default: its
+    stage_name); registering a name again replaces the stage. Usable as a
+    class decorator.
+    """
+    _REGISTRY[name or stage_cls.stage_name] = stage_cls
+    return stage_cls
+
+
+def get_stage_class(name: str) -> Type[BaseStage]:
+    stage_cls = _REGISTRY.get(name)
+    if stage_cls is not None:
+        return stage_cls
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(
+            f"Unknown pipeline stage '{name}'. Registered stages: {sorted(_REGISTRY)}"
+        )
+    stage_cls = getattr(importlib.import_module(module_name), class_name, None)
+    if not (isinstance(stage_cls, type) and issubclass(stage_cls, BaseStage)):
+        raise ValueError(f"Pipeline stage '{name}' is not a BaseStage subclass.")
+    return stage_cls
+
+
+def build_pipeline(settings, stage_names: Optional[List[str]] = None) -> Tuple[BaseStage, ...]:
+    """
+    Instantiates the stages of `stage_names` (default: settings.asr_got.pipeline,
+    or DEFAULT_PIPELINE if that is empty), in order.
+    """
+    names = stage_names or settings.asr_got.pipeline or list(DEFAULT_PIPELINE)
+    pipeline = tuple(get_stage_class(name)(settings) for name in names)
+    logger.info(
+        f"Built pipeline of {len(pipeline)} stages: "
+        + ", ".join(type(stage).__name__ for stage in pipeline)
+    )
+    return pipeline
+
+
+for _stage_cls in (
+    InitializationStage,
+    DecompositionStage,
+    HypothesisStage,
+    EvidenceStage,
+    PruningMergingStage,
+    SubgraphExtractionStage,
+    CompositionStage,
+    ReflectionStage,
+):
+    register_stage(_stage_cls)
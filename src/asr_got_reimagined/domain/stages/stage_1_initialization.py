@@ -11,6 +11,7 @@ from .base_stage import BaseStage, StageOutput
 
 class InitializationStage(BaseStage):
     stage_name: str = "InitializationStage"
+    requires = ("operational_params",)
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -43,6 +44,13 @@ class InitializationStage(BaseStage):
 
         # Create root node (n0) based on P1.1
         root_node_id = "n0"  # Standard ID for the root node
+        if graph.get_node(root_node_id) is not None:
+            # A resumed session: its root now stands for the follow-up query
+            output = self._update_root_for_follow_up(
+                graph, root_node_id, current_session_data
+            )
+            self._log_end(current_session_data.session_id, output)
+            return output
 
         # Extract initial disciplinary tags from operational parameters or query (simplified for now)
         # P1.1 refers to P1.12 schema which includes disciplinary_tags.
@@ -100,13 +108,11 @@ class InitializationStage(BaseStage):
         # The ASRGoTGraph model's assign_node_to_layer handles adding the node to a layer set.
         # Global layer definitions might be in settings.asr_got.layers
         for layer_id, _ in self.settings.asr_got.layers.items():
-            if (
-                layer_id not in graph.layers
-            ):  # Initialize layer sets in the graph if not present
-                graph.layers[layer_id] = set()
-                logger.debug(
-                    f"Ensured layer '{layer_id}' exists in graph from global definitions."
-                )
+            # Initialize layer sets in the graph if not present
+            graph.ensure_layer(layer_id)
+            logger.debug(
+                f"Ensured layer '{layer_id}' exists in graph from global definitions."
+            )
 
         # Update session data with the root node ID and other relevant info from this stage
         context_update = {
@@ -130,3 +136,36 @@ class InitializationStage(BaseStage):
         )
         self._log_end(current_session_data.session_id, output)
         return output
+
+    def _update_root_for_follow_up(
+        self,
+        graph: ASRGoTGraph,
+        root_node_id: str,
+        current_session_data: GoTProcessorSessionData,
+    ) -> StageOutput:
+        """Points the existing root at the new query; earlier ones stay in its revision history."""
+        query = current_session_data.query
+        turn = current_session_data.turn
+        root_node = graph.update_node_metadata(
+            root_node_id,
+            updated_by=self.stage_name,
+            reason=f"Follow-up query (turn {turn}) in session {current_session_data.session_id}",
+            description=f"Understanding of the task based on the follow-up query: '{query}'.",
+            query_context=query,
+        )
+        logger.info(
+            f"Root node '{root_node.label}' (ID: {root_node.id}) updated for turn {turn}."
+        )
+        context_update = {
+            "root_node_id": root_node.id,
+            "initial_disciplinary_tags": list(root_node.metadata.disciplinary_tags),
+        }
+        return StageOutput(
+            summary=f"Continued the session graph; root node '{root_node.label}' (ID: {root_node.id}) updated for the query of turn {turn}.",
+            metrics={
+                "nodes_created": 0,
+                "initial_confidence_avg": root_node.confidence.average_confidence,
+                "layer_count_initialized": len(graph.layers),
+            },
+            next_stage_context_update={self.stage_name: context_update},
+        )
@@ -10,6 +10,8 @@ from .base_stage import BaseStage, StageOutput # Ensure StageOutput is imported
 
 class DecompositionStage(BaseStage):
     stage_name: str = "DecompositionStage"
+    reuse_output_on_resume: bool = True
+    requires = ("InitializationStage", "operational_params")
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -66,6 +68,9 @@ class DecompositionStage(BaseStage):
         dimension_node_ids: List[str] = []
         nodes_created_count = 0
         edges_created_count = 0
+        # Collected here and inserted with one bulk call each after the loop
+        dimension_nodes: List[Node] = []
+        decomposition_edges: List[Edge] = []
 
         root_node = graph.get_node(root_node_id)
         root_node_layer = root_node.metadata.layer_id if root_node else self.default_params.initial_layer
@@ -93,7 +98,7 @@ class DecompositionStage(BaseStage):
                 confidence=dim_confidence,
                 metadata=dim_metadata
             )
-            graph.add_node(dimension_node)
+            dimension_nodes.append(dimension_node)
             dimension_node_ids.append(dimension_node.id)
             nodes_created_count += 1
 
@@ -109,16 +114,15 @@ class DecompositionStage(BaseStage):
                 confidence=0.95, # High confidence in the structural decomposition link
                 metadata=edge_metadata
             )
-            graph.add_edge(decomposition_edge)
+            decomposition_edges.append(decomposition_edge)
             edges_created_count += 1
             logger.debug(f"Created dimension node '{dim_label}' (ID: {dim_id}) and linked to root node {root_node_id}.")
 
+        graph.add_nodes_bulk(dimension_nodes)
+        graph.add_edges_bulk(decomposition_edges)
+
         # Build the summary of dimension labels for the output
-        dimension_labels: List[str] = []
-        for nid in dimension_node_ids:
-            node = graph.get_node(nid)
-            if node:
-                dimension_labels.append(node.label)
+        dimension_labels: List[str] = [node.label for node in dimension_nodes]
 
         summary = f"Task decomposed into {len(dimension_node_ids)} dimensions: {', '.join(dimension_labels)}."
 
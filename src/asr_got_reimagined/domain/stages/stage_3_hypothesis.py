@@ -30,6 +30,8 @@ from .stage_2_decomposition import DecompositionStage
 
 class HypothesisStage(BaseStage):
     stage_name: str = "HypothesisStage"
+    reuse_output_on_resume: bool = True
+    requires = (DecompositionStage.stage_name, "operational_params")
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -150,6 +152,9 @@ class HypothesisStage(BaseStage):
         all_hypothesis_node_ids: List[str] = []
         nodes_created_count = 0
         edges_created_count = 0
+        # Collected across all dimensions and inserted in bulk after the loop
+        hypothesis_nodes: List[Node] = []
+        hypothesis_edges: List[Edge] = []
 
         # P1.3: Generate k hypotheses per dimension node (k is configurable)
         # Allow override from operational_params, else use config range
@@ -212,7 +217,7 @@ class HypothesisStage(BaseStage):
                     confidence=hypo_confidence,
                     metadata=hypo_metadata,
                 )
-                graph.add_node(hypothesis_node)
+                hypothesis_nodes.append(hypothesis_node)
                 all_hypothesis_node_ids.append(hypothesis_node.id)
                 nodes_created_count += 1
                 hypotheses_for_dim_count += 1
@@ -229,12 +234,15 @@ class HypothesisStage(BaseStage):
                         description=f"Hypothesis '{hypothesis_node.label}' generated for dimension '{dimension_node.label}'."
                     ),
                 )
-                graph.add_edge(hypothesis_edge)
+                hypothesis_edges.append(hypothesis_edge)
                 edges_created_count += 1
             logger.debug(
                 f"Generated {hypotheses_for_dim_count} hypotheses for dimension '{dimension_node.label}'."
             )
 
+        graph.add_nodes_bulk(hypothesis_nodes)
+        graph.add_edges_bulk(hypothesis_edges)
+
         summary = f"Generated a total of {nodes_created_count} hypotheses across {len(dimension_node_ids)} dimensions."
         metrics = {
             "hypotheses_generated_total": nodes_created_count,
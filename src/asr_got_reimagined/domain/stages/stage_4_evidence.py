@@ -1,6 +1,6 @@
 import datetime
 import random
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from loguru import logger  # type: ignore
 
@@ -28,6 +28,7 @@ from src.asr_got_reimagined.domain.utils.math_helpers import (
     bayesian_update_confidence,
     calculate_information_gain,
 )
+from src.asr_got_reimagined.domain.utils.deadline import current_deadline
 from src.asr_got_reimagined.domain.utils.metadata_helpers import (
     calculate_semantic_similarity,
 )
@@ -38,6 +39,8 @@ from .stage_3_hypothesis import HypothesisStage  # To access hypothesis_node_ids
 
 class EvidenceStage(BaseStage):
     stage_name: str = "EvidenceStage"
+    requires = (HypothesisStage.stage_name,)
+    budget_weight = 3.0
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -152,16 +155,21 @@ class EvidenceStage(BaseStage):
         )
         return generated_evidence_data
 
-    async def _create_evidence_node_and_link(
+    async def _build_evidence_node_and_link(
         self,
-        graph: ASRGoTGraph,
         hypothesis_node: Node,
         evidence_data: Dict[str, Any],
+        turn: int,
         iteration: int,
         evidence_index: int,
-    ) -> Optional[Node]:
-        """Creates an evidence node and links it to the hypothesis."""
-        evidence_id = f"ev_{hypothesis_node.id}_{iteration}_{evidence_index}"
+    ) -> Tuple[Node, Edge]:
+        """
+        Builds an evidence node and the edge linking it to the hypothesis.
+        The caller inserts them into the graph (in bulk, per plan execution).
+        The session turn keeps IDs unique when a resumed session gathers
+        evidence for the same hypotheses again.
+        """
+        evidence_id = f"ev_t{turn}_{hypothesis_node.id}_{iteration}_{evidence_index}"
         # P1.10, P1.24, P1.25: Determine edge type (simplified)
         edge_type = (
             EdgeType.SUPPORTIVE
@@ -205,7 +213,6 @@ class EvidenceStage(BaseStage):
             confidence=evidence_confidence_vec,
             metadata=evidence_metadata,
         )
-        graph.add_node(evidence_node)
 
         # P1.10: Link evidence E_r to hypothesis h*
         edge_to_hypo_id = f"edge_ev_{evidence_node.id}_{hypothesis_node.id}"
@@ -223,22 +230,22 @@ class EvidenceStage(BaseStage):
             ],  # Edge confidence reflects evidence strength
             metadata=edge_metadata,
         )
-        graph.add_edge(edge_to_hypo)
         logger.debug(
             f"Created evidence node {evidence_node.id} and linked to hypothesis {hypothesis_node.id} with type {edge_type.value}."
         )
-        return evidence_node
+        return evidence_node, edge_to_hypo
 
     async def _try_create_interdisciplinary_bridge_node(
         self, graph: ASRGoTGraph, evidence_node: Node, hypothesis_node: Node
     ) -> Optional[str]:
         """P1.8: Create Interdisciplinary Bridge Node (IBN)"""
-        hypo_tags = hypothesis_node.metadata.disciplinary_tags
-        ev_tags = evidence_node.metadata.disciplinary_tags
+        # Interned tag bitmasks: the overlap test is a single AND
+        hypo_tag_mask = graph.node_tag_mask(hypothesis_node.id)
+        ev_tag_mask = graph.node_tag_mask(evidence_node.id)
 
-        if not hypo_tags or not ev_tags:
+        if not hypo_tag_mask or not ev_tag_mask:
             return None  # Need tags on both
-        if hypo_tags.intersection(ev_tags):
+        if hypo_tag_mask & ev_tag_mask:
             return None  # Disciplines overlap, no bridge needed by this rule
 
         # Check semantic similarity (P1.8) - simplified
@@ -255,7 +262,9 @@ class EvidenceStage(BaseStage):
         ibn_label = (
             f"IBN: {evidence_node.label[:20]}... <=> {hypothesis_node.label[:20]}..."
         )
-        combined_tags = hypo_tags.union(ev_tags)
+        hypo_tags = graph.tags_from_mask(hypo_tag_mask)
+        ev_tags = graph.tags_from_mask(ev_tag_mask)
+        combined_tags = graph.tags_from_mask(hypo_tag_mask | ev_tag_mask)
 
         ibn_metadata = NodeMetadata(
             description=f"Interdisciplinary bridge connecting concepts from domains {hypo_tags} and {ev_tags}.",
@@ -336,6 +345,12 @@ class EvidenceStage(BaseStage):
                 hyperedge_node_ids = {hypothesis_node.id} | {
                     en.id for en in related_evidence_nodes
                 }
+                # Skip if the hypothesis already has a hyperedge over exactly these nodes
+                if any(
+                    existing.node_ids == hyperedge_node_ids
+                    for existing in graph.hyperedges_of(hypothesis_node.id)
+                ):
+                    return created_hyperedge_ids
                 hyperedge_id = (
                     f"hyper_{hypothesis_node.id}_{random.randint(1000, 9999)}"
                 )
@@ -420,14 +435,20 @@ class EvidenceStage(BaseStage):
         hypotheses_confidence_updated_total = 0
         ibns_created_total = 0
         hyperedges_created_total = 0
-        iteration = -1  # Default value in case no iterations are run
+        completed_iterations = 0
 
         processed_hypotheses_this_stage: Set[str] = (
             set()
         )  # Track to avoid re-processing in one stage run
 
-        # P1.4: Iterative loop
+        # P1.4: Iterative loop, for as long as the query's time budget allows
+        deadline = current_deadline()
         for iteration in range(self.max_iterations):
+            if deadline.expired():
+                deadline.degrade(
+                    f"Evidence integration stopped after {completed_iterations} of {self.max_iterations} iterations."
+                )
+                break
             logger.info(
                 f"Evidence integration iteration {iteration + 1}/{self.max_iterations}"
             )
@@ -457,28 +478,36 @@ class EvidenceStage(BaseStage):
             if not found_evidence_data_list:
                 logger.debug(        f"No new evidence found for hypothesis '{hypothesis_to_evaluate.label}'."
                 )
+                completed_iterations += 1
                 continue
 
             related_evidence_nodes_for_current_hypo: List[Node] = []
 
-            for ev_idx, ev_data in enumerate(found_evidence_data_list):
-                # P1.4: Create evidence nodes E_r and link to h* (P1.10, P1.24, P1.25 for edge types)
-                evidence_node = await self._create_evidence_node_and_link(
-                    graph, hypothesis_to_evaluate, ev_data, iteration, ev_idx
+            # P1.4: Create evidence nodes E_r and link to h* (P1.10, P1.24, P1.25 for edge types)
+            built_evidence = [
+                await self._build_evidence_node_and_link(
+                    hypothesis_to_evaluate,
+                    ev_data,
+                    current_session_data.turn,
+                    iteration,
+                    ev_idx,
                 )
-                if not evidence_node:
-                    continue
+                for ev_idx, ev_data in enumerate(found_evidence_data_list)
+            ]
+            graph.add_nodes_bulk(node for node, _ in built_evidence)
+            graph.add_edges_bulk(edge for _, edge in built_evidence)
+
+            for (evidence_node, connecting_edge), ev_data in zip(
+                built_evidence, found_evidence_data_list, strict=True
+            ):
                 evidence_nodes_created_total += 1
                 related_evidence_nodes_for_current_hypo.append(evidence_node)
 
                 # P1.4: Update h*.confidence vector C via Bayesian methods (P1.14)
                 # This uses evidence reliability (P1.26 power) and edge type
                 prior_hypo_confidence = hypothesis_to_evaluate.confidence
-                # Find the edge connecting this evidence to the hypothesis to get its type
-                connecting_edge = graph.get_edge(
-                    f"edge_ev_{evidence_node.id}_{hypothesis_to_evaluate.id}"
-                )
-                edge_type_for_update = connecting_edge.type if connecting_edge else None
+                # The edge connecting this evidence to the hypothesis gives its type
+                edge_type_for_update = connecting_edge.type
 
                 new_hypo_confidence = bayesian_update_confidence(
                     prior_confidence=prior_hypo_confidence,
@@ -487,7 +516,9 @@ class EvidenceStage(BaseStage):
                     statistical_power=ev_data["statistical_power"],  # P1.26
                     edge_type=edge_type_for_update,  # P1.10
                 )
-                hypothesis_to_evaluate.update_confidence(
+                # Rebind: the graph hands back its own copy if a snapshot shared the node
+                hypothesis_to_evaluate = graph.update_node_confidence(
+                    hypothesis_to_evaluate.id,
                     new_hypo_confidence,
                     updated_by=self.stage_name,
                     reason=f"Evidence integration: {evidence_node.id}",
@@ -520,6 +551,7 @@ class EvidenceStage(BaseStage):
                 graph, hypothesis_to_evaluate, related_evidence_nodes_for_current_hypo
             )
             hyperedges_created_total += len(new_hyper_ids)
+            completed_iterations += 1
 
         # P1.4 actions after loop (or potentially within, if dynamic):
         # Apply temporal decay (P1.18) & detect temporal patterns (P1.25)
@@ -528,15 +560,13 @@ class EvidenceStage(BaseStage):
         await self._adapt_graph_topology(graph)
 
         summary = (
-            f"Evidence integration completed over {iteration + 1 if self.max_iterations > 0 and hypothesis_node_ids else 0} iterations. "
+            f"Evidence integration completed over {completed_iterations} iterations. "
             f"Created {evidence_nodes_created_total} evidence nodes. "
             f"Updated {hypotheses_confidence_updated_total} hypotheses. "
             f"Created {ibns_created_total} IBNs and {hyperedges_created_total} hyperedges."
         )
         metrics = {
-            "iterations_completed": iteration + 1
-            if self.max_iterations > 0 and hypothesis_node_ids
-            else 0,
+            "iterations_completed": completed_iterations,
             "evidence_nodes_created": evidence_nodes_created_total,
             "hypotheses_confidence_updated": hypotheses_confidence_updated_total,
             "ibns_created": ibns_created_total,
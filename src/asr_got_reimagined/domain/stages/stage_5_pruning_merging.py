@@ -4,22 +4,27 @@ from loguru import logger
 
 from src.asr_got_reimagined.config import Settings
 from src.asr_got_reimagined.domain.models.graph_elements import (
-    Edge,
     Node,
     NodeType,
     RevisionRecord,
 )
-from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
+from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph, MergePolicy
 from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
+from src.asr_got_reimagined.domain.utils.deadline import current_deadline
 from src.asr_got_reimagined.domain.utils.metadata_helpers import (
     calculate_semantic_similarity,  # Using our placeholder
 )
 
 from .base_stage import BaseStage, StageOutput
 
+# Nodes each node is compared with when merging under time pressure
+MERGE_NEIGHBOR_WINDOW = 5
+
 
 class PruningMergingStage(BaseStage):
     stage_name: str = "PruningMergingStage"
+    requires = ()  # Works on the graph alone
+    budget_weight = 2.0
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -32,9 +37,9 @@ class PruningMergingStage(BaseStage):
             self.default_params.merging_semantic_overlap_threshold
         )
 
-    def _should_prune_node(self, node: Node) -> bool:
+    def _select_nodes_to_prune(self, graph: ASRGoTGraph) -> List[str]:
         """
-        Determines if a node should be pruned based on P1.5.
+        Selects nodes to prune based on P1.5.
         Pruning threshold: min(E[C]) < threshold & low impact (P1.28).
         Note: P1.5 says "min(E[C])", which means the minimum of the *expected values* of
         the confidence components if they were distributions.
@@ -42,57 +47,76 @@ class PruningMergingStage(BaseStage):
         So, min(C_components) < threshold.
         """
         # Avoid pruning essential structural nodes
-        if node.type in [NodeType.ROOT, NodeType.DECOMPOSITION_DIMENSION]:
-            return False
-
-        # P1.5: Pruning threshold: min(C_components) < X
-        min_confidence_component = min(node.confidence.to_list())
-
-        # P1.5 also says "& low impact (P1.28)"
-        impact_score = node.metadata.impact_score or 0.0  # Default to 0 if not set
-
-        if (
-            min_confidence_component < self.pruning_confidence_threshold
-            and impact_score < self.pruning_impact_threshold
-        ):
-            logger.debug(
-                f"Node '{node.label}' (ID: {node.id}) marked for pruning. Min Confidence: {min_confidence_component:.2f}, Impact: {impact_score:.2f}"
-            )
-            return True
-        return False
+        prunable_types = [
+            t
+            for t in NodeType
+            if t not in (NodeType.ROOT, NodeType.DECOMPOSITION_DIMENSION)
+        ]
+        scores = graph.node_scores(
+            node.id for node in graph.nodes_of_type(*prunable_types)
+        )
+        # P1.5: min(C_components) < X, "& low impact (P1.28)"; evaluated column-wise
+        prune_mask = (scores.min_confidence < self.pruning_confidence_threshold) & (
+            scores.impact < self.pruning_impact_threshold
+        )
+        return scores.ids_where(prune_mask)
 
     async def _prune_nodes(self, graph: ASRGoTGraph) -> int:
         """Prunes nodes based on criteria."""
-        nodes_to_prune_ids: Set[str] = set()
-        for node_id, node_obj in list(
-            graph.nodes.items()
-        ):  # Iterate over a copy for safe removal
-            if self._should_prune_node(node_obj):
-                nodes_to_prune_ids.add(node_id)
-
-        pruned_count = 0
-        for node_id in nodes_to_prune_ids:
-            # Removing a node from ASRGoTGraph should also handle NetworkX graph and related edges.
-            # The current ASRGoTGraph.remove_node is basic. A more robust version would
-            # properly remove associated edges from self.edges and self.hyperedges.
-            removed_node = graph.remove_node(node_id)
-            if removed_node:
-                # Log the pruning in the graph's metadata or a dedicated audit log if needed
-                removed_node.metadata.revision_history.append(
-                    RevisionRecord(
-                        user_or_process=self.stage_name,
-                        action="pruned",
-                        changes_made={"status": "removed"},
-                        reason=f"Low confidence (min_comp < {self.pruning_confidence_threshold}) and low impact (< {self.pruning_impact_threshold}).",
-                    )
+        nodes_to_prune_ids = self._select_nodes_to_prune(graph)
+
+        # Cascading bulk removal also drops incident edges, hyperedge memberships
+        # and layer assignments of the pruned nodes.
+        removed_nodes = graph.remove_nodes(nodes_to_prune_ids)
+        for removed_node in removed_nodes:
+            # Log the pruning on the removed node in case it is kept for auditing
+            removed_node.metadata.revision_history.append(
+                RevisionRecord(
+                    user_or_process=self.stage_name,
+                    action="pruned",
+                    changes_made={"status": "removed"},
+                    reason=f"Low confidence (min_comp < {self.pruning_confidence_threshold}) and low impact (< {self.pruning_impact_threshold}).",
                 )
-                # We don't re-add the node, but this shows how to record it if needed.
-                # For now, graph.remove_node is sufficient.
-                pruned_count += 1
+            )
+        pruned_count = len(removed_nodes)
         if pruned_count > 0:
             logger.info(f"Pruned {pruned_count} low-confidence/low-impact nodes.")
         return pruned_count
 
+    def _collect_merge_candidate(
+        self,
+        node1: Node,
+        node2: Node,
+        potential_merge_pairs: List[Tuple[str, str, float]],
+    ) -> None:
+        """Records (node1, node2) as a merge candidate if their semantic overlap is high enough."""
+        # P1.5: semantic_overlap (using placeholder)
+        # For actual semantic overlap, use NLP techniques on node.label, node.metadata.description, etc.
+        # Our calculate_semantic_similarity is a very basic placeholder.
+        text1_to_compare = node1.label + " " + (node1.metadata.description or "")
+        text2_to_compare = node2.label + " " + (node2.metadata.description or "")
+        overlap_score = calculate_semantic_similarity(text1_to_compare, text2_to_compare)
+
+        if overlap_score >= self.merging_semantic_overlap_threshold:
+            potential_merge_pairs.append((node1.id, node2.id, overlap_score))
+            logger.debug(
+                f"Potential merge: {node1.id} and {node2.id} (Overlap: {overlap_score:.2f})"
+            )
+
+    def _collect_neighbor_merge_candidates(
+        self, nodes: List[Node], potential_merge_pairs: List[Tuple[str, str, float]]
+    ) -> None:
+        """
+        Sorted-neighborhood candidates: sorts `nodes` by label and compares each
+        only with the next MERGE_NEIGHBOR_WINDOW nodes, O(n) pairs instead of
+        O(n^2). Near-duplicate labels sort next to each other, so most merges
+        are still found.
+        """
+        ordered = sorted(nodes, key=lambda node: node.label.lower())
+        for i, node1 in enumerate(ordered):
+            for node2 in ordered[i + 1 : i + 1 + MERGE_NEIGHBOR_WINDOW]:
+                self._collect_merge_candidate(node1, node2, potential_merge_pairs)
+
     async def _merge_nodes(self, graph: ASRGoTGraph) -> int:
         """
         Merges highly similar nodes based on P1.5.
@@ -117,37 +141,31 @@ class PruningMergingStage(BaseStage):
             NodeType.EVIDENCE,
         ]  # Extend as needed
 
-        nodes_list = list(graph.nodes.values())  # Get a list of node objects
-
-        for i in range(len(nodes_list)):
-            node1 = nodes_list[i]
-            if node1.type not in comparable_node_types:
-                continue
-
-            for j in range(i + 1, len(nodes_list)):
-                node2 = nodes_list[j]
-                if node2.type != node1.type:  # Only merge nodes of the same type
-                    continue
-
-                # P1.5: semantic_overlap (using placeholder)
-                # For actual semantic overlap, use NLP techniques on node.label, node.metadata.description, etc.
-                # Our calculate_semantic_similarity is a very basic placeholder.
-                text1_to_compare = (
-                    node1.label + " " + (node1.metadata.description or "")
-                )
-                text2_to_compare = (
-                    node2.label + " " + (node2.metadata.description or "")
+        deadline = current_deadline()
+        for node_type in comparable_node_types:
+            # Only merge nodes of the same type, so compare within each type bucket
+            nodes_list = graph.nodes_of_type(node_type)
+            compared_rows = len(nodes_list)
+            for i in range(len(nodes_list)):
+                if deadline.expired():
+                    compared_rows = i
+                    break
+                node1 = nodes_list[i]
+                for j in range(i + 1, len(nodes_list)):
+                    node2 = nodes_list[j]
+                    self._collect_merge_candidate(node1, node2, potential_merge_pairs)
+            if compared_rows < len(nodes_list) - 1:
+                # Out of time: pairs among the remaining nodes come from the
+                # cheaper sorted-neighborhood strategy instead
+                remaining_nodes = nodes_list[compared_rows:]
+                self._collect_neighbor_merge_candidates(
+                    remaining_nodes, potential_merge_pairs
                 )
-                overlap_score = calculate_semantic_similarity(
-                    text1_to_compare, text2_to_compare
+                deadline.degrade(
+                    f"Merge candidates for {len(remaining_nodes)} {node_type.value} nodes "
+                    f"compared only with their {MERGE_NEIGHBOR_WINDOW} nearest neighbors by label."
                 )
 
-                if overlap_score >= self.merging_semantic_overlap_threshold:
-                    potential_merge_pairs.append((node1.id, node2.id, overlap_score))
-                    logger.debug(
-                        f"Potential merge: {node1.id} and {node2.id} (Overlap: {overlap_score:.2f})"
-                    )
-
         # Sort pairs by overlap score (descending) to merge strongest overlaps first
         potential_merge_pairs.sort(key=lambda x: x[2], reverse=True)
 
@@ -186,107 +204,18 @@ class PruningMergingStage(BaseStage):
             logger.info(
                 f"Merging node '{merge_away_node.label}' (ID: {merge_away_node.id}) into "
                 f"'{keep_node.label}' (ID: {keep_node.id}). Overlap: {overlap_score:.2f}"
-            )            # 1. Re-wire edges: Point edges from/to merge_away_node to keep_node
-            # This requires iterating through graph.edges and graph.nx_graph
-            # This is a complex step and needs careful handling in ASRGoTGraph for robust implementation.
-            # For now, simplified in ASRGoTGraph.remove_node, but true merge needs more.
-
-            # For each incoming edge to merge_away_node:
-            for edge_id, edge_obj in list(graph.edges.items()):  # Iterate on copy
-                if edge_obj.target_id == merge_away_node.id:
-                    # Recreate edge pointing to keep_node if not already existing with same type
-                    new_edge = Edge(
-                        source_id=edge_obj.source_id,
-                        target_id=keep_node.id,
-                        type=edge_obj.type,
-                        confidence=edge_obj.confidence,
-                        metadata=edge_obj.metadata,
-                    )
-                    # Avoid duplicate edges of same type between same nodes unless MultiDiGraph logic handles it by ID
-                    # Check if such an edge type already exists
-                    exists = any(
-                        e.source_id == new_edge.source_id
-                        and e.target_id == new_edge.target_id
-                        and e.type == new_edge.type
-                        for e in graph.edges.values()
-                    )
-                    if not exists:
-                        graph.add_edge(new_edge)
-                    graph.remove_edge(edge_id)  # Remove old edge
-
-            # For each outgoing edge from merge_away_node:
-            for edge_id, edge_obj in list(graph.edges.items()):  # Iterate on copy
-                if edge_obj.source_id == merge_away_node.id:
-                    new_edge = Edge(
-                        source_id=keep_node.id,
-                        target_id=edge_obj.target_id,
-                        type=edge_obj.type,
-                        confidence=edge_obj.confidence,
-                        metadata=edge_obj.metadata,
-                    )
-                    exists = any(
-                        e.source_id == new_edge.source_id
-                        and e.target_id == new_edge.target_id
-                        and e.type == new_edge.type
-                        for e in graph.edges.values()
-                    )
-                    if not exists:
-                        graph.add_edge(new_edge)
-                    graph.remove_edge(edge_id)
-
-            # 2. Combine metadata (heuristic: append lists, take max for scores, etc.)
-            # Example: combine disciplinary tags
-            keep_node.metadata.disciplinary_tags.update(
-                merge_away_node.metadata.disciplinary_tags
-            )
-            # Example: combine descriptions (simple append)
-            if merge_away_node.metadata.description:
-                keep_node.metadata.description = (
-                    (keep_node.metadata.description or "")
-                    + f"\nMerged content from {merge_away_node.id}: {merge_away_node.metadata.description}"
-                )
-            # Update confidence - e.g., weighted average or max, needs careful thought based on P1.14 principles
-            # Take the maximum value for each confidence component
-            
-            # Calculate max values for each component
-            new_emp = max(
-                keep_node.confidence.empirical_support,
-                merge_away_node.confidence.empirical_support,
-            )
-            new_coherence = max(
-                keep_node.confidence.coherence,
-                merge_away_node.confidence.coherence,
-            )
-            new_reliability = max(
-                keep_node.confidence.reliability,
-                merge_away_node.confidence.reliability,
             )
-            new_robustness = max(
-                keep_node.confidence.robustness,
-                merge_away_node.confidence.robustness,
-            )
-            
-            # Update the confidence attributes directly instead of creating a new object
-            keep_node.confidence.empirical_support = new_emp
-            keep_node.confidence.coherence = new_coherence
-            keep_node.confidence.reliability = new_reliability
-            keep_node.confidence.robustness = new_robustness
 
-            keep_node.metadata.revision_history.append(
-                RevisionRecord(
-                    user_or_process=self.stage_name,
-                    action="merged_node_into_this",
-                    changes_made={
-                        "merged_from_id": merge_away_node.id,
-                        "overlap_score": overlap_score,
-                    },
-                    reason=f"High semantic overlap ({overlap_score:.2f}) with {merge_away_node.id}.",
-                )
+            # Re-wire incident edges, combine metadata/confidence and remove the
+            # merged-away node in one O(degree) graph operation.
+            graph.merge_nodes(
+                keep_node.id,
+                merge_away_node.id,
+                policy=MergePolicy.MAX,  # Take the maximum value for each confidence component
+                merged_by=self.stage_name,
+                reason=f"High semantic overlap ({overlap_score:.2f}) with {merge_away_node.id}.",
+                details={"overlap_score": overlap_score},
             )
-            keep_node.touch()
-
-            # 3. Remove merge_away_node
-            graph.remove_node(merge_away_node.id)
             merged_away_ids.add(merge_away_node.id)
             merged_nodes_count += 1
 
@@ -306,16 +235,17 @@ class PruningMergingStage(BaseStage):
         merged_count = await self._merge_nodes(graph)
 
         summary = f"Graph refinement completed. Pruned {pruned_count} nodes. Merged {merged_count} nodes (pairs)."
+        statistics = graph.get_statistics()
         metrics = {
             "nodes_pruned": pruned_count,
             "nodes_merged_away": merged_count,  # Each merge operation removes one node
-            "nodes_remaining": graph.get_statistics().node_count,
-            "edges_remaining": graph.get_statistics().edge_count,
+            "nodes_remaining": statistics.node_count,
+            "edges_remaining": statistics.edge_count,
         }
         # No specific context update for next stage, graph is modified in-place.
         context_update = {
             "pruning_merging_completed": True,
-            "nodes_after_pruning_merging": graph.get_statistics().node_count,
+            "nodes_after_pruning_merging": statistics.node_count,
         }
 
         output = StageOutput(
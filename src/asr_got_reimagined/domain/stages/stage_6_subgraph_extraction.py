@@ -1,5 +1,6 @@
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, NamedTuple, Optional, Set
 
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel, Field  # For defining subgraph criteria structure
 
@@ -8,7 +9,7 @@ from src.asr_got_reimagined.domain.models.graph_elements import Node, NodeType
 from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
 from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
 
-from .base_stage import BaseStage, StageOutput
+from .base_stage import BaseStage, GraphAccess, StageOutput
 
 
 # Pydantic model for defining a single subgraph extraction strategy
@@ -32,6 +33,14 @@ class SubgraphCriterion(BaseModel):
     )  # How many levels of neighbors to include
 
 
+class _CriterionMasks(NamedTuple):
+    """Tag and layer filters of a SubgraphCriterion as interned bitmasks."""
+
+    include_tags: int
+    exclude_tags: int
+    layers: int
+
+
 class ExtractedSubgraph(BaseModel):
     name: str
     description: str
@@ -44,6 +53,8 @@ class ExtractedSubgraph(BaseModel):
 
 class SubgraphExtractionStage(BaseStage):
     stage_name: str = "SubgraphExtractionStage"
+    requires = ("operational_params",)
+    graph_access = GraphAccess.READ
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -80,24 +91,21 @@ class SubgraphExtractionStage(BaseStage):
             # Add more criteria: e.g., discipline-specific, layer-specific, causal chains
         ]
 
-    def _node_matches_criteria(self, node: Node, criterion: SubgraphCriterion) -> bool:
-        """Checks if a single node matches the filtering criteria."""
-        if (
-            criterion.min_avg_confidence is not None
-            and node.confidence.average_confidence < criterion.min_avg_confidence
-        ):
-            return False
-        if (
-            criterion.min_impact_score is not None
-            and (node.metadata.impact_score or 0.0) < criterion.min_impact_score
-        ):
-            return False
+    def _node_matches_criteria(
+        self,
+        graph: ASRGoTGraph,
+        node: Node,
+        criterion: SubgraphCriterion,
+        masks: "_CriterionMasks",
+    ) -> bool:
+        """
+        Checks if a single node matches the non-numeric filtering criteria.
+        Confidence and impact thresholds are applied by _filter_by_scores; layer
+        and tag filters are bitmask tests against the graph's interned vocabularies.
+        """
         if criterion.node_types and node.type not in criterion.node_types:
             return False
-        if criterion.layer_ids and (
-            node.metadata.layer_id is None
-            or node.metadata.layer_id not in criterion.layer_ids
-        ):
+        if criterion.layer_ids and not graph.node_layer_mask(node.id) & masks.layers:
             return False
         if (
             criterion.is_knowledge_gap is not None
@@ -105,16 +113,11 @@ class SubgraphExtractionStage(BaseStage):
         ):
             return False
 
-        if criterion.include_disciplinary_tags:
-            if not node.metadata.disciplinary_tags.intersection(
-                set(criterion.include_disciplinary_tags)
-            ):
-                return False
-        if criterion.exclude_disciplinary_tags:
-            if node.metadata.disciplinary_tags.intersection(
-                set(criterion.exclude_disciplinary_tags)
-            ):
-                return False
+        tag_mask = graph.node_tag_mask(node.id)
+        if criterion.include_disciplinary_tags and not tag_mask & masks.include_tags:
+            return False
+        if tag_mask & masks.exclude_tags:
+            return False
 
         # Placeholder for temporal_recency_days (P1.18)
         # if criterion.temporal_recency_days is not None:
@@ -123,13 +126,54 @@ class SubgraphExtractionStage(BaseStage):
         #         return False
         return True
 
+    def _candidate_node_ids(
+        self, graph: ASRGoTGraph, criterion: SubgraphCriterion
+    ) -> Set[str]:
+        """
+        Narrows the nodes to test against a criterion using the graph's type,
+        layer and tag indexes. Remaining filters are applied by _node_matches_criteria.
+        """
+        candidates: Optional[Set[str]] = None
+        if criterion.node_types:
+            candidates = graph.node_ids_of_type(*criterion.node_types)
+        if criterion.layer_ids:
+            in_layers = graph.node_ids_in_layers(*criterion.layer_ids)
+            candidates = in_layers if candidates is None else candidates & in_layers
+        if criterion.include_disciplinary_tags:
+            tagged = graph.node_ids_with_any_tag(criterion.include_disciplinary_tags)
+            candidates = tagged if candidates is None else candidates & tagged
+        if candidates is None:
+            return set(graph.nodes)
+        return candidates
+
+    def _filter_by_scores(
+        self, graph: ASRGoTGraph, node_ids: Set[str], criterion: SubgraphCriterion
+    ) -> List[str]:
+        """Applies the confidence/impact thresholds as one vectorized mask."""
+        if criterion.min_avg_confidence is None and criterion.min_impact_score is None:
+            return list(node_ids)
+        scores = graph.node_scores(node_ids)
+        mask = np.ones(len(scores.node_ids), dtype=bool)
+        if criterion.min_avg_confidence is not None:
+            mask &= scores.average_confidence >= criterion.min_avg_confidence
+        if criterion.min_impact_score is not None:
+            mask &= scores.impact >= criterion.min_impact_score
+        return scores.ids_where(mask)
+
     async def _extract_single_subgraph(
         self, graph: ASRGoTGraph, criterion: SubgraphCriterion
     ) -> ExtractedSubgraph:
         """Extracts one subgraph based on a single criterion."""
         seed_node_ids: Set[str] = set()
-        for node_id, node_obj in graph.nodes.items():
-            if self._node_matches_criteria(node_obj, criterion):
+        candidate_ids = self._candidate_node_ids(graph, criterion)
+        masks = _CriterionMasks(
+            include_tags=graph.tag_mask(criterion.include_disciplinary_tags or ()),
+            exclude_tags=graph.tag_mask(criterion.exclude_disciplinary_tags or ()),
+            layers=graph.layer_mask(criterion.layer_ids or ()),
+        )
+        for node_id in self._filter_by_scores(graph, candidate_ids, criterion):
+            node = graph.nodes[node_id]
+            if self._node_matches_criteria(graph, node, criterion, masks):
                 seed_node_ids.add(node_id)
 
         final_subgraph_node_ids: Set[str] = set(seed_node_ids)
@@ -198,19 +242,18 @@ class SubgraphExtractionStage(BaseStage):
             )
 
         extracted_subgraphs_results: List[ExtractedSubgraph] = []
-        for criterion in criteria_to_use:
-            if graph.get_statistics().node_count == 0:  # No nodes to process
-                logger.warning(
-                    f"Skipping subgraph extraction criterion '{criterion.name}' as graph is empty."
-                )
-                continue
-            try:
-                subgraph_result = await self._extract_single_subgraph(graph, criterion)
-                if subgraph_result.node_ids:  # Only add if non-empty
-                    extracted_subgraphs_results.append(subgraph_result)
-            except Exception as e:
-                logger.error(f"Error extracting subgraph for criterion '{criterion.name}': {e}")
-                continue
+        if graph.get_statistics().node_count == 0:  # No nodes to process
+            logger.warning(
+                f"Skipping {len(criteria_to_use)} subgraph extraction criteria as graph is empty."
+            )
+        else:
+            for criterion in criteria_to_use:
+                try:
+                    subgraph_result = await self._extract_single_subgraph(graph, criterion)
+                    if subgraph_result.node_ids:  # Only add if non-empty
+                        extracted_subgraphs_results.append(subgraph_result)
+                except Exception as e:
+                    logger.error(f"Error extracting subgraph for criterion '{criterion.name}': {e}")
 
         summary = f"Subgraph extraction complete. Extracted {len(extracted_subgraphs_results)} subgraphs based on defined criteria."
         metrics = {
@@ -1,6 +1,7 @@
 import random
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel, Field, ValidationError
 
@@ -11,8 +12,9 @@ from src.asr_got_reimagined.domain.models.graph_elements import (
 )
 from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
 from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
+from src.asr_got_reimagined.domain.utils.deadline import current_deadline
 
-from .base_stage import BaseStage, StageOutput
+from .base_stage import STAGE_TRACE_KEY, BaseStage, GraphAccess, StageOutput
 from .stage_6_subgraph_extraction import (  # To get subgraph definitions
     ExtractedSubgraph,
     SubgraphExtractionStage,
@@ -60,6 +62,9 @@ class ComposedOutput(BaseModel):  # This will be the main "final_composed_answer
 
 class CompositionStage(BaseStage):
     stage_name: str = "CompositionStage"
+    # The reasoning trace summarizes every stage before this one
+    requires = (SubgraphExtractionStage.stage_name, STAGE_TRACE_KEY)
+    graph_access = GraphAccess.READ
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -129,27 +134,27 @@ class CompositionStage(BaseStage):
         )  # Start with all nodes in subgraph
 
         # Highlight a few key nodes from the subgraph (e.g., high confidence/impact)
-        key_nodes_in_subgraph: List[Node] = []
-        for node_id in subgraph_def.node_ids:
-            node = graph.get_node(node_id)
-            if node:
-                # Prioritize HYPOTHESIS or EVIDENCE or IBN nodes for claims
-                if node.type in [
-                    NodeType.HYPOTHESIS,
-                    NodeType.EVIDENCE,
-                    NodeType.INTERDISCIPLINARY_BRIDGE,
-                ] and (
-                    node.confidence.average_confidence > 0.6
-                    or (node.metadata.impact_score or 0) > 0.6
-                ):
-                    key_nodes_in_subgraph.append(node)
-
-        key_nodes_in_subgraph.sort(
-            key=lambda n: (
-                -(n.metadata.impact_score or 0),
-                -n.confidence.average_confidence,
-            )
+        # Prioritize HYPOTHESIS or EVIDENCE or IBN nodes for claims
+        claim_types = {
+            NodeType.HYPOTHESIS,
+            NodeType.EVIDENCE,
+            NodeType.INTERDISCIPLINARY_BRIDGE,
+        }
+        scores = graph.node_scores(
+            node_id
+            for node_id in subgraph_def.node_ids
+            if node_id in graph.nodes and graph.nodes[node_id].type in claim_types
         )
+        avg_confidence = scores.average_confidence
+        key_mask = (avg_confidence > 0.6) | (scores.impact > 0.6)
+        key_rows = np.flatnonzero(key_mask)
+        # Highest impact first, then highest confidence (stable, like list.sort)
+        key_rows = key_rows[
+            np.lexsort((-avg_confidence[key_rows], -scores.impact[key_rows]))
+        ]
+        key_nodes_in_subgraph: List[Node] = [
+            graph.nodes[scores.node_ids[row]] for row in key_rows
+        ]
 
         for i, node in enumerate(
             key_nodes_in_subgraph[:3]
@@ -158,6 +163,13 @@ class CompositionStage(BaseStage):
             content_parts.append(f"Key Point {i + 1}: {claim_text}")
             if citation:
                 citations.append(citation)
+            # P1.9: Note joint (N-ary) relationships this node takes part in
+            for hyperedge in graph.hyperedges_of(node.id):
+                co_members = len(hyperedge.node_ids) - 1
+                content_parts.append(
+                    f"  - Part of joint relationship '{hyperedge.metadata.relationship_descriptor}' "
+                    f"with {co_members} other node(s) [Hyperedge-{hyperedge.id}]"
+                )
             # P1.6: Annotate with edge types (simplified - list connections)
             # incoming_edges = [edge for edge in graph.edges.values() if edge.target_id == node.id and edge.source_id in subgraph_def.node_ids]
             # outgoing_edges = [edge for edge in graph.edges.values() if edge.source_id == node.id and edge.target_id in subgraph_def.node_ids]
@@ -244,8 +256,14 @@ class CompositionStage(BaseStage):
             graph, extracted_subgraphs, initial_query
         )
 
-        # 2. Generate sections from each subgraph
-        for subgraph_def in extracted_subgraphs:
+        # 2. Generate sections from each subgraph, as many as the time budget allows
+        deadline = current_deadline()
+        for section_index, subgraph_def in enumerate(extracted_subgraphs):
+            if deadline.expired():
+                deadline.degrade(
+                    f"Composed {section_index} of {len(extracted_subgraphs)} sections."
+                )
+                break
             try:
                 section, section_citations = await self._generate_section_from_subgraph(
                     graph, subgraph_def
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel, Field, ValidationError
 
@@ -11,7 +12,7 @@ from src.asr_got_reimagined.domain.models.graph_elements import (
 from src.asr_got_reimagined.domain.models.graph_state import ASRGoTGraph
 from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
 
-from .base_stage import BaseStage, StageOutput
+from .base_stage import BaseStage, GraphAccess, StageOutput
 from .stage_7_composition import (  # To access composed output
     ComposedOutput,
     CompositionStage,
@@ -30,6 +31,8 @@ class AuditCheckResult(BaseModel):
 
 class ReflectionStage(BaseStage):
     stage_name: str = "ReflectionStage"
+    requires = (CompositionStage.stage_name,)
+    graph_access = GraphAccess.READ
 
     def __init__(self, settings: Settings):
         super().__init__(settings)
@@ -55,21 +58,22 @@ class ReflectionStage(BaseStage):
         self, graph: ASRGoTGraph
     ) -> AuditCheckResult:
         """P1.7: Check coverage of high-confidence/high-impact nodes/dimensions."""
-        high_conf_nodes = 0
-        high_impact_nodes = 0
-        total_relevant_nodes = 0  # e.g., Hypotheses, Evidence, IBNs
-
-        for node in graph.nodes.values():
-            if node.type in [
+        scores = graph.node_scores(
+            graph.node_ids_of_type(
                 NodeType.HYPOTHESIS,
                 NodeType.EVIDENCE,
                 NodeType.INTERDISCIPLINARY_BRIDGE,
-            ]:
-                total_relevant_nodes += 1
-                if node.confidence.average_confidence >= self.high_confidence_threshold:
-                    high_conf_nodes += 1
-                if (node.metadata.impact_score or 0) >= self.high_impact_threshold:
-                    high_impact_nodes += 1
+            )
+        )
+        total_relevant_nodes = len(scores.node_ids)  # e.g., Hypotheses, Evidence, IBNs
+        high_conf_nodes = int(
+            np.count_nonzero(
+                scores.average_confidence >= self.high_confidence_threshold
+            )
+        )
+        high_impact_nodes = int(
+            np.count_nonzero(scores.impact >= self.high_impact_threshold)
+        )
 
         if total_relevant_nodes == 0:
             return AuditCheckResult(
@@ -172,9 +176,7 @@ class ReflectionStage(BaseStage):
         self, graph: ASRGoTGraph
     ) -> AuditCheckResult:
         """P1.7: Check falsifiability criteria (P1.16) for hypotheses."""
-        hypothesis_nodes = [
-            n for n in graph.nodes.values() if n.type == NodeType.HYPOTHESIS
-        ]
+        hypothesis_nodes = graph.nodes_of_type(NodeType.HYPOTHESIS)
         if not hypothesis_nodes:
             return AuditCheckResult(
                 check_name="hypothesis_falsifiability",
@@ -210,26 +212,22 @@ class ReflectionStage(BaseStage):
 
     async def _check_statistical_rigor(self, graph: ASRGoTGraph) -> AuditCheckResult:
         """P1.7: Check statistical rigor of evidence (P1.26)."""
-        evidence_nodes = [
-            n for n in graph.nodes.values() if n.type == NodeType.EVIDENCE
-        ]
-        if not evidence_nodes:
+        evidence_scores = graph.node_scores(graph.node_ids_of_type(NodeType.EVIDENCE))
+        evidence_count = len(evidence_scores.node_ids)
+        if not evidence_count:
             return AuditCheckResult(
                 check_name="statistical_rigor_of_evidence",
                 status="NOT_APPLICABLE",
                 message="No evidence nodes to assess for statistical rigor.",
             )
 
-        adequately_powered_count = 0
-        for node in evidence_nodes:
-            if (
-                node.metadata.statistical_power
-                and node.metadata.statistical_power.value >= 0.7
-            ):  # Example threshold for "adequate"
-                adequately_powered_count += 1
+        # Example threshold for "adequate"; nodes without a power estimate are NaN
+        adequately_powered_count = int(
+            np.count_nonzero(evidence_scores.power >= 0.7)
+        )
 
-        ratio = adequately_powered_count / len(evidence_nodes)
-        message = f"{adequately_powered_count}/{len(evidence_nodes)} ({ratio:.2%}) evidence nodes meet statistical power criteria (>=0.7)."
+        ratio = adequately_powered_count / evidence_count
+        message = f"{adequately_powered_count}/{evidence_count} ({ratio:.2%}) evidence nodes meet statistical power criteria (>=0.7)."
 
         if ratio >= self.min_powered_evidence_ratio:
             return AuditCheckResult(
@@ -357,49 +355,27 @@ class ReflectionStage(BaseStage):
             except Exception as e:
                 logger.error(f"Unexpected error parsing ComposedOutput: {e}")
 
-        audit_results: List[AuditCheckResult] = []
-
         # Perform P1.7 audit checks
-        try:
-            audit_results.append(await self._check_high_confidence_impact_coverage(graph))
-        except Exception as e:
-            logger.error(f"Error in high_confidence_impact_coverage check: {e}")
-        try:
-            audit_results.append(await self._check_bias_flags_assessment(graph))
-        except Exception as e:
-            logger.error(f"Error in bias_flags_assessment check: {e}")
-        try:
-            audit_results.append(
-                await self._check_knowledge_gaps_addressed(graph, composed_output_obj)
-            )
-        except Exception as e:
-            logger.error(f"Error in knowledge_gaps_addressed check: {e}")
-        try:
-            audit_results.append(await self._check_hypothesis_falsifiability(graph))
-        except Exception as e:
-            logger.error(f"Error in hypothesis_falsifiability check: {e}")
-        try:
-            audit_results.append(await self._check_statistical_rigor(graph))
-        except Exception as e:
-            logger.error(f"Error in statistical_rigor_of_evidence check: {e}")
-        try:
-            audit_results.append(
-                await self._check_causal_claim_validity(graph)
-            )  # Placeholder
-        except Exception as e:
-            logger.error(f"Error in causal_claim_validity check: {e}")
-        try:
-            audit_results.append(
-                await self._check_temporal_consistency(graph)
-            )  # Placeholder
-        except Exception as e:
-            logger.error(f"Error in temporal_consistency check: {e}")
-        try:
-            audit_results.append(
-                await self._check_collaboration_attributions(graph)
-            )  # Placeholder
-        except Exception as e:
-            logger.error(f"Error in collaboration_attributions_check: {e}")
+        checks = {
+            "high_confidence_impact_coverage": lambda: self._check_high_confidence_impact_coverage(graph),
+            "bias_flags_assessment": lambda: self._check_bias_flags_assessment(graph),
+            "knowledge_gaps_addressed": lambda: self._check_knowledge_gaps_addressed(
+                graph, composed_output_obj
+            ),
+            "hypothesis_falsifiability": lambda: self._check_hypothesis_falsifiability(graph),
+            "statistical_rigor_of_evidence": lambda: self._check_statistical_rigor(graph),
+            "causal_claim_validity": lambda: self._check_causal_claim_validity(graph),  # Placeholder
+            "temporal_consistency": lambda: self._check_temporal_consistency(graph),  # Placeholder
+            "collaboration_attributions": lambda: self._check_collaboration_attributions(
+                graph
+            ),  # Placeholder
+        }
+        audit_results: List[AuditCheckResult] = []
+        for check_name, check in checks.items():
+            try:  # Exception, not BaseException: cancellation propagates
+                audit_results.append(await check())
+            except Exception as e:
+                logger.error(f"Error in {check_name} check: {e}")
 
         # Filter out NOT_RUN checks if desired for summary
         active_audit_results = [r for r in audit_results if r.status != "NOT_RUN"]
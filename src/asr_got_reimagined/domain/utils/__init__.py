@@ -1,5 +1,6 @@
 # Makes 'utils' a sub-package for domain utility functions.
 
+from .deadline import Deadline, QueryBudget, current_deadline
 from .graph_analysis_helpers import (  # Placeholder for future graph algorithms
     calculate_node_centrality,
     detect_communities,
@@ -17,5 +18,6 @@ from .metadata_helpers import (  # Placeholder for complex metadata operations
 __all__ = [
     "bayesian_update_confidence", "calculate_information_gain",
     "detect_communities", "calculate_node_centrality",
-    "assess_falsifiability_score", "detect_potential_biases", "calculate_semantic_similarity"
+    "assess_falsifiability_score", "detect_potential_biases", "calculate_semantic_similarity",
+    "Deadline", "QueryBudget", "current_deadline",
 ]
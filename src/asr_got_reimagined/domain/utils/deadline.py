@@ -0,0 +1,84 @@
+"""
+Per-query time budgets (operational parameter "max_latency_ms").
+
+GoTProcessor splits a query's budget across its stages with QueryBudget and
+runs each stage with its Deadline active. A stage reads its deadline with
+current_deadline(), checks expired() at natural stopping points of its work,
+and when out of time cuts the work short, calling degrade() to say how; the
+processor reports those stages as degraded. Without a budget,
+current_deadline() returns a deadline that never expires.
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Sequence
+
+
+class Deadline:
+    __slots__ = ("degradations", "expires_at")
+
+    def __init__(self, expires_at: Optional[float] = None):
+        # time.monotonic() value (the same clock in worker processes); None: no limit
+        self.expires_at = expires_at
+        self.degradations: List[str] = []
+
+    @property
+    def limited(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining_ms(self) -> float:
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, (self.expires_at - time.monotonic()) * 1000)
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def degrade(self, reason: str) -> None:
+        """Records that the stage cut its work short, and how."""
+        self.degradations.append(reason)
+
+
+_ACTIVE_DEADLINE: ContextVar[Optional[Deadline]] = ContextVar(
+    "active_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline:
+    """The deadline of the running stage (an unlimited one if it has none)."""
+    deadline = _ACTIVE_DEADLINE.get()
+    return deadline if deadline is not None else Deadline()
+
+
+@contextmanager
+def active_deadline(deadline: Deadline) -> Iterator[Deadline]:
+    token = _ACTIVE_DEADLINE.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _ACTIVE_DEADLINE.reset(token)
+
+
+class QueryBudget:
+    """
+    Splits a query's time budget across its stages as they start: a stage gets
+    its weight's share of the time left among the stages not yet started, so
+    time a stage does not use passes on to the later ones.
+    """
+
+    def __init__(self, max_latency_ms: float, weights: Sequence[float]):
+        self.expires_at = time.monotonic() + max_latency_ms / 1000
+        self._unstarted_weight = float(sum(weights))
+
+    def stage_deadline(self, weight: float) -> Deadline:
+        now = time.monotonic()
+        remaining = max(0.0, self.expires_at - now)
+        share = (
+            remaining * weight / self._unstarted_weight
+            if self._unstarted_weight > weight
+            else remaining
+        )
+        self._unstarted_weight -= weight
+        return Deadline(now + share)
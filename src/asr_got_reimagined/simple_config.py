@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field
@@ -40,8 +40,29 @@ class ASRGoTDefaultParams(BaseModel):
 class LayerDefinition(BaseModel):
     description: str
 
+class RevisionHistorySettings(BaseModel):
+    retention: Literal["all", "last_n", "none", "sampled"] = "all"
+    max_entries: int = 10
+    audit_log_path: Optional[str] = None
+
+class StageExecutorSettings(BaseModel):
+    kind: Literal["none", "thread", "process"] = "none"
+    max_workers: Optional[int] = None
+    offload_stages: List[str] = []
+    handoff_dir: Optional[str] = None
+
+class QueryAdmissionSettings(BaseModel):
+    max_concurrent_queries: Optional[int] = None
+    max_queued_queries: int = 0
+    queue_timeout_ms: Optional[int] = None
+
 class ASRGoTConfig(BaseModel):
     default_parameters: ASRGoTDefaultParams = ASRGoTDefaultParams()
+    revision_history: RevisionHistorySettings = RevisionHistorySettings()
+    pipeline: List[str] = []
+    logical_clock: bool = False
+    executor: StageExecutorSettings = StageExecutorSettings()
+    admission: QueryAdmissionSettings = QueryAdmissionSettings()
     layers: Dict[str, LayerDefinition] = {}
 
 # --- Models for MCP Settings ---
@@ -51,6 +72,11 @@ class MCPSettings(BaseModel):
     server_version: str = "0.1.0"
     vendor_name: str = "AI Research Group"
 
+# --- Models for the session store ---
+class SessionStoreSettings(BaseModel):
+    max_in_memory_sessions: int = 128
+    persistence_dir: Optional[str] = None
+
 # --- Main Application Settings Model ---
 class AppSettings(BaseModel):
     name: str = "NexusMind"
@@ -63,6 +89,7 @@ class Settings(BaseModel):
     app: AppSettings = AppSettings()
     asr_got: ASRGoTConfig = ASRGoTConfig()
     mcp_settings: MCPSettings = MCPSettings()
+    session_store: SessionStoreSettings = SessionStoreSettings()
     knowledge_domains: List[Any] = []
 
 # Create settings instance with values from YAML
@@ -0,0 +1,73 @@
+import pytest
+
+from src.asr_got_reimagined.config import settings as app_settings
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    Edge,
+    EdgeType,
+    Hyperedge,
+    HyperedgeMetadata,
+    Node,
+    NodeType,
+)
+
+
+def build_graph(nodes, edges=(), hyperedges=(), **graph_fields):
+    """
+    A graph of `nodes` (node ID -> further Node fields; type defaults to
+    HYPOTHESIS, label to "node <ID>"), `edges` ((edge ID, source ID, target
+    ID[, EdgeType]) tuples, SUPPORTIVE by default) and `hyperedges`
+    ((hyperedge ID, node IDs) pairs), added one at a time.
+    """
+    graph = ASRGoTGraph(**graph_fields)
+    for node_id, fields in nodes.items():
+        graph.add_node(
+            Node(id=node_id, **{"label": f"node {node_id}", "type": NodeType.HYPOTHESIS, **fields})
+        )
+    for edge_id, source_id, target_id, *edge_type in edges:
+        graph.add_edge(
+            Edge(
+                id=edge_id,
+                source_id=source_id,
+                target_id=target_id,
+                type=edge_type[0] if edge_type else EdgeType.SUPPORTIVE,
+            )
+        )
+    for hyperedge_id, node_ids in hyperedges:
+        graph.add_hyperedge(
+            Hyperedge(
+                id=hyperedge_id,
+                node_ids=set(node_ids),
+                metadata=HyperedgeMetadata(relationship_descriptor="x"),
+            )
+        )
+    return graph
+
+
+def build_chain_graph(node_count, node_fields=None, **graph_fields):
+    """Nodes n0, n1, ... with fields node_fields(i), each linked to the next by edge e<i>."""
+    return build_graph(
+        {f"n{i}": node_fields(i) if node_fields else {} for i in range(node_count)},
+        [(f"e{i}", f"n{i}", f"n{i + 1}") for i in range(node_count - 1)],
+        **graph_fields,
+    )
+
+
+@pytest.fixture
+def make_graph():
+    """build_graph, for tests that shape their own graph."""
+    return build_graph
+
+
+@pytest.fixture
+def make_chain_graph():
+    """build_chain_graph: n0 -> n1 -> ... chained by supportive edges."""
+    return build_chain_graph
+
+
+@pytest.fixture
+def settings():
+    """A copy of the application settings, with every stage run on the event loop."""
+    test_settings = app_settings.model_copy(deep=True)
+    test_settings.asr_got.executor.kind = "none"
+    return test_settings
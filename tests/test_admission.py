@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.asr_got_reimagined.api.routes.mcp import handle_asr_got_query
+from src.asr_got_reimagined.api.schemas import MCPASRGoTQueryParams
+from src.asr_got_reimagined.app_setup import create_app
+from src.asr_got_reimagined.domain.services.admission import (
+    AdmissionController,
+    QueryRejected,
+)
+
+
+async def job(admission, seconds, started, name):
+    try:
+        async with admission.admit():
+            started.append(name)
+            await asyncio.sleep(seconds)
+        return "ok"
+    except QueryRejected as rejected:
+        return rejected.reason
+
+
+def test_queued_queries_start_in_order_and_overflow_is_rejected():
+    admission = AdmissionController(max_concurrent=2, max_queued=2, queue_timeout_ms=1000)
+    started = []
+
+    async def burst():
+        return await asyncio.gather(*(job(admission, 0.02, started, i) for i in range(6)))
+
+    assert asyncio.run(burst()) == ["ok"] * 4 + ["queue_full"] * 2
+    assert started == [0, 1, 2, 3]
+    stats = admission.stats()
+    assert (stats["in_flight"], stats["queued"]) == (0, 0)
+    assert (stats["admitted_total"], stats["rejected_total"]) == (4, 2)
+
+
+def test_queue_timeout_rejects_waiters():
+    admission = AdmissionController(max_concurrent=1, max_queued=5, queue_timeout_ms=20)
+
+    async def burst():
+        return await asyncio.gather(*(job(admission, 0.1, [], i) for i in range(3)))
+
+    assert asyncio.run(burst()) == ["ok", "queue_timeout", "queue_timeout"]
+    assert admission.stats()["in_flight"] == 0 and admission.stats()["queued"] == 0
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    admission = AdmissionController(max_concurrent=1, max_queued=5)
+
+    async def run():
+        first = asyncio.ensure_future(job(admission, 0.02, [], 1))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(job(admission, 0.02, [], 2))
+        await asyncio.sleep(0.005)
+        assert admission.stats()["queued"] == 1
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await first
+
+    asyncio.run(run())
+    assert admission.stats()["in_flight"] == 0 and admission.stats()["queued"] == 0
+
+
+def test_without_limit_everything_is_admitted():
+    admission = AdmissionController()
+
+    async def burst():
+        return await asyncio.gather(*(job(admission, 0, [], i) for i in range(20)))
+
+    assert set(asyncio.run(burst())) == {"ok"}
+    assert not admission.is_saturated()
+
+
+def test_saturated_server_rejects_queries_and_is_not_ready():
+    app = create_app()
+    admission = app.state.got_processor.admission
+    admission.max_concurrent, admission.max_queued = 1, 0
+    ready = next(route.endpoint for route in app.routes if route.path == "/ready")
+    request = SimpleNamespace(app=app)
+
+    async def while_busy():
+        assert await ready() == {"status": "ready", "load": admission.stats()}
+        async with admission.admit():
+            response = await handle_asr_got_query(
+                request, MCPASRGoTQueryParams(query="Is there room?"), request_id=7
+            )
+            return response, await ready()
+
+    response, not_ready = asyncio.run(while_busy())
+
+    assert response.id == 7 and response.result is None
+    assert response.error.code == -32005
+    assert response.error.data["reason"] == "queue_full"
+    assert not_ready.status_code == 503
+    assert int(not_ready.headers["Retry-After"]) >= 1
+
+
+def test_health_does_not_need_the_processor():
+    app = create_app()
+    del app.state.got_processor
+    health = next(route.endpoint for route in app.routes if route.path == "/health")
+    ready = next(route.endpoint for route in app.routes if route.path == "/ready")
+
+    health, not_ready = asyncio.run(health()), asyncio.run(ready())
+
+    assert health["status"] == "healthy" and "load" not in health
+    assert not_ready.status_code == 503
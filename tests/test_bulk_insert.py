@@ -0,0 +1,86 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    Edge,
+    EdgeType,
+    Node,
+    NodeMetadata,
+    NodeType,
+)
+
+N = 50
+
+
+def make_nodes():
+    return [
+        Node(
+            id=f"n{i}",
+            label="x",
+            type=NodeType.EVIDENCE,
+            metadata=NodeMetadata(layer_id="L", disciplinary_tags={f"t{i % 3}"}),
+        )
+        for i in range(N)
+    ]
+
+
+def make_edges():
+    return [
+        Edge(
+            id=f"e{i}",
+            source_id=f"n{i}",
+            target_id=f"n{(i + 1) % N}",
+            type=EdgeType.SUPPORTIVE,
+        )
+        for i in range(N)
+    ]
+
+
+def test_bulk_insert_matches_one_at_a_time_insert():
+    single = ASRGoTGraph()
+    for node in make_nodes():
+        single.add_node(node)
+    for edge in make_edges():
+        single.add_edge(edge)
+
+    bulk = ASRGoTGraph()
+    bulk.add_nodes_bulk(make_nodes())
+    bulk.add_edges_bulk(make_edges())
+
+    assert list(bulk.nodes) == list(single.nodes)
+    assert bulk.layers == single.layers
+    assert bulk.node_ids_with_any_tag(["t1"]) == single.node_ids_with_any_tag(["t1"])
+    assert bulk.edge_ids_of_type(EdgeType.SUPPORTIVE) == {f"e{i}" for i in range(N)}
+    assert bulk.nx_graph.number_of_edges() == N
+    assert [e.id for e in bulk.in_edges("n0")] == [f"e{N - 1}"]
+    assert bulk.get_statistics() == single.get_statistics()
+
+
+def test_bulk_insert_overwrites_existing_elements():
+    graph = ASRGoTGraph()
+    graph.add_nodes_bulk(make_nodes())
+    graph.add_edges_bulk(make_edges())
+
+    graph.add_nodes_bulk([Node(id="n0", label="y", type=NodeType.HYPOTHESIS)])
+    graph.add_edges_bulk(
+        [Edge(id="e0", source_id="n0", target_id="n5", type=EdgeType.CONTRADICTORY)]
+    )
+
+    assert len(graph.nodes) == N and graph.nodes["n0"].label == "y"
+    assert graph.node_ids_of_type(NodeType.HYPOTHESIS) == {"n0"}
+    assert graph.edge_ids_of_type(EdgeType.CONTRADICTORY) == {"e0"}
+    assert graph.nx_graph.number_of_edges() == N
+    assert [e.id for e in graph.in_edges("n1")] == []
+
+
+def test_bad_edge_batch_leaves_graph_unchanged():
+    graph = ASRGoTGraph()
+    graph.add_nodes_bulk(make_nodes())
+    with pytest.raises(ValueError, match="missing"):
+        graph.add_edges_bulk(
+            [
+                Edge(id="ok", source_id="n0", target_id="n1", type=EdgeType.OTHER),
+                Edge(id="bad", source_id="n0", target_id="missing", type=EdgeType.OTHER),
+            ]
+        )
+    assert graph.edges == {} and graph.nx_graph.number_of_edges() == 0
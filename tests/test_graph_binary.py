@@ -0,0 +1,77 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ConfidenceVector,
+    Edge,
+    EdgeType,
+    GraphFormatError,
+    MappedGraphFile,
+    NodeMetadata,
+    NodeType,
+    load_graph_binary,
+    save_graph_binary,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    graph = make_chain_graph(
+        5,
+        lambda i: {
+            "type": NodeType.HYPOTHESIS if i % 2 else NodeType.EVIDENCE,
+            "confidence": ConfidenceVector.from_list([i / 10, 0.5, 0.25, 1.0]),
+            "metadata": NodeMetadata(
+                layer_id="L1" if i < 3 else "L2",
+                disciplinary_tags={"bio", f"t{i}"},
+                impact_score=i / 5,
+                description=f"description {i}",
+            ),
+        },
+        hyperedges=[("h", ["n0", "n2", "n4"])],
+        graph_metadata={"query": "q", "turn": 2},
+    )
+    graph.add_edge(Edge(id="back", source_id="n4", target_id="n0", type=EdgeType.CONTRADICTORY))
+    graph.update_node_confidence("n1", ConfidenceVector.from_list([0.9] * 4), "t")
+    return graph
+
+
+def test_round_trip_preserves_the_graph(graph, tmp_path):
+    path = tmp_path / "graph.bin"
+    save_graph_binary(graph, path)
+    loaded = load_graph_binary(path)
+
+    assert loaded.nodes == graph.nodes and list(loaded.nodes) == list(graph.nodes)
+    assert loaded.edges == graph.edges
+    assert loaded.hyperedges == graph.hyperedges
+    assert loaded.layers == graph.layers
+    assert loaded.graph_metadata == graph.graph_metadata
+    assert loaded.updated_at == graph.updated_at
+    assert sorted(loaded.nx_graph.edges(keys=True)) == sorted(graph.nx_graph.edges(keys=True))
+    statistics, loaded_statistics = graph.get_statistics(), loaded.get_statistics()
+    means = {"mean_confidence", "mean_average_confidence"}
+    assert loaded_statistics.model_dump(exclude=means) == statistics.model_dump(
+        exclude=means
+    )
+    assert loaded_statistics.mean_confidence == pytest.approx(statistics.mean_confidence)
+    assert loaded.node_ids_with_any_tag(["t3"]) == {"n3"}
+
+
+def test_mapped_file_reads_columns_and_single_elements(graph, tmp_path):
+    path = tmp_path / "graph.bin"
+    save_graph_binary(graph, path)
+
+    with MappedGraphFile(path) as mapped:
+        assert (mapped.node_count, mapped.edge_count) == (5, 5)
+        assert mapped.get_node("n3") == graph.nodes["n3"]
+        assert mapped.get_node("missing") is None
+        assert set(mapped.node_ids_of_type(NodeType.HYPOTHESIS)) == {"n1", "n3"}
+        assert list(mapped.nodes["confidence"][1]) == pytest.approx([0.9] * 4)
+        assert [edge.id for edge in mapped.iter_edges()] == list(graph.edges)
+
+
+@pytest.mark.parametrize("content", [b"", b"not a graph file at all"])
+def test_other_files_are_rejected(tmp_path, content):
+    path = tmp_path / "other.bin"
+    path.write_bytes(content)
+    with pytest.raises(GraphFormatError):
+        MappedGraphFile(path)
@@ -0,0 +1,62 @@
+import pytest
+
+from src.asr_got_reimagined.api.graph_response import build_graph_delta_schema
+from src.asr_got_reimagined.domain.models import (
+    Node,
+    NodeType,
+)
+from src.asr_got_reimagined.domain.models.graph_binary import (
+    load_graph_binary,
+    save_graph_binary,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    return make_chain_graph(3)
+
+
+def test_delta_lists_changes_since_version(graph):
+    since = graph.version
+    graph.add_node(Node(id="n3", label="node 3", type=NodeType.EVIDENCE))
+    graph.remove_node("n2")
+
+    delta = build_graph_delta_schema(graph, since, since_graph_id=graph.id)
+
+    assert delta is not None
+    assert delta.graph_id == graph.id
+    assert (delta.since_version, delta.version) == (since, graph.version)
+    assert [n.node_id for n in delta.nodes] == ["n3"]
+    assert delta.removed_node_ids == ["n2"]
+
+
+def test_delta_of_fork_continues_its_version_line(graph):
+    since = graph.version
+    fork = graph.fork()
+    fork.add_node(Node(id="n3", label="node 3", type=NodeType.EVIDENCE))
+    graph.add_node(Node(id="other", label="other", type=NodeType.EVIDENCE))
+
+    delta = build_graph_delta_schema(fork, since, since_graph_id=graph.id)
+
+    assert delta is not None
+    assert [n.node_id for n in delta.nodes] == ["n3"]
+
+
+def test_other_graph_id_gets_full_state(graph, make_chain_graph):
+    other = make_chain_graph(3)
+    other.add_node(Node(id="n3", label="node 3", type=NodeType.EVIDENCE))
+    assert other.version > 0 and graph.id != other.id
+
+    # The version is in range for both graphs; only the ID tells them apart
+    assert build_graph_delta_schema(other, graph.version, since_graph_id=graph.id) is None
+    assert build_graph_delta_schema(other, graph.version, since_graph_id=other.id) is not None
+
+
+def test_reloaded_graph_needs_full_state_for_older_versions(graph, tmp_path):
+    since = graph.version
+    save_graph_binary(graph, tmp_path / "graph.bin")
+    loaded = load_graph_binary(tmp_path / "graph.bin")
+    loaded.add_node(Node(id="n3", label="node 3", type=NodeType.EVIDENCE))
+
+    assert loaded.id == graph.id
+    assert build_graph_delta_schema(loaded, since - 1, since_graph_id=graph.id) is None
@@ -0,0 +1,60 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    EdgeType,
+    Node,
+    NodeMetadata,
+    NodeType,
+)
+
+
+@pytest.fixture
+def graph(make_graph):
+    return make_graph(
+        {
+            "a": {"metadata": NodeMetadata(disciplinary_tags={"x"}, layer_id="L1")},
+            "b": {
+                "type": NodeType.EVIDENCE,
+                "metadata": NodeMetadata(disciplinary_tags={"y"}),
+            },
+        },
+        [("e1", "b", "a")],
+    )
+
+
+def test_type_layer_and_tag_lookups(graph):
+    assert graph.node_ids_of_type(NodeType.HYPOTHESIS) == {"a"}
+    assert graph.count_nodes_of_type(NodeType.HYPOTHESIS, NodeType.EVIDENCE) == 2
+    assert [e.id for e in graph.edges_of_type(EdgeType.SUPPORTIVE)] == ["e1"]
+    assert graph.node_ids_in_layers("L1") == {"a"}
+    assert graph.node_ids_with_any_tag(["x"]) == {"a"}
+
+
+def test_indexes_follow_tag_changes_and_removal(graph):
+    graph.add_node_tags("b", ["x"])
+    assert graph.node_ids_with_any_tag(["x"]) == {"a", "b"}
+
+    graph.remove_node("a")
+    assert graph.node_ids_with_any_tag(["x"]) == {"b"}
+    assert graph.node_ids_of_type(NodeType.HYPOTHESIS) == set()
+    assert graph.edges_of_type(EdgeType.SUPPORTIVE) == []
+    assert graph.node_ids_in_layers("L1") == set()
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_overwriting_a_node_reindexes_its_layer_and_tags(graph, bulk):
+    add = graph.add_nodes_bulk if bulk else lambda nodes: graph.add_node(nodes[0])
+    add([Node(id="a", label="A", type=NodeType.EVIDENCE, metadata=NodeMetadata(layer_id="L2"))])
+    assert graph.node_ids_in_layers("L2") == {"a"} and "L1" not in graph.layers
+    assert graph.node_ids_with_any_tag(["x"]) == set()
+    assert graph.node_ids_of_type(NodeType.EVIDENCE) == {"a", "b"}
+
+    add([Node(id="a", label="A", type=NodeType.EVIDENCE)])
+    assert graph.layers == {} and graph.get_statistics().layer_count == 0
+
+
+def test_indexes_built_for_graph_constructed_with_nodes():
+    node = Node(id="b", label="B", type=NodeType.EVIDENCE)
+    graph = ASRGoTGraph(nodes={"b": node})
+    assert graph.node_ids_of_type(NodeType.EVIDENCE) == {"b"}
@@ -0,0 +1,70 @@
+import copy
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    ChangeAction,
+    ElementKind,
+    Node,
+    NodeType,
+)
+from src.asr_got_reimagined.domain.models.graph_journal import GraphJournal
+
+
+def node(node_id):
+    return Node(id=node_id, label=node_id, type=NodeType.EVIDENCE)
+
+
+def changed_ids(changes):
+    return [(change.version, change.element_id) for change in changes]
+
+
+def test_every_mutation_bumps_the_version_once():
+    graph = ASRGoTGraph()
+    assert graph.version == 0 and graph.changes_since(0) == []
+
+    graph.add_node(node("a"))
+    graph.add_node(node("b"))
+    graph.assign_node_to_layer("a", "L")
+    graph.remove_node("b")
+
+    assert [(c.kind, c.action, c.element_id) for c in graph.changes_since(2)] == [
+        (ElementKind.LAYER, ChangeAction.ADDED, "L"),
+        (ElementKind.NODE, ChangeAction.UPDATED, "a"),
+        (ElementKind.NODE, ChangeAction.REMOVED, "b"),
+    ]
+    assert graph.version == 5 and graph.changes_since(5) == []
+
+
+def test_snapshot_journal_stops_at_its_version():
+    graph = ASRGoTGraph()
+    graph.add_node(node("a"))
+    snapshot = graph.snapshot()
+    graph.add_node(node("live"))
+
+    assert snapshot.version == 1
+    assert changed_ids(snapshot.changes_since(0)) == [(1, "a")]
+    assert snapshot.changes_since(1) == []
+
+
+def test_fork_of_snapshot_does_not_inherit_later_live_changes():
+    graph = ASRGoTGraph()
+    graph.add_node(node("a"))
+    snapshot = graph.snapshot()
+    graph.add_node(node("live1"))
+
+    fork = snapshot.fork()
+    fork.add_node(node("forked"))
+
+    assert changed_ids(fork.changes_since(1)) == [(2, "forked")]
+    assert changed_ids(graph.changes_since(1)) == [(2, "live1")]
+    assert changed_ids(copy.deepcopy(snapshot).changes_since(0)) == [(1, "a")]
+
+
+def test_trimmed_journal_reports_unknown_history():
+    journal = GraphJournal(max_entries=3)
+    for i in range(10):
+        journal.record(ElementKind.NODE, ChangeAction.ADDED, str(i))
+
+    assert journal.version == 10
+    assert journal.changes_since(2) is None
+    assert [c.element_id for c in journal.changes_since(8)] == ["8", "9"]
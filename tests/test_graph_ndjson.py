@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ConfidenceVector,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    graph = make_chain_graph(10, graph_metadata={"query": "q"})
+    graph.assign_node_to_layer("n0", "L")
+    return graph
+
+
+def read_records(chunks):
+    return [json.loads(line) for line in "".join(chunks).splitlines()]
+
+
+def test_stream_has_header_then_one_record_per_element(graph):
+    records = read_records(graph.iter_ndjson(batch_size=4))
+
+    header = records[0]
+    assert header["record"] == "graph" and header["id"] == graph.id
+    assert header["version"] == graph.version
+    assert header["statistics"]["node_count"] == 10
+    kinds = [record["record"] for record in records[1:]]
+    assert kinds == ["node"] * 10 + ["edge"] * 9 + ["layer"]
+    assert records[1]["data"] == graph.nodes["n0"].model_dump(mode="json", exclude_none=True)
+
+
+def test_stream_reads_the_graph_as_of_the_call(graph):
+    chunks = graph.iter_ndjson(batch_size=1)
+    first = next(chunks)
+    graph.remove_node("n5")
+    graph.update_node_confidence("n9", ConfidenceVector.from_list([0, 0, 0, 0]), "t")
+
+    records = read_records([first, *chunks])
+    node_ids = [r["data"]["id"] for r in records if r["record"] == "node"]
+    assert "n5" in node_ids
+    assert records[10]["data"]["confidence"] != [0, 0, 0, 0]
+    assert "n5" not in graph.nodes
+
+
+def test_finished_or_closed_stream_releases_its_snapshot(graph):
+    for _ in graph.iter_ndjson():
+        pass
+    assert graph._cow is None
+
+    chunks = graph.iter_ndjson(batch_size=1)
+    next(chunks)
+    chunks.close()
+    assert graph._cow is None
+
+
+def test_stream_keeps_copy_on_write_for_other_snapshots(graph):
+    chunks = graph.iter_ndjson(batch_size=1)
+    next(chunks)
+    snapshot = graph.snapshot()
+    list(chunks)
+
+    graph.remove_node("n0")
+    assert "n0" in snapshot.nodes and snapshot.get_successors("n0") == ["n1"]
@@ -0,0 +1,53 @@
+import pytest
+
+from src.asr_got_reimagined.api.graph_response import (
+    build_graph_state_schema,
+    select_top_node_ids,
+)
+from src.asr_got_reimagined.domain.models import (
+    ConfidenceVector,
+    NodeMetadata,
+    RevisionRecord,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    impacts = [0.1, 0.9, 0.5, 0.9, 0.3, 0.7]
+    return make_chain_graph(
+        6,
+        lambda i: {
+            "confidence": ConfidenceVector.from_list([0.1 * i] * 4),
+            "metadata": NodeMetadata(
+                impact_score=impacts[i],
+                revision_history=[
+                    RevisionRecord(user_or_process="t", action="created", changes_made={})
+                ],
+            ),
+        },
+        hyperedges=[("h", ["n1", "n3", "n5"])],
+    )
+
+
+def test_top_nodes_ranked_by_impact_then_confidence(graph):
+    assert select_top_node_ids(graph, 3) == ["n3", "n1", "n5"]
+    assert select_top_node_ids(graph, None) == list(graph.nodes)
+    assert select_top_node_ids(graph, 0) == []
+
+
+def test_truncated_schema_keeps_only_induced_edges(graph):
+    schema = build_graph_state_schema(graph, 4)
+
+    node_ids = {node.node_id for node in schema.nodes}
+    assert node_ids == {"n1", "n2", "n3", "n5"}
+    assert {edge.edge_id for edge in schema.edges} == {"e1", "e2"}
+    assert [h.edge_id for h in schema.hyperedges] == ["h"]
+    assert schema.metadata["total_node_count"] == 6 and schema.metadata["truncated"]
+    assert all("revision_history" not in node.metadata for node in schema.nodes)
+
+
+def test_detailed_schema_keeps_everything(graph):
+    schema = build_graph_state_schema(graph, None, detail_level="detailed")
+    assert len(schema.nodes) == 6 and len(schema.edges) == 5
+    assert not schema.metadata["truncated"]
+    assert all("revision_history" in node.metadata for node in schema.nodes)
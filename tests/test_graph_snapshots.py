@@ -0,0 +1,62 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ConfidenceVector,
+    Node,
+    NodeType,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    graph = make_chain_graph(5, hyperedges=[("h", ["n0", "n1", "n2"])])
+    graph.assign_node_to_layer("n0", "L")
+    return graph
+
+
+def mutate(graph):
+    graph.update_node_confidence("n1", ConfidenceVector.from_list([0, 0, 0, 0]), "t")
+    graph.add_node_tags("n2", {"bio"})
+    graph.assign_node_to_layer("n2", "L2")
+    graph.remove_node("n0")
+    graph.merge_nodes("n3", "n4")
+    graph.add_node(Node(id="z", label="z", type=NodeType.EVIDENCE))
+
+
+def test_snapshot_is_unaffected_by_later_writes(graph):
+    snapshot = graph.snapshot()
+    dump = snapshot.to_serializable_dict()
+    statistics = snapshot.get_statistics()
+
+    mutate(graph)
+
+    assert snapshot.to_serializable_dict() == dump
+    assert snapshot.get_statistics() == statistics
+    assert snapshot.node_scores(["n1"]).confidence.sum() == 2.0
+    assert snapshot.get_neighbors("n0") == ["n1"]
+    assert [h.id for h in snapshot.hyperedges_of("n0")] == ["h"]
+    assert snapshot.node_ids_with_any_tag(["bio"]) == set()
+    assert graph.node_ids_with_any_tag(["bio"]) == {"n2"}
+    assert "n0" not in graph.nodes and graph.get_statistics().node_count == 4
+
+
+def test_snapshot_is_read_only_and_cheap_to_resnapshot(graph):
+    snapshot = graph.snapshot()
+    assert snapshot.is_snapshot and snapshot.snapshot() is snapshot
+    with pytest.raises(RuntimeError):
+        snapshot.add_node(Node(label="q", type=NodeType.EVIDENCE))
+
+
+def test_fork_writes_are_isolated_from_the_source_graph(graph):
+    dump = graph.to_serializable_dict()
+    fork = graph.fork()
+
+    mutate(fork)
+
+    assert graph.to_serializable_dict() == dump
+    assert not fork.is_snapshot and "n0" not in fork.nodes
+    assert fork.node_ids_with_any_tag(["bio"]) == {"n2"}
+    assert graph.node_ids_with_any_tag(["bio"]) == set()
+
+    graph.remove_node("n2")
+    assert "n2" in fork.nodes and fork.get_successors("n2") == ["n3"]
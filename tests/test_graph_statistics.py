@@ -0,0 +1,102 @@
+import random
+from collections import Counter
+
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    ConfidenceVector,
+    Edge,
+    EdgeType,
+    Node,
+    NodeType,
+)
+
+
+def recomputed_statistics(graph):
+    degrees = Counter(dict.fromkeys(graph.nodes, 0))
+    for edge in graph.edges.values():
+        degrees[edge.source_id] += 1
+        degrees[edge.target_id] += 1
+    count = len(graph.nodes)
+    mean_confidence = [
+        sum(node.confidence.to_list()[k] for node in graph.nodes.values()) / count
+        if count
+        else 0.0
+        for k in range(4)
+    ]
+    return (
+        dict(Counter(degrees.values())),
+        dict(Counter(node.type.value for node in graph.nodes.values())),
+        dict(Counter(edge.type.value for edge in graph.edges.values())),
+        mean_confidence,
+    )
+
+
+def random_confidence(rng):
+    return ConfidenceVector.from_list([rng.random() for _ in range(4)])
+
+
+def random_step(graph, rng):
+    ids = list(graph.nodes)
+    roll = rng.random()
+    if roll < 0.3 or len(ids) < 3:
+        graph.add_node(
+            Node(
+                id=f"n{rng.randrange(100)}",
+                label="x",
+                type=rng.choice([NodeType.HYPOTHESIS, NodeType.EVIDENCE]),
+                confidence=random_confidence(rng),
+            )
+        )
+    elif roll < 0.6:
+        graph.add_edge(
+            Edge(
+                source_id=rng.choice(ids),
+                target_id=rng.choice(ids),
+                type=rng.choice([EdgeType.SUPPORTIVE, EdgeType.CONTRADICTORY]),
+            )
+        )
+    elif roll < 0.7:
+        graph.remove_node(rng.choice(ids))
+    elif roll < 0.75:
+        graph.merge_nodes(*rng.sample(ids, 2))
+    elif roll < 0.8 and graph.edges:
+        graph.remove_edge(rng.choice(list(graph.edges)))
+    elif roll < 0.9:
+        graph.update_node_confidence(rng.choice(ids), random_confidence(rng), "t")
+    else:
+        graph.snapshot()
+
+
+def test_statistics_match_recomputation_under_random_mutations():
+    rng = random.Random(1)
+    graph = ASRGoTGraph()
+    for step in range(1500):
+        random_step(graph, rng)
+        if step % 50 == 0:
+            statistics = graph.get_statistics()
+            histogram, nodes_by_type, edges_by_type, mean_confidence = (
+                recomputed_statistics(graph)
+            )
+            assert statistics.node_count == len(graph.nodes)
+            assert statistics.edge_count == len(graph.edges)
+            assert statistics.degree_histogram == histogram
+            assert {k: v for k, v in statistics.nodes_by_type.items() if v} == (
+                nodes_by_type
+            )
+            assert {k: v for k, v in statistics.edges_by_type.items() if v} == (
+                edges_by_type
+            )
+            assert statistics.mean_confidence == pytest.approx(mean_confidence)
+
+
+def test_statistics_are_cached_per_version():
+    graph = ASRGoTGraph()
+    graph.add_node(Node(id="a", label="a", type=NodeType.EVIDENCE))
+    statistics = graph.get_statistics()
+    assert graph.get_statistics() is statistics
+
+    graph.add_node(Node(id="b", label="b", type=NodeType.EVIDENCE))
+    assert graph.get_statistics() is not statistics
+    assert graph.get_statistics().node_count == 2
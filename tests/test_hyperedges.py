@@ -0,0 +1,40 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    Edge,
+    EdgeType,
+    NodeType,
+)
+
+
+@pytest.fixture
+def graph(make_graph):
+    return make_graph(
+        {node_id: {"type": NodeType.EVIDENCE} for node_id in "abcd"},
+        hyperedges=[("h", "abc")],
+    )
+
+
+def test_incidence_queries(graph):
+    assert [h.id for h in graph.hyperedges_of("a")] == ["h"]
+    assert graph.hyperedges_of("d") == []
+    assert graph.hyperedge_neighbors("a") == {"b", "c"}
+
+    graph.add_edge(Edge(source_id="a", target_id="d", type=EdgeType.SUPPORTIVE))
+    assert sorted(graph.get_neighbors("a")) == ["d"]
+    assert sorted(graph.get_neighbors("a", include_hyperedges=True)) == ["b", "c", "d"]
+
+
+def test_star_expansion_is_cached_until_hyperedges_change(graph):
+    star = graph.star_expansion()
+    assert star.number_of_edges() == 3
+    assert graph.star_expansion() is star
+
+    graph.merge_nodes("d", "c")
+
+    assert graph.hyperedges["h"].node_ids == {"a", "b", "d"}
+    assert [h.id for h in graph.hyperedges_of("d")] == ["h"]
+    assert graph.hyperedges_of("c") == []
+    rebuilt = graph.star_expansion()
+    assert rebuilt is not star
+    assert rebuilt.has_edge("h", "d") and not rebuilt.has_node("c")
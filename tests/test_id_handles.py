@@ -0,0 +1,110 @@
+import random
+
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    ConfidenceVector,
+    Edge,
+    EdgeType,
+    Node,
+    NodeType,
+)
+from src.asr_got_reimagined.domain.models.id_table import IdTable
+
+
+def test_id_table_reuses_released_handles():
+    table = IdTable()
+    a, b = table.acquire("a"), table.acquire("b")
+    assert (a, b) == (0, 1) and table.acquire("a") == a
+
+    assert table.release("a") == a
+    assert table.release("a") is None
+    with pytest.raises(KeyError):
+        table.string(a)
+    assert table.acquire("c") == a
+    assert table.capacity == 2
+    assert list(table) == ["b", "c"]
+
+
+def test_id_table_copy_is_independent():
+    table = IdTable()
+    table.acquire("a")
+    copied = table.copy()
+    copied.release("a")
+    copied.acquire("b")
+    assert table.string(0) == "a" and "b" not in table
+
+
+def test_graph_handles_follow_removal_and_snapshots():
+    graph = ASRGoTGraph()
+    graph.add_nodes_bulk(
+        Node(id=f"n{i}", label="x", type=NodeType.HYPOTHESIS) for i in range(3)
+    )
+    graph.add_edge(Edge(id="e0", source_id="n0", target_id="n1", type=EdgeType.SUPPORTIVE))
+    handle = graph.node_handle("n1")
+    snapshot = graph.snapshot()
+
+    graph.remove_node("n1")
+    graph.add_node(Node(id="n3", label="x", type=NodeType.HYPOTHESIS))
+
+    assert graph.node_handle("n1") is None and graph.edge_handle("e0") is None
+    assert graph.node_id_of_handle(graph.node_handle("n3")) == "n3"
+    assert snapshot.node_id_of_handle(handle) == "n1"
+    assert [e.id for e in snapshot.out_edges("n0")] == ["e0"]
+
+
+def check_indexes(graph):
+    for node_id in graph.nodes:
+        assert graph.node_id_of_handle(graph.node_handle(node_id)) == node_id
+        assert sorted(e.id for e in graph.out_edges(node_id)) == sorted(
+            e.id for e in graph.edges.values() if e.source_id == node_id
+        )
+        assert sorted(e.id for e in graph.in_edges(node_id)) == sorted(
+            e.id for e in graph.edges.values() if e.target_id == node_id
+        )
+    for edge_id in graph.edges:
+        assert graph.edge_id_of_handle(graph.edge_handle(edge_id)) == edge_id
+    scores = graph.node_scores()
+    assert scores.node_ids == list(graph.nodes)
+    for row, node_id in enumerate(scores.node_ids):
+        assert list(scores.confidence[row]) == graph.nodes[node_id].confidence.to_list()
+
+
+def test_random_mutations_keep_handle_indexes_consistent():
+    rng = random.Random(7)
+    graph = ASRGoTGraph()
+    for step in range(800):
+        ids = list(graph.nodes)
+        roll = rng.random()
+        if roll < 0.4 or len(ids) < 3:
+            graph.add_node(
+                Node(
+                    id=f"n{rng.randint(0, 40)}",
+                    label="x",
+                    type=NodeType.HYPOTHESIS,
+                    confidence=ConfidenceVector(empirical_support=rng.random()),
+                )
+            )
+        elif roll < 0.7:
+            graph.add_edge(
+                Edge(
+                    id=f"e{rng.randint(0, 100)}",
+                    source_id=rng.choice(ids),
+                    target_id=rng.choice(ids),
+                    type=EdgeType.SUPPORTIVE,
+                )
+            )
+        elif roll < 0.85:
+            graph.remove_node(rng.choice(ids))
+        elif roll < 0.9:
+            graph.merge_nodes(*rng.sample(ids, 2))
+        elif roll < 0.97:
+            graph.update_node_confidence(
+                rng.choice(ids), ConfidenceVector(theoretical_basis=rng.random()), "t"
+            )
+        else:
+            graph = graph.fork()
+        if step % 50 == 0:
+            check_indexes(graph)
+    check_indexes(graph)
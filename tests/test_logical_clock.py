@@ -0,0 +1,59 @@
+import copy
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    ConfidenceVector,
+    LogicalClock,
+    Node,
+    NodeType,
+)
+
+
+def add_nodes(graph, count):
+    for i in range(count):
+        graph.add_node(Node(id=f"n{i}", label="x", type=NodeType.HYPOTHESIS))
+
+
+def test_wall_clock_without_batch():
+    graph = ASRGoTGraph()
+    add_nodes(graph, 2)
+    node = graph.nodes["n0"]
+    assert node.logical_time is None
+    assert node.updated_at is node.created_at
+
+
+def test_batch_stamps_ticks_and_shared_base_time():
+    graph = ASRGoTGraph()
+    with graph.logical_clock.batch() as clock:
+        add_nodes(graph, 3)
+        graph.update_node_confidence("n0", ConfidenceVector(empirical_support=0.7), "t")
+
+    first, last = graph.nodes["n0"], graph.nodes["n2"]
+    assert first.logical_time > last.logical_time  # n0 was touched again
+    assert graph.nodes["n1"].logical_time < last.logical_time
+    assert first.updated_at is last.created_at is clock.batch_time
+    assert "logical_time" not in first.cached_dump()
+
+
+def test_batches_restore_previous_clock():
+    outer, inner = LogicalClock(), LogicalClock(start=100)
+    with outer.batch():
+        with inner.batch():
+            assert Node(id="a", label="a", type=NodeType.EVIDENCE).logical_time == 101
+        assert Node(id="b", label="b", type=NodeType.EVIDENCE).logical_time == 1
+    assert Node(id="c", label="c", type=NodeType.EVIDENCE).logical_time is None
+
+
+def test_fork_continues_ticks_and_snapshot_is_unchanged():
+    graph = ASRGoTGraph()
+    with graph.logical_clock.batch():
+        add_nodes(graph, 2)
+    before = graph.nodes["n1"].logical_time
+    snapshot = graph.snapshot()
+    fork = graph.fork()
+    with fork.logical_clock.batch():
+        fork.update_node_confidence("n0", ConfidenceVector(), "t")
+
+    assert fork.nodes["n0"].logical_time > before
+    assert snapshot.nodes["n0"].logical_time < before
+    copy.deepcopy(graph)
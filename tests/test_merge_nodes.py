@@ -0,0 +1,81 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ConfidenceVector,
+    EdgeType,
+    MergePolicy,
+    NodeMetadata,
+    NodeType,
+)
+
+
+@pytest.fixture
+def graph(make_graph):
+    node_types = {
+        "r": NodeType.ROOT,
+        "h1": NodeType.HYPOTHESIS,
+        "h2": NodeType.HYPOTHESIS,
+        "e": NodeType.EVIDENCE,
+    }
+    graph = make_graph(
+        {
+            node_id: {
+                "type": node_type,
+                "metadata": NodeMetadata(disciplinary_tags={node_id}),
+            }
+            for node_id, node_type in node_types.items()
+        },
+        [
+            ("a", "r", "h1", EdgeType.GENERATES_HYPOTHESIS),
+            ("b", "r", "h2", EdgeType.GENERATES_HYPOTHESIS),
+            ("c", "e", "h2", EdgeType.SUPPORTIVE),
+            ("d", "h1", "h2", EdgeType.CORRELATIVE),
+        ],
+    )
+    graph.nodes["h2"].confidence = ConfidenceVector.from_list([0.9, 0.1, 0.9, 0.1])
+    return graph
+
+
+def test_merge_repoints_edges_and_drops_duplicates_and_self_loops(graph):
+    graph.merge_nodes("h1", "h2")
+
+    assert "h2" not in graph.nodes
+    # r->h2 duplicated r->h1 and h1->h2 would be a self-loop: both are gone
+    assert sorted((e.id, e.source_id, e.target_id) for e in graph.edges.values()) == [
+        ("a", "r", "h1"),
+        ("c", "e", "h1"),
+    ]
+    assert graph.nx_graph.number_of_edges() == 2
+    assert len(graph.find_edges("e", "h1", EdgeType.SUPPORTIVE)) == 1
+    assert len(graph.in_edges("h1")) == 2 and graph.out_edges("e")[0].target_id == "h1"
+    assert graph.node_ids_with_any_tag(["h2"]) == {"h1"}
+
+
+def test_rewired_edges_do_not_share_metadata_with_removed_ones(graph):
+    edge = graph.edges["c"]
+    graph.merge_nodes("h1", "h2")
+    rewired = graph.edges["c"]
+    assert rewired.type == EdgeType.SUPPORTIVE and rewired.target_id == "h1"
+    assert rewired.metadata is not edge.metadata
+    assert rewired.cached_dump()["target_id"] == "h1"
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [
+        (MergePolicy.MAX, [0.9, 0.8, 0.9, 0.8]),
+        (MergePolicy.MEAN, [0.55, 0.45, 0.55, 0.45]),
+        (MergePolicy.KEEP, [0.2, 0.8, 0.2, 0.8]),
+    ],
+)
+def test_merge_combines_confidence_per_policy(graph, policy, expected):
+    graph.nodes["h1"].confidence = ConfidenceVector.from_list([0.2, 0.8, 0.2, 0.8])
+    kept = graph.merge_nodes("h1", "h2", policy=policy)
+    assert kept.confidence.to_list() == pytest.approx(expected)
+
+
+def test_merge_rejects_missing_or_identical_nodes(graph):
+    with pytest.raises(ValueError):
+        graph.merge_nodes("h1", "h1")
+    with pytest.raises(ValueError):
+        graph.merge_nodes("h1", "missing")
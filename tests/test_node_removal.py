@@ -0,0 +1,43 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    NodeMetadata,
+    NodeType,
+)
+
+
+@pytest.fixture
+def graph(make_graph):
+    graph = make_graph(
+        {
+            node_id: {"type": NodeType.EVIDENCE, "metadata": NodeMetadata(layer_id="L")}
+            for node_id in "abcd"
+        },
+        [("ab", "a", "b"), ("cb", "c", "b")],
+        [("h3", "abc"), ("h2", "bc")],
+    )
+    graph.assign_node_to_layer("d", "M")
+    return graph
+
+
+def test_remove_node_cascades_to_edges_hyperedges_and_layers(graph):
+    assert graph.layers == {"L": {"a", "b", "c"}, "M": {"d"}}
+
+    removed = graph.remove_node("b")
+
+    assert removed is not None and removed.id == "b"
+    assert graph.edges == {} and graph.nx_graph.number_of_edges() == 0
+    assert graph.out_edges("a") == [] and graph.in_edges("c") == []
+    # h2 would be left with a single member, so it goes too
+    assert set(graph.hyperedges) == {"h3"}
+    assert graph.hyperedges["h3"].node_ids == {"a", "c"}
+    assert graph.layers["L"] == {"a", "c"}
+
+
+def test_remove_nodes_skips_missing_ids_and_drops_empty_layers(graph):
+    removed = graph.remove_nodes(["a", "b", "c", "missing", "d"])
+
+    assert [node.id for node in removed] == ["a", "b", "c", "d"]
+    assert graph.nodes == {} and graph.hyperedges == {} and graph.layers == {}
+    assert graph.nx_graph.number_of_nodes() == 0
+    assert graph.remove_node("a") is None
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    ConfidenceVector,
+    Node,
+    NodeMetadata,
+    NodeType,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    rng = random.Random(0)
+    return make_chain_graph(
+        200,
+        lambda _: {
+            "confidence": ConfidenceVector.from_list([rng.random() for _ in range(4)]),
+            "metadata": NodeMetadata(impact_score=rng.random()),
+        },
+    )
+
+
+def test_vectorized_filter_matches_per_node_loop(graph):
+    expected = [
+        node.id
+        for node in graph.nodes.values()
+        if min(node.confidence.to_list()) < 0.2
+        and (node.metadata.impact_score or 0) < 0.3
+    ]
+    scores = graph.node_scores()
+    assert scores.ids_where((scores.min_confidence < 0.2) & (scores.impact < 0.3)) == (
+        expected
+    )
+
+
+def test_columns_follow_updates_and_removals(graph):
+    graph.remove_nodes([f"n{i}" for i in range(100)])
+    graph.update_node_confidence("n150", ConfidenceVector.from_list([0, 0, 0, 0]), "t")
+
+    scores = graph.node_scores()
+    assert scores.node_ids == list(graph.nodes)
+    for row, node_id in enumerate(scores.node_ids):
+        assert list(scores.confidence[row]) == graph.nodes[node_id].confidence.to_list()
+
+    subset = graph.node_scores(["n150", "n0", "missing"])
+    assert subset.node_ids == ["n150"] and subset.confidence.sum() == 0
+
+
+def test_columns_built_for_graph_constructed_with_nodes():
+    nodes = {f"n{i}": Node(id=f"n{i}", label="x", type=NodeType.EVIDENCE) for i in range(10)}
+    assert len(ASRGoTGraph(nodes=nodes).node_scores().node_ids) == 10
@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ASRGoTGraph,
+    ConfidenceVector,
+    Node,
+    NodeType,
+)
+from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
+from src.asr_got_reimagined.domain.services import GoTProcessor
+from src.asr_got_reimagined.domain.stages import (
+    EvidenceStage,
+    HypothesisStage,
+    PruningMergingStage,
+)
+from src.asr_got_reimagined.domain.utils.deadline import (
+    Deadline,
+    QueryBudget,
+    active_deadline,
+    current_deadline,
+)
+
+QUERY = "How does the skin microbiome affect CTCL progression?"
+
+
+def test_budget_is_shared_by_weight_among_unstarted_stages():
+    budget = QueryBudget(1000, [1, 3, 1])
+    first = budget.stage_deadline(1)
+    assert 150 < first.remaining_ms() <= 200
+
+    # Time the first stage does not use passes on to the rest
+    second = budget.stage_deadline(3)
+    assert 650 < second.remaining_ms() <= 750
+    last = budget.stage_deadline(1)
+    assert last.remaining_ms() == pytest.approx(1000, abs=50)
+
+
+def test_active_deadline():
+    assert not current_deadline().limited
+    assert current_deadline().remaining_ms() == float("inf")
+
+    expired = Deadline(time.monotonic() - 1)
+    with active_deadline(expired):
+        assert current_deadline() is expired
+        assert current_deadline().expired() and current_deadline().remaining_ms() == 0
+    assert not current_deadline().limited
+
+
+def test_merging_falls_back_to_neighbours_when_out_of_time(settings):
+    graph = ASRGoTGraph()
+    graph.add_nodes_bulk(
+        Node(
+            id=f"h{i}",
+            label=f"hypothesis about topic {i // 2} alpha beta gamma",
+            type=NodeType.HYPOTHESIS,
+            confidence=ConfidenceVector.from_list([0.9] * 4),
+        )
+        for i in range(40)
+    )
+    stage = PruningMergingStage(settings)
+
+    async def merge(deadline):
+        with active_deadline(deadline):
+            return await stage._merge_nodes(graph.fork()), deadline.degradations
+
+    merged, degradations = asyncio.run(merge(Deadline()))
+    fast_merged, fast_degradations = asyncio.run(merge(Deadline(time.monotonic() - 1)))
+
+    assert merged > 0 and not degradations
+    assert fast_merged > 0 and fast_degradations
+
+
+def test_evidence_reports_only_the_iterations_it_completed(settings, make_graph):
+    stage = EvidenceStage(settings)
+    stage.max_iterations = 3
+    hypothesis_ids = ["h0", "h1", "h2"]
+
+    async def integrate(deadline):
+        session = GoTProcessorSessionData(
+            query=QUERY,
+            accumulated_context={
+                HypothesisStage.stage_name: {"hypothesis_node_ids": hypothesis_ids}
+            },
+        )
+        with active_deadline(deadline):
+            graph = make_graph({hid: {} for hid in hypothesis_ids})
+            return await stage.execute(graph, session)
+
+    full = asyncio.run(integrate(Deadline()))
+    rushed = asyncio.run(integrate(Deadline(time.monotonic() - 1)))
+
+    assert full.metrics["iterations_completed"] == 3
+    assert rushed.metrics["iterations_completed"] == 0
+    assert "over 0 iterations" in rushed.summary
+
+
+@pytest.mark.parametrize("kind", ["none", "process"])
+def test_tight_budget_degrades_stages(settings, kind):
+    settings.asr_got.executor.kind = kind
+    settings.asr_got.executor.offload_stages = ["EvidenceStage"]
+    processor = GoTProcessor(settings)
+
+    async def run(max_latency_ms):
+        return await processor.process_query(
+            QUERY, operational_params={"max_latency_ms": max_latency_ms}
+        )
+
+    try:
+        rushed = asyncio.run(run(1))
+        relaxed = asyncio.run(run(60000))
+    finally:
+        asyncio.run(processor.shutdown_resources())
+
+    assert "EvidenceStage" in rushed.degraded_stages
+    assert any(entry.get("degraded") for entry in rushed.stage_outputs_trace)
+    assert rushed.final_answer
+    assert not relaxed.degraded_stages
@@ -0,0 +1,25 @@
+import datetime
+
+from src.asr_got_reimagined.domain.models import Edge, EdgeType, Node, NodeType
+
+
+def test_new_records_share_one_timestamp_until_touched():
+    node = Node(label="n", type=NodeType.EVIDENCE)
+    edge = Edge(source_id="a", target_id="b", type=EdgeType.SUPPORTIVE)
+    assert node.updated_at is node.created_at
+    assert edge.updated_at is edge.created_at
+
+    created_at = node.created_at
+    node.touch()
+    assert node.created_at is created_at and node.updated_at >= created_at
+    assert node.updated_at is not created_at
+
+
+def test_explicit_updated_at_is_kept():
+    created_at = datetime.datetime(2024, 1, 1)
+    updated_at = datetime.datetime(2024, 6, 1)
+    node = Node(
+        label="n", type=NodeType.EVIDENCE, created_at=created_at, updated_at=updated_at
+    )
+    assert (node.created_at, node.updated_at) == (created_at, updated_at)
+    assert node.model_copy(deep=True).updated_at == updated_at
@@ -0,0 +1,85 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ConfidenceVector,
+    RevisionAuditLog,
+    RevisionPolicy,
+    RevisionRetention,
+    confidence_delta,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    return make_chain_graph(1)
+
+
+def revise(graph, times, start=0):
+    for i in range(start, start + times):
+        graph.update_node_confidence(
+            "n0", ConfidenceVector.from_list([0.01 * (i + 1)] * 4), updated_by=f"r{i}"
+        )
+
+
+def revisers(graph):
+    return [r.user_or_process for r in graph.nodes["n0"].metadata.revision_history]
+
+
+def test_confidence_delta_lists_changed_components_only():
+    old = ConfidenceVector.from_list([0.1, 0.2, 0.3, 0.4])
+    new = ConfidenceVector.from_list([0.1, 0.5, 0.3, 0.0])
+    assert confidence_delta(old, new) == {"1": [0.2, 0.5], "3": [0.4, 0.0]}
+
+
+def test_default_settings_keep_every_revision(graph, settings):
+    assert settings.asr_got.revision_history.retention == "all"
+    graph.set_revision_policy(RevisionPolicy.from_settings(settings.asr_got.revision_history))
+    revise(graph, 25)
+    assert revisers(graph) == [f"r{i}" for i in range(25)]
+
+
+def test_last_n_keeps_newest(graph):
+    graph.set_revision_policy(RevisionPolicy(RevisionRetention.LAST_N, max_entries=3))
+    revise(graph, 7)
+    assert revisers(graph) == ["r4", "r5", "r6"]
+
+
+def test_sampled_keeps_oldest_and_newest(graph):
+    graph.set_revision_policy(RevisionPolicy(RevisionRetention.SAMPLED, max_entries=4))
+    revise(graph, 9)
+    history = revisers(graph)
+    assert len(history) <= 4
+    assert history[0] == "r0" and history[-1] == "r8"
+
+
+def test_none_keeps_existing_records_and_adds_no_more(graph):
+    revise(graph, 2)
+    graph.set_revision_policy(RevisionPolicy(RevisionRetention.NONE))
+    revise(graph, 3, start=2)
+    assert revisers(graph) == ["r0", "r1"]
+
+
+def test_audit_log_holds_full_history(graph, tmp_path):
+    audit_log = RevisionAuditLog(str(tmp_path / "revisions.jsonl"))
+    graph.set_revision_policy(RevisionPolicy(RevisionRetention.NONE, audit_log=audit_log))
+    revise(graph, 3)
+
+    assert revisers(graph) == []
+    assert [r.user_or_process for r in graph.revision_history("n0")] == ["r0", "r1", "r2"]
+    assert audit_log.records_for("n0", graph_id="another-graph") == []
+    with pytest.raises(ValueError):
+        graph.revision_history("missing")
+
+
+def test_history_includes_records_from_before_the_audit_log(graph, tmp_path):
+    revise(graph, 2)
+    audit_log = RevisionAuditLog(str(tmp_path / "revisions.jsonl"))
+    graph.set_revision_policy(RevisionPolicy(RevisionRetention.ALL, audit_log=audit_log))
+    revise(graph, 3, start=2)
+
+    assert len(audit_log.records_for("n0")) == 3
+    expected = [f"r{i}" for i in range(5)]
+    assert [r.user_or_process for r in graph.revision_history("n0")] == expected
+    graph.set_revision_policy(RevisionPolicy(RevisionRetention.NONE, audit_log=audit_log))
+    revise(graph, 1, start=5)
+    assert [r.user_or_process for r in graph.revision_history("n0")] == [*expected, "r5"]
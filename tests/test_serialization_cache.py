@@ -0,0 +1,62 @@
+import copy
+
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    ConfidenceVector,
+    NodeMetadata,
+    NodeType,
+)
+
+
+@pytest.fixture
+def graph(make_chain_graph):
+    return make_chain_graph(
+        10,
+        lambda _: {
+            "type": NodeType.EVIDENCE,
+            "metadata": NodeMetadata(layer_id="L", disciplinary_tags={"a"}),
+        },
+    )
+
+
+def fresh_dumps(graph):
+    return [n.model_dump(exclude_none=True) for n in graph.nodes.values()] + [
+        e.model_dump(exclude_none=True) for e in graph.edges.values()
+    ]
+
+
+def test_cached_dumps_match_fresh_dumps_after_changes(graph):
+    graph.to_serializable_dict()  # Warm the caches
+    graph.update_node_confidence("n5", ConfidenceVector.from_list([0.1] * 4), "t")
+    graph.add_node_tags("n6", ["b"])
+    graph.merge_nodes("n1", "n2")
+
+    dump = graph.to_serializable_dict()
+    assert dump["nodes"] + dump["edges"] == fresh_dumps(graph)
+
+
+def test_cache_is_dropped_on_assignment_touch_and_copy_updates(graph):
+    node = graph.nodes["n7"]
+    node.cached_dump()
+
+    node.label = "relabelled"
+    assert node.cached_dump()["label"] == "relabelled"
+
+    node.metadata.description = "changed in place"
+    node.touch()
+    assert node.cached_dump()["metadata"]["description"] == "changed in place"
+
+    updated = node.model_copy(update={"label": "other"})
+    assert updated.cached_dump()["label"] == "other"
+    assert node.cached_dump()["label"] == "relabelled"
+    assert copy.deepcopy(node).cached_dump() == node.cached_dump()
+
+
+def test_snapshot_keeps_its_own_serialization(graph):
+    graph.to_serializable_dict()
+    snapshot = graph.snapshot()
+    graph.update_node_confidence("n5", ConfidenceVector.from_list([0.1] * 4), "t")
+
+    assert graph.to_serializable_dict()["nodes"][5]["confidence"] == [0.1] * 4
+    assert snapshot.to_serializable_dict()["nodes"][5]["confidence"] != [0.1] * 4
@@ -0,0 +1,114 @@
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+from loguru import logger
+
+from src.asr_got_reimagined.domain.models import NodeType
+from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
+from src.asr_got_reimagined.domain.services import (
+    GoTProcessor,
+    SessionStore,
+    session_store,
+)
+
+QUERY = "How does the skin microbiome affect CTCL progression?"
+FOLLOW_UP = "And what about T cells?"
+
+
+@pytest.fixture
+def processor(settings, tmp_path):
+    # Without pruning and merging, every node of the first turn must survive
+    settings.asr_got.pipeline = [
+        "InitializationStage",
+        "DecompositionStage",
+        "HypothesisStage",
+        "EvidenceStage",
+    ]
+    return GoTProcessor(settings, session_store=SessionStore(2, str(tmp_path)))
+
+
+@pytest.fixture
+def warnings():
+    messages = []
+    handler = logger.add(messages.append, level="WARNING", format="{message}")
+    yield messages
+    logger.remove(handler)
+
+
+def test_resumed_session_adds_evidence_without_overwriting(processor, warnings):
+    first = asyncio.run(processor.process_query(QUERY, session_id="s"))
+    first_evidence = {
+        node.id: node.model_dump() for node in first.graph_state.nodes_of_type(NodeType.EVIDENCE)
+    }
+    second = asyncio.run(processor.process_query(FOLLOW_UP, session_id="s"))
+
+    assert (first.turn, second.turn) == (1, 2)
+    graph = second.graph_state
+    assert first_evidence
+    for node_id, dump in first_evidence.items():
+        assert graph.nodes[node_id].model_dump() == dump
+    new_evidence = graph.node_ids_of_type(NodeType.EVIDENCE) - set(first_evidence)
+    assert new_evidence and all(node_id.startswith("ev_t2_") for node_id in new_evidence)
+    assert not [m for m in warnings if "already exist" in m]
+    # The stored first-turn graph is untouched
+    assert {
+        node.id: node.model_dump() for node in first.graph_state.nodes_of_type(NodeType.EVIDENCE)
+    } == first_evidence
+
+
+def test_resumed_session_points_the_root_at_the_follow_up(processor):
+    asyncio.run(processor.process_query(QUERY, session_id="s"))
+    second = asyncio.run(processor.process_query(FOLLOW_UP, session_id="s"))
+
+    root = second.graph_state.nodes["n0"]
+    assert root.metadata.query_context == FOLLOW_UP
+    revision = second.graph_state.revision_history("n0")[-1]
+    assert revision.action == "update_metadata"
+    assert revision.changes_made["query_context"] == [QUERY, FOLLOW_UP]
+    assert second.graph_state.graph_metadata["query"] == FOLLOW_UP
+    assert [entry["stage_name"] for entry in second.stage_outputs_trace][:3] == [
+        "InitializationStage",
+        "DecompositionStage",
+        "HypothesisStage",
+    ]
+    assert "Reused" in second.stage_outputs_trace[1]["summary"]
+
+
+def test_sessions_resume_from_the_disk_tier(processor, settings, tmp_path):
+    first = asyncio.run(processor.process_query(QUERY, session_id="s"))
+    for other in ("a", "b"):  # Evict "s" from the two-session memory tier
+        asyncio.run(processor.process_query(QUERY, session_id=other))
+    assert "s" in processor.session_store
+
+    reloaded = GoTProcessor(settings, session_store=SessionStore(2, str(tmp_path)))
+    stored = reloaded.session_store.get("s")
+    assert stored.turn == 1
+    assert set(stored.graph_state.nodes) == set(first.graph_state.nodes)
+
+    third = asyncio.run(reloaded.process_query(FOLLOW_UP, session_id="s"))
+    assert third.turn == 2 and set(first.graph_state.nodes) < set(third.graph_state.nodes)
+    assert reloaded.session_store.delete("s") and "s" not in reloaded.session_store
+
+
+def test_disk_tier_writes_off_the_event_loop_and_closes_connections(tmp_path, monkeypatch):
+    connections = []
+    connect = session_store.sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        connections.append((threading.current_thread(), conn))
+        return conn
+
+    monkeypatch.setattr(session_store.sqlite3, "connect", tracking_connect)
+    store = SessionStore(2, str(tmp_path))
+    session = GoTProcessorSessionData(session_id="s", query=QUERY)
+    asyncio.run(store.put(session))
+    assert store.delete("s") is True
+
+    threads = [thread for thread, _ in connections]
+    assert threads[1] is not threading.main_thread()  # The put()
+    for _, conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):  # Closed
+            conn.execute("SELECT 1")
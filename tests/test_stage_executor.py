@@ -0,0 +1,109 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from src.asr_got_reimagined.api.graph_response import build_graph_delta_schema
+from src.asr_got_reimagined.domain.models import Node, NodeType
+from src.asr_got_reimagined.domain.services import GoTProcessor
+from src.asr_got_reimagined.domain.services.stage_executor import StageExecutor
+from src.asr_got_reimagined.domain.stages import (
+    BaseStage,
+    GraphAccess,
+    InitializationStage,
+    StageOutput,
+)
+
+
+class WorkerStage(BaseStage):
+    """Adds a node and reports where it ran."""
+
+    stage_name = "WorkerStage"
+    requires = ("InitializationStage",)
+    run_in_executor = True
+
+    async def execute(self, graph, current_session_data):  # noqa: ARG002
+        graph.add_node(Node(id="worker", label="added by worker", type=NodeType.EVIDENCE))
+        return StageOutput(
+            summary="ran",
+            next_stage_context_update={
+                self.stage_name: {
+                    "pid": os.getpid(),
+                    "thread": threading.current_thread().name,
+                }
+            },
+        )
+
+
+class ReadingWorkerStage(WorkerStage):
+    stage_name = "ReadingWorkerStage"
+    graph_access = GraphAccess.READ  # Its change to the worker's graph is dropped
+
+
+def run_query(settings, kind, stage_name):
+    settings.asr_got.executor.kind = kind
+    settings.asr_got.pipeline = ["InitializationStage", f"tests.test_stage_executor:{stage_name}"]
+    processor = GoTProcessor(settings)
+
+    async def run():
+        try:
+            return await processor.process_query("Where does the stage run?")
+        finally:
+            await processor.shutdown_resources()
+
+    result = asyncio.run(run())
+    return result, result.accumulated_context[stage_name]
+
+
+def test_offloads_only_with_a_pool(settings):
+    settings.asr_got.executor.offload_stages = ["InitializationStage"]
+    settings.asr_got.executor.kind = "none"
+    assert not StageExecutor(settings).offloads(InitializationStage(settings))
+    settings.asr_got.executor.kind = "thread"
+    executor = StageExecutor(settings)
+    assert executor.offloads(InitializationStage(settings))
+    assert executor.offloads(WorkerStage(settings))
+
+
+def test_thread_worker_changes_the_live_graph(settings):
+    result, ran = run_query(settings, "thread", "WorkerStage")
+    assert ran["thread"].startswith("stage-worker")
+    assert ran["pid"] == os.getpid()
+    assert result.graph_state.get_node("worker") is not None
+
+
+@pytest.mark.parametrize(
+    ("stage_name", "graph_returned"),
+    [("WorkerStage", True), ("ReadingWorkerStage", False)],
+)
+def test_process_worker_returns_the_graph_of_writers_only(settings, stage_name, graph_returned):
+    result, ran = run_query(settings, "process", stage_name)
+    graph = result.graph_state
+
+    assert ran["pid"] != os.getpid()
+    assert (graph.get_node("worker") is not None) is graph_returned
+    assert graph.get_node("n0") is not None
+    assert graph.revision_policy is not None
+
+
+def test_process_worker_keeps_the_graph_journal(settings):
+    settings.asr_got.executor.kind = "process"
+    settings.asr_got.pipeline = ["InitializationStage", "tests.test_stage_executor:WorkerStage"]
+    processor = GoTProcessor(settings)
+
+    async def run():
+        try:
+            first = await processor.process_query("First turn?", session_id="s")
+            since = (first.graph_state.id, first.graph_state.version)
+            second = await processor.process_query("Second turn?", session_id="s")
+            return since, second.graph_state
+        finally:
+            await processor.shutdown_resources()
+
+    (since_graph_id, since_version), graph = asyncio.run(run())
+    delta = build_graph_delta_schema(graph, since_version, since_graph_id=since_graph_id)
+
+    assert delta is not None and delta.version == graph.version > since_version
+    assert {"n0", "worker"} <= {node.node_id for node in delta.nodes}
+    assert graph.changes_since(0) is not None  # The first turn's history too
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from src.asr_got_reimagined.domain.services import GoTProcessor
+from src.asr_got_reimagined.domain.stages import (
+    DEFAULT_PIPELINE,
+    BaseStage,
+    DecompositionStage,
+    GraphAccess,
+    StageOutput,
+    build_pipeline,
+    get_stage_class,
+    register_stage,
+    registry,
+)
+
+
+class EchoStage(BaseStage):
+    stage_name = "EchoStage"
+    requires = ()
+    graph_access = GraphAccess.NONE
+
+    async def execute(self, graph, current_session_data):  # noqa: ARG002
+        return StageOutput(
+            summary="echo",
+            next_stage_context_update={self.stage_name: {"stage_object": id(self)}},
+        )
+
+
+def test_default_pipeline(settings):
+    settings.asr_got.pipeline = []
+    assert [stage.stage_name for stage in build_pipeline(settings)] == list(DEFAULT_PIPELINE)
+
+
+def test_pipeline_entries_by_name_and_import_path(settings):
+    pipeline = build_pipeline(
+        settings,
+        [
+            "InitializationStage",
+            "src.asr_got_reimagined.domain.stages.stage_2_decomposition:DecompositionStage",
+            "tests.test_stage_registry:EchoStage",
+        ],
+    )
+    assert isinstance(pipeline[1], DecompositionStage)
+    assert isinstance(pipeline[2], EchoStage)
+
+
+@pytest.mark.parametrize("name", ["Nope", "json:dumps", "json:NoSuchClass"])
+def test_unknown_stages_are_rejected(name):
+    with pytest.raises(ValueError):
+        get_stage_class(name)
+
+
+def test_register_stage(monkeypatch):
+    monkeypatch.setattr(registry, "_REGISTRY", dict(registry._REGISTRY))
+    assert register_stage(EchoStage) is EchoStage
+    register_stage(EchoStage, name="Echo2")
+    assert get_stage_class("EchoStage") is get_stage_class("Echo2") is EchoStage
+
+
+def test_processor_reuses_stage_objects_across_queries(settings):
+    settings.asr_got.pipeline = ["tests.test_stage_registry:EchoStage"]
+    processor = GoTProcessor(settings)
+
+    first = asyncio.run(processor.process_query("first"))
+    second = asyncio.run(processor.process_query("second"))
+
+    used = {
+        result.accumulated_context["EchoStage"]["stage_object"] for result in (first, second)
+    }
+    assert used == {id(processor.stages[0])}
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from src.asr_got_reimagined.domain.models import ASRGoTGraph
+from src.asr_got_reimagined.domain.models.common_types import GoTProcessorSessionData
+from src.asr_got_reimagined.domain.services import GoTProcessor
+from src.asr_got_reimagined.domain.services.stage_scheduler import (
+    StageScheduler,
+    plan_dependencies,
+)
+from src.asr_got_reimagined.domain.stages import (
+    BaseStage,
+    GraphAccess,
+    ReflectionStage,
+    StageOutput,
+    build_pipeline,
+)
+
+
+class SlowReaderStage(BaseStage):
+    """Reads the graph for a while; two of them can run side by side."""
+
+    stage_name = "SlowReaderStage"
+    requires = ("InitializationStage",)
+    graph_access = GraphAccess.READ
+
+    async def execute(self, graph, current_session_data):  # noqa: ARG002
+        await asyncio.sleep(0.05)
+        return StageOutput(summary=f"{len(graph.nodes)} nodes")
+
+
+class OtherSlowReaderStage(SlowReaderStage):
+    stage_name = "OtherSlowReaderStage"
+
+
+def test_default_pipeline_is_sequential(settings):
+    settings.asr_got.pipeline = []
+    dependencies = plan_dependencies(build_pipeline(settings))
+    assert dependencies == [(), *((i,) for i in range(7))]
+
+
+def test_graph_readers_overlap_after_the_writer(settings):
+    settings.asr_got.pipeline = [
+        "InitializationStage",
+        "tests.test_stage_scheduler:SlowReaderStage",
+        "tests.test_stage_scheduler:OtherSlowReaderStage",
+    ]
+    processor = GoTProcessor(settings)
+    assert processor.scheduler.dependencies == [(), (0,), (0,)]
+
+    result = asyncio.run(processor.process_query("What limits reader overlap?"))
+
+    init, first, second = result.stage_outputs_trace
+    assert first["depends_on"] == second["depends_on"] == ["InitializationStage"]
+    assert first["started_ms"] >= init["finished_ms"]
+    assert second["started_ms"] < first["finished_ms"]
+    assert first["started_ms"] < second["finished_ms"]
+
+
+def test_writer_waits_for_earlier_readers(settings):
+    stages = build_pipeline(
+        settings,
+        [
+            "InitializationStage",
+            "tests.test_stage_scheduler:SlowReaderStage",
+            "tests.test_stage_scheduler:OtherSlowReaderStage",
+            "PruningMergingStage",
+        ],
+    )
+    assert plan_dependencies(stages)[3] == (1, 2)
+
+
+def test_halt_skips_later_stages(settings):
+    scheduler = StageScheduler(build_pipeline(settings, ["InitializationStage"] * 3))
+    started = []
+
+    async def run_stage(index, stage):  # noqa: ARG001
+        started.append(index)
+        return index != 0
+
+    timings = asyncio.run(scheduler.run(run_stage))
+
+    assert started == [0] and list(timings) == [0]
+    assert scheduler.critical_path(timings) == [0]
+
+
+def test_reflection_lets_cancellation_through_its_audit_checks(settings, monkeypatch):
+    async def cancelled(graph):  # noqa: ARG001
+        raise asyncio.CancelledError
+
+    stage = ReflectionStage(settings)
+    monkeypatch.setattr(stage, "_check_bias_flags_assessment", cancelled)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(stage.execute(ASRGoTGraph(), GoTProcessorSessionData(query="q")))
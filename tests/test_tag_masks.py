@@ -0,0 +1,57 @@
+import pytest
+
+from src.asr_got_reimagined.domain.models import (
+    NodeMetadata,
+    NodeType,
+)
+from src.asr_got_reimagined.domain.models.vocabulary import Vocabulary
+
+
+@pytest.fixture
+def graph(make_graph):
+    return make_graph(
+        {
+            "a": {"metadata": NodeMetadata(disciplinary_tags={"bio", "chem"}, layer_id="L1")},
+            "b": {
+                "type": NodeType.EVIDENCE,
+                "metadata": NodeMetadata(disciplinary_tags={"phys"}, layer_id="L2"),
+            },
+        }
+    )
+
+
+def test_vocabulary_masks_round_trip():
+    vocabulary = Vocabulary()
+    mask = vocabulary.mask(["x", "y", "x"])
+
+    assert len(vocabulary) == 2
+    assert vocabulary.strings(mask) == {"x", "y"}
+    assert vocabulary.query_mask(["y", "never-stored"]) == 1 << vocabulary.id_of("y")
+    assert "never-stored" not in vocabulary
+
+
+def test_tag_masks_follow_tag_changes(graph):
+    assert not graph.nodes_share_tag("a", "b")
+
+    graph.add_node_tags("b", ["chem"])
+
+    assert graph.nodes_share_tag("a", "b")
+    assert graph.tags_from_mask(graph.node_tag_mask("b")) == {"phys", "chem"}
+    assert graph.tag_mask(["nope"]) == 0
+    assert graph.tag_mask(["bio"]) & graph.node_tag_mask("a")
+
+
+def test_layer_masks(graph):
+    assert graph.layer_mask(["L2"]) == graph.node_layer_mask("b")
+    assert not graph.layer_mask(["L1"]) & graph.node_layer_mask("b")
+    assert graph.layer_mask(["no-such-layer"]) == 0
+
+
+def test_snapshot_keeps_its_masks(graph):
+    snapshot = graph.snapshot()
+    graph.add_node_tags("b", ["chem"])
+    graph.remove_node("a")
+
+    assert not snapshot.nodes_share_tag("a", "b")
+    assert snapshot.tags_from_mask(snapshot.node_tag_mask("a")) == {"bio", "chem"}
+    assert graph.node_tag_mask("a") == 0